@@ -7,18 +7,535 @@ Audio Processor - Logika enkripsi dan dekripsi audio
 
 import numpy as np
 import scipy.io.wavfile as wav
-import pygame
-import json
+import functools
 import time
 import os
-from scipy import signal
+import struct
+import threading
+import warnings
+from collections import OrderedDict
+from numpy.lib.stride_tricks import sliding_window_view
+
+from metadata_store import encode_metadata, read_metadata, write_metadata
+
+# Cara penyimpanan metadata: file .metadata terpisah, chunk RIFF di dalam
+# file WAV, atau keduanya
+METADATA_STORAGE = ("sidecar", "embedded", "both")
+
+# ID chunk RIFF untuk metadata yang disematkan di file WAV
+METADATA_CHUNK_ID = b'scmd'
+
+# Panjang pesan maksimum yang metadatanya otomatis memuat kode karakter
+# asli dan ter-shift (original_chars/shifted_chars) untuk debugging
+DEBUG_CHARS_LIMIT = 1 << 16
+
+# Jumlah sampel maksimum per blok sintesis nada
+SYNTH_BLOCK_SAMPLES = 1 << 18
+
+# Jumlah sampel per blok saat mengonversi dan menulis file WAV
+SAVE_BLOCK_SAMPLES = 1 << 16
+
+# Jumlah sampel per potongan saat menghitung energi frame
+FRAME_CHUNK_SAMPLES = 1 << 20
+
+# Jumlah sampel maksimum per batch analisis frekuensi segmen
+ANALYSIS_BLOCK_SAMPLES = 1 << 21
+
+# Jumlah sampel per blok basis bank Goertzel; segmen yang lebih panjang
+# diproses per blok dengan rotasi fase
+SYMBOL_BASIS_SAMPLES = 1 << 13
+
+@functools.lru_cache(maxsize=32)
+def _analysis_plan(nperseg, sample_rate):
+    """
+    Jendela Hann, frekuensi bin, dan mask rentang 200-1000 Hz untuk panjang
+    segmen tertentu; dihitung sekali per panjang
+    """
+    from scipy import signal  # Impor berat, hanya saat analisis pertama
+    window = signal.get_window('hann', nperseg)
+    freqs = np.fft.rfftfreq(nperseg, d=1/sample_rate)
+    freq_mask = (freqs >= 200) & (freqs <= 1000)
+    return window, freqs, freq_mask
+
+@functools.lru_cache(maxsize=4)
+def _symbol_basis(sample_rate, base_freq, freq_range):
+    """
+    Basis bank Goertzel untuk 256 frekuensi simbol FSAE: kolom kosinus dan
+    sinus (float32) berukuran (SYMBOL_BASIS_SAMPLES, 512) tanpa jendela,
+    sehingga dapat dipakai bersama oleh semua panjang segmen
+    """
+    candidates = base_freq + (np.arange(256) / 256) * freq_range
+    phase = np.outer(np.arange(SYMBOL_BASIS_SAMPLES) * (2 * np.pi / sample_rate), candidates)
+    basis = np.empty((SYMBOL_BASIS_SAMPLES, 512), dtype=np.float32)
+    basis[:, :256] = np.cos(phase)
+    basis[:, 256:] = np.sin(phase)
+    basis.flags.writeable = False
+    return basis, candidates * (2 * np.pi / sample_rate)
+
+class OperationCancelled(Exception):
+    """
+    Dilempar oleh progress_callback untuk menghentikan enkripsi/dekripsi
+    """
+
+class ByteBudgetCache:
+    """
+    Cache LRU dengan batas total ukuran dalam byte
+    
+    Entri yang paling lama tidak dipakai dibuang lebih dulu saat ukuran total
+    melebihi max_bytes. Aman dipakai dari beberapa thread. Setiap entri yang
+    keluar dari cache (dibuang, diganti, atau dikosongkan) diteruskan ke
+    _evicted() setelah kunci dilepas.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def _sizeof(self, value):
+        """
+        Ukuran entri dalam byte
+        """
+        return value.nbytes
+    
+    def _evicted(self, value):
+        """
+        Dipanggil untuk entri yang keluar dari cache; subclass dapat
+        melepaskan sumber daya entri di sini
+        """
+    
+    def get(self, key):
+        """
+        Mengambil entri dari cache, atau None jika tidak ada
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """
+        Menyimpan entri ke cache dan membuang entri lama jika penuh
+        """
+        removed = []
+        with self._lock:
+            if key in self._entries:
+                previous = self._entries.pop(key)
+                self._bytes -= self._sizeof(previous)
+                if previous is not value:
+                    removed.append(previous)
+            self._entries[key] = value
+            self._bytes += self._sizeof(value)
+            
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._sizeof(evicted)
+                self.evictions += 1
+                removed.append(evicted)
+        
+        for evicted in removed:
+            self._evicted(evicted)
+    
+    def clear(self):
+        """
+        Mengosongkan cache dan mereset penghitung
+        """
+        with self._lock:
+            removed = list(self._entries.values())
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+        
+        for evicted in removed:
+            self._evicted(evicted)
+    
+    def stats(self):
+        """
+        Statistik cache: hit, miss, eviction, jumlah entri, dan ukuran byte
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            }
+
+class ToneCache(ByteBudgetCache):
+    """
+    Cache LRU untuk nada yang sudah dirender (termasuk fade in/out)
+    
+    Kunci cache adalah (frequency, duration, amplitude, sample_rate, dtype).
+    """
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        super().__init__(max_bytes)
+    
+    def put(self, key, tone):
+        """
+        Menyimpan nada ke cache sebagai array read-only
+        """
+        tone.flags.writeable = False
+        super().put(key, tone)
+
+# Cache nada bersama untuk seluruh proses, dipakai ulang antar pemanggilan
+# encrypt_to_audio selama parameternya sama
+TONE_CACHE = ToneCache()
+
+def _save_metadata_files(file_path, metadata):
+    """
+    Menyimpan metadata ke file .metadata (format biner, lihat
+    metadata_store) dan ringkasan ke file .info.txt
+    """
+    # Simpan metadata dalam file terpisah
+    metadata_file = file_path + ".metadata"
+    try:
+        write_metadata(metadata_file, metadata)
+        print(f"Metadata berhasil disimpan ke {metadata_file}")
+    except Exception as e:
+        print(f"Error saat menyimpan metadata: {str(e)}")
+        
+    # Simpan juga sebagai file teks biasa untuk backup
+    text_file = file_path + ".info.txt"
+    try:
+        with open(text_file, 'w') as f:
+            f.write(f"SonicCipher Encrypted Audio\n")
+            f.write(f"Encrypted on: {metadata.get('encryption_date', 'Unknown')}\n")
+            f.write(f"Algorithm: {metadata.get('algorithm', 'FSAE Standard')}\n")
+            f.write(f"Base Frequency: {metadata.get('base_freq', 220)} Hz\n")
+            f.write(f"Frequency Range: {metadata.get('freq_range', 660)} Hz\n")
+            f.write(f"Character Count: {metadata.get('char_count', 0)}\n")
+            
+            if 'frequencies' in metadata:
+                f.write(f"Frequencies: {', '.join([f'{freq:.2f}' for freq in metadata['frequencies'][:10]])}")
+                if len(metadata['frequencies']) > 10:
+                    f.write(f"... (and {len(metadata['frequencies']) - 10} more)")
+                f.write("\n")
+    except Exception as e:
+        print(f"Error saat menyimpan info file: {str(e)}")
+
+class WavStreamWriter:
+    """
+    Penulis file WAV 16-bit mono secara bertahap
+    
+    Blok PCM ditulis langsung ke disk saat diterima, ke file sementara
+    `<file_path>.tmp` yang baru menggantikan file tujuan saat close(); file
+    lama yang masih dipetakan (mmap, mis. LazyAudio di cache) tetap utuh.
+    Ukuran chunk RIFF dan data di header diperbarui saat close(). Metadata
+    disusun dari ringkasan per blok lalu disimpan di akhir sesuai
+    `metadata_storage`: sebagai file .metadata, sebagai chunk 'scmd' setelah
+    chunk data (penulisan yang sama dengan audionya), atau keduanya.
+    """
+    HEADER_SIZE = 44
+    MAX_DATA_BYTES = 0xFFFFFFFF - (HEADER_SIZE - 8)
+    
+    def __init__(self, file_path, sample_rate, metadata=None, metadata_storage="sidecar"):
+        if metadata_storage not in METADATA_STORAGE:
+            raise ValueError(f"Penyimpanan metadata tidak dikenal: {metadata_storage}")
+        
+        self.file_path = file_path
+        self.sample_rate = sample_rate
+        self.metadata = metadata
+        self.metadata_storage = metadata_storage
+        self.data_bytes = 0
+        self.extra_bytes = 0
+        self._temp_path = file_path + '.tmp'
+        self._file = open(self._temp_path, 'wb')
+        self._file.write(self._header())
+    
+    def _header(self):
+        """
+        Header RIFF/WAVE untuk PCM 16-bit mono dengan ukuran data saat ini
+        """
+        return (b'RIFF' + struct.pack('<I', self.HEADER_SIZE - 8 + self.data_bytes + self.extra_bytes) + b'WAVE'
+                + b'fmt ' + struct.pack('<IHHIIHH', 16, 1, 1, self.sample_rate, self.sample_rate * 2, 2, 16)
+                + b'data' + struct.pack('<I', self.data_bytes))
+    
+    def write(self, block, summary=None):
+        """
+        Menulis satu blok PCM (int16, atau float dalam range -1.0 hingga 1.0)
+        
+        `summary` adalah ringkasan metadata blok ini: nilai list ditambahkan
+        ke list metadata yang ada, 'char_count' dijumlahkan, nilai lain ditimpa.
+        """
+        block = np.asarray(block)
+        if block.dtype != np.int16:
+            # Normalisasi audio ke range 16-bit
+            block = np.int16(block * 32767)
+        
+        if self.data_bytes + block.nbytes > self.MAX_DATA_BYTES:
+            raise ValueError("Ukuran data melebihi batas file WAV (4 GB)")
+        
+        self._file.write(block.astype('<i2', copy=False).tobytes())
+        self.data_bytes += block.nbytes
+        
+        if summary:
+            self._merge_summary(summary)
+    
+    def _merge_summary(self, summary):
+        if self.metadata is None:
+            self.metadata = {}
+        for key, value in summary.items():
+            if isinstance(value, list):
+                self.metadata.setdefault(key, []).extend(value)
+            elif key == 'char_count':
+                self.metadata[key] = self.metadata.get(key, 0) + value
+            else:
+                self.metadata[key] = value
+    
+    def close(self):
+        """
+        Memperbarui ukuran di header, menutup file, memindahkannya ke path
+        tujuan, dan menyimpan metadata
+        """
+        if self._file is None:
+            return
+        
+        try:
+            sidecar = self._finish()
+        except BaseException:
+            self.abort()
+            raise
+        
+        if sidecar:
+            _save_metadata_files(self.file_path, self.metadata)
+    
+    def _finish(self):
+        """
+        Menulis chunk metadata dan header akhir lalu memindahkan file
+        sementara ke path tujuan
+        
+        Returns:
+            bool: True jika metadata perlu disimpan sebagai file .metadata
+        """
+        sidecar = self.metadata is not None and self.metadata_storage != "embedded"
+        if self.metadata is not None and self.metadata_storage != "sidecar":
+            chunk = encode_metadata(self.metadata)
+            if self.HEADER_SIZE - 8 + self.data_bytes + 8 + len(chunk) > 0xFFFFFFFF:
+                print("Metadata tidak muat di file WAV, disimpan sebagai file .metadata")
+                sidecar = True
+            else:
+                # Chunk data selalu berukuran genap (sampel 16-bit), jadi
+                # chunk metadata langsung menyusul tanpa byte pengisi
+                self._file.write(METADATA_CHUNK_ID + struct.pack('<I', len(chunk)) + chunk)
+                self.extra_bytes = 8 + len(chunk)
+        
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+        self._file = None
+        os.replace(self._temp_path, self.file_path)
+        return sidecar
+    
+    def abort(self):
+        """
+        Membatalkan penulisan: file sementara dihapus dan file tujuan (jika
+        sudah ada) tidak berubah
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Saat terjadi error (mis. OperationCancelled) file setengah jadi
+        # tidak dipindahkan ke path tujuan
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def _find_riff_chunk(file_path, chunk_id):
+    """
+    Mencari chunk RIFF di file WAV tanpa membaca isi chunk lain
+    
+    Hanya header chunk (8 byte) yang dibaca; isi chunk, termasuk data PCM,
+    dilompati dengan seek.
+    
+    Returns:
+        tuple atau None: (offset isi chunk, ukuran isi chunk)
+    """
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:] != b'WAVE':
+            return None
+        
+        end = min(12 + struct.unpack('<I', header[4:8])[0] - 4, os.fstat(f.fileno()).st_size)
+        position = 12
+        while position + 8 <= end:
+            f.seek(position)
+            current_id, size = struct.unpack('<4sI', f.read(8))
+            if current_id == chunk_id:
+                return position + 8, size
+            # Isi chunk berukuran ganjil diikuti satu byte pengisi
+            position += 8 + size + (size & 1)
+    return None
+
+def _read_wav(file_path, mmap=False):
+    """
+    scipy wav.read tanpa peringatan untuk chunk metadata 'scmd'
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', wav.WavFileWarning)
+        return wav.read(file_path, mmap=mmap)
+
+class LazyAudio:
+    """
+    Tampilan audio ter-normalisasi (default float32) di atas sampel mentah
+    file WAV
+    
+    Sampel mentah biasanya berupa np.memmap, sehingga membuka file besar
+    hampir instan. Normalisasi ke range -1.0 hingga 1.0 hanya dilakukan pada
+    potongan yang diakses; np.asarray() atau to_array() menghasilkan array
+    penuh bagi pemanggil yang membutuhkannya.
+    """
+    
+    def __init__(self, raw, dtype=np.float32):
+        self.raw = raw
+        self.dtype = np.dtype(dtype)
+    
+    @property
+    def shape(self):
+        return self.raw.shape
+    
+    @property
+    def ndim(self):
+        return self.raw.ndim
+    
+    @property
+    def size(self):
+        return self.raw.size
+    
+    def __len__(self):
+        return len(self.raw)
+    
+    def __getitem__(self, index):
+        return self._normalize(self.raw[index])
+    
+    def __array__(self, dtype=None, copy=None):
+        data = self.to_array()
+        return data if dtype is None else data.astype(dtype, copy=False)
+    
+    def _normalize(self, samples):
+        # Sama dengan normalisasi pada load_audio
+        return np.asarray(samples).astype(self.dtype) / 32767.0
+    
+    def to_array(self):
+        """
+        Mengembalikan seluruh audio sebagai array (dtype kerja)
+        """
+        return self._normalize(self.raw)
+    
+    def blocks(self, block_size=SAVE_BLOCK_SAMPLES):
+        """
+        Iterasi audio ter-normalisasi per blok
+        """
+        for start in range(0, len(self.raw), block_size):
+            yield self[start:start + block_size]
+
+class AudioAssetCache(ByteBudgetCache):
+    """
+    Cache audio yang sudah dimuat dari file, dipakai bersama oleh UI
+    
+    Kunci cache adalah path file beserta mtime dan ukurannya (juga untuk
+    file .metadata), sehingga file yang berubah otomatis dimuat ulang. Audio
+    yang muat dalam anggaran disimpan sebagai array read-only; file
+    yang terlalu besar disimpan sebagai LazyAudio yang hampir tidak memakai
+    memori.
+    """
+    def __init__(self, audio_processor, max_bytes=512 * 1024 * 1024):
+        super().__init__(max_bytes)
+        self.audio_processor = audio_processor
+    
+    def _sizeof(self, value):
+        audio_data = value[0]
+        return audio_data.nbytes if isinstance(audio_data, np.ndarray) else 0
+    
+    def _key(self, file_path):
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        
+        metadata_file = file_path + ".metadata"
+        metadata_stat = os.stat(metadata_file) if os.path.exists(metadata_file) else None
+        metadata_key = (metadata_stat.st_mtime_ns, metadata_stat.st_size) if metadata_stat else None
+        
+        return (file_path, stat.st_mtime_ns, stat.st_size, metadata_key)
+    
+    def load(self, file_path):
+        """
+        Memuat audio seperti AudioProcessor.load_audio, memakai cache jika ada
+        
+        Returns:
+            tuple: (audio_data, sample_rate, metadata)
+        """
+        key = self._key(file_path)
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+        
+        audio_data, sample_rate, metadata = self.audio_processor.load_audio(file_path, lazy=True)
+        if audio_data.size * audio_data.dtype.itemsize <= self.max_bytes // 2:
+            audio_data = audio_data.to_array()
+            audio_data.flags.writeable = False
+        
+        # Array metadata kecil disalin ke memori agar entri cache tidak
+        # bergantung pada file .metadata yang mungkin ditimpa
+        if metadata is not None:
+            metadata = {key: np.array(value) if isinstance(value, np.ndarray) else value
+                        for key, value in metadata.items()}
+        
+        entry = (audio_data, sample_rate, metadata)
+        self.put(key, entry)
+        return entry
 
 class AudioProcessor:
-    def __init__(self):
-        pygame.mixer.init(frequency=44100, size=-16, channels=1)
+    def __init__(self, tone_cache=TONE_CACHE, playback=None, dtype=np.float32):
+        """
+        Args:
+            tone_cache (ToneCache): Cache nada; None untuk selalu mensintesis ulang
+            playback: Backend pemutaran (mis. PygamePlayback); jika None,
+                PygamePlayback dibuat saat play_audio pertama kali dipanggil
+            dtype: Tipe float kerja untuk sinyal audio (sintesis, audio yang
+                dimuat, dan analisis); float32 memakai separuh memori float64
+        """
         self.sample_rate = 44100  # Hz
+        
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != 'f':
+            raise ValueError(f"dtype kerja harus bertipe float: {self.dtype}")
+        
+        # Cache nada yang sudah dirender; None untuk selalu mensintesis ulang
+        self.tone_cache = tone_cache
+        
+        # Perangkat audio tidak disentuh sampai benar-benar dibutuhkan
+        self._playback = playback
+        self._playback_lock = threading.Lock()
+    
+    @property
+    def playback(self):
+        """
+        Backend pemutaran, dibuat saat pertama kali diakses
+        """
+        if self._playback is None:
+            with self._playback_lock:
+                if self._playback is None:
+                    from playback import PygamePlayback
+                    self._playback = PygamePlayback(self.sample_rate)
+        return self._playback
     
-    def encrypt_to_audio(self, text, key, base_freq=220, base_duration=0.1, algorithm="FSAE Standard"):
+    def encrypt_to_audio(self, text, key, base_freq=220, base_duration=0.1, algorithm="FSAE Standard",
+                         progress_callback=None, debug_chars=None):
         """
         Enkripsi teks menjadi audio menggunakan algoritma FSAE
         
@@ -28,63 +545,30 @@ class AudioProcessor:
             base_freq (float): Frekuensi dasar dalam Hz
             base_duration (float): Durasi dasar dalam detik
             algorithm (str): Algoritma enkripsi yang digunakan
+            progress_callback (callable): Dipanggil dengan (karakter tersintesis,
+                total karakter) setiap blok; boleh melempar OperationCancelled
+            debug_chars (bool): Simpan original_chars dan shifted_chars di
+                metadata; default hanya untuk pesan hingga DEBUG_CHARS_LIMIT
+                karakter
             
         Returns:
             dict: Data audio terenkripsi dan metadata
         """
         # Metadata untuk membantu dekripsi
-        metadata = {
-            'algorithm': algorithm,
-            'base_freq': base_freq,
-            'base_duration': base_duration,
-            'freq_range': 660,  # Rentang frekuensi dari base_freq
-            'char_count': len(text),
-            'encryption_date': time.strftime("%Y-%m-%d %H:%M:%S"),
-            'version': '1.0.0'
-        }
+        metadata = self._build_metadata(algorithm, base_freq, base_duration, len(text))
         
         # Enkripsi teks menjadi frekuensi
-        frequencies = []
-        durations = []
-        amplitudes = []
-        
-        for i, char in enumerate(text):
-            # Dapatkan kode ASCII dan terapkan shift
-            char_code = ord(char)
-            shifted_code = (char_code + key) % 256
-            
-            # Petakan ke rentang frekuensi yang dapat didengar
-            frequency = base_freq + (shifted_code / 256) * metadata['freq_range']
-            
-            # Variasikan durasi berdasarkan algoritma
-            if algorithm == "FSAE Standard":
-                # Durasi tetap
-                duration = base_duration
-            elif algorithm == "FSAE Enhanced":
-                # Variasi durasi berdasarkan posisi
-                duration = base_duration + (i % 5) * 0.05
-            elif algorithm == "FSAE + AES":
-                # Simulasi AES dengan variasi kompleks
-                # Dalam implementasi nyata, ini akan menggunakan enkripsi AES sebenarnya
-                duration = base_duration + (((i * key) % 10) / 100)
-            else:
-                # Default
-                duration = base_duration
-            
-            # Variasikan amplitudo untuk algoritma enhanced
-            if algorithm in ["FSAE Enhanced", "FSAE + AES"]:
-                # Variasi amplitudo berdasarkan karakter
-                amplitude = 0.4 + (shifted_code % 50) / 100  # Range 0.4-0.9
-            else:
-                amplitude = 0.5  # Default
-            
-            frequencies.append(frequency)
-            durations.append(duration)
-            amplitudes.append(amplitude)
+        codes = self._char_codes(text)
+        frequencies, durations, amplitudes = self._map_characters(
+            codes, key, base_freq, base_duration, algorithm, metadata['freq_range']
+        )
         
         # Simpan karakter asli untuk verifikasi (khusus debugging)
-        metadata['original_chars'] = [ord(c) for c in text]
-        metadata['shifted_chars'] = [(ord(c) + key) % 256 for c in text]
+        if debug_chars is None:
+            debug_chars = len(codes) <= DEBUG_CHARS_LIMIT
+        if debug_chars:
+            metadata['original_chars'] = codes
+            metadata['shifted_chars'] = self._shift_codes(codes, key)
         
         # Simpan frekuensi dan durasi dalam metadata
         metadata['frequencies'] = frequencies
@@ -92,7 +576,7 @@ class AudioProcessor:
         metadata['amplitudes'] = amplitudes
         
         # Buat sinyal audio
-        audio_data = self._generate_audio_signal(frequencies, durations, amplitudes)
+        audio_data = self._generate_audio_signal(frequencies, durations, amplitudes, progress_callback)
         
         return {
             'audio': audio_data,
@@ -100,117 +584,433 @@ class AudioProcessor:
             'metadata': metadata
         }
     
-    def _generate_audio_signal(self, frequencies, durations, amplitudes=None):
+    def _build_metadata(self, algorithm, base_freq, base_duration, char_count):
+        """
+        Membuat bagian umum metadata enkripsi
+        """
+        return {
+            'algorithm': algorithm,
+            'base_freq': base_freq,
+            'base_duration': base_duration,
+            'freq_range': 660,  # Rentang frekuensi dari base_freq
+            'char_count': char_count,
+            'encryption_date': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'version': '1.0.0'
+        }
+    
+    def _char_codes(self, text):
+        """
+        Kode Unicode setiap karakter teks sebagai array uint32
+        
+        Sama dengan ord() per karakter, termasuk surrogate tunggal (mis. dari
+        teks yang didekode dengan surrogateescape)
+        """
+        return np.frombuffer(text.encode('utf-32-le', errors='surrogatepass'), dtype='<u4').astype(np.uint32)
+    
+    def _shift_codes(self, codes, key):
+        """
+        Kode karakter setelah shift kunci, (kode + key) % 256, sebagai uint8
+        """
+        return ((codes.astype(np.int64) + key) % 256).astype(np.uint8)
+    
+    def _map_characters(self, text, key, base_freq, base_duration, algorithm, freq_range=660, start_index=0):
+        """
+        Memetakan setiap karakter ke frekuensi, durasi, dan amplitudo nada
+        
+        `text` berupa str atau array kode karakter (lihat _char_codes).
+        `start_index` adalah posisi karakter pertama di dalam pesan, dipakai
+        oleh variasi durasi yang bergantung pada posisi. Semua nilai dihitung
+        dengan operasi array (float64), identik dengan rumus per karakter.
+        
+        Returns:
+            tuple: (frequencies, durations, amplitudes) sebagai array float64
+        """
+        codes = self._char_codes(text) if isinstance(text, str) else np.asarray(text)
+        
+        # Terapkan shift lalu petakan ke rentang frekuensi yang dapat didengar
+        shifted_codes = self._shift_codes(codes, key)
+        frequencies = base_freq + (shifted_codes / 256) * freq_range
+        
+        # Variasikan durasi berdasarkan algoritma
+        positions = np.arange(start_index, start_index + len(codes), dtype=np.int64)
+        if algorithm == "FSAE Enhanced":
+            # Variasi durasi berdasarkan posisi
+            durations = base_duration + (positions % 5) * 0.05
+        elif algorithm == "FSAE + AES":
+            # Simulasi AES dengan variasi kompleks
+            # Dalam implementasi nyata, ini akan menggunakan enkripsi AES sebenarnya
+            durations = base_duration + (((positions * key) % 10) / 100)
+        else:
+            # FSAE Standard dan default: durasi tetap
+            durations = np.full(len(codes), base_duration, dtype=np.float64)
+        
+        # Variasikan amplitudo untuk algoritma enhanced
+        if algorithm in ["FSAE Enhanced", "FSAE + AES"]:
+            # Variasi amplitudo berdasarkan karakter
+            amplitudes = 0.4 + (shifted_codes % 50) / 100  # Range 0.4-0.9
+        else:
+            amplitudes = np.full(len(codes), 0.5)  # Default
+        
+        return frequencies, durations, amplitudes
+    
+    def encrypt_to_audio_stream(self, text_iter, key, base_freq=220, base_duration=0.1,
+                                algorithm="FSAE Standard", block_size=65536, dtype=np.int16,
+                                summaries=False, debug_chars=False):
+        """
+        Enkripsi teks secara bertahap menjadi blok-blok PCM
+        
+        Teks dibaca potong demi potong dari `text_iter` dan setiap blok
+        `block_size` sampel langsung di-yield begitu nilainya final, sehingga
+        dapat segera ditulis ke file atau socket. Memori yang dipakai
+        sebanding dengan ukuran blok, bukan panjang pesan. Gabungan seluruh
+        blok identik dengan hasil encrypt_to_audio untuk teks yang sama.
+        
+        Args:
+            text_iter (iterable): Potongan-potongan teks (atau satu str)
+            key (int): Kunci enkripsi (1-25)
+            base_freq (float): Frekuensi dasar dalam Hz
+            base_duration (float): Durasi dasar dalam detik
+            algorithm (str): Algoritma enkripsi yang digunakan
+            block_size (int): Jumlah sampel per blok
+            dtype: np.int16 (seperti file WAV), np.float32, atau np.float64
+            summaries (bool): Jika True, yield pasangan (blok, ringkasan)
+            debug_chars (bool): Sertakan original_chars dan shifted_chars di
+                ringkasan; default tidak, karena panjang pesan belum diketahui
+            
+        Yields:
+            numpy.array: Blok PCM; hanya blok terakhir yang boleh lebih pendek.
+            Dengan summaries=True, ringkasan berisi metadata karakter yang
+            dipetakan sejak blok sebelumnya (ringkasan pertama juga memuat
+            metadata umum), siap digabung oleh WavStreamWriter.
+        """
+        if isinstance(text_iter, str):
+            text_iter = [text_iter]
+        
+        pending = np.zeros(0, dtype=self.dtype)  # Sampel yang sudah dirender tetapi belum di-yield
+        emitted = 0                # Jumlah sampel yang sudah di-yield
+        total_duration = 0.0       # Jumlah durasi, dijumlahkan berurutan seperti sum()
+        char_index = 0
+        
+        def new_summary(header=None):
+            summary = dict(header or {}, char_count=0)
+            for name in ('frequencies', 'durations', 'amplitudes'):
+                summary[name] = []
+            if debug_chars:
+                summary['original_chars'] = []
+                summary['shifted_chars'] = []
+            return summary
+        
+        def output(samples):
+            nonlocal summary
+            block = self._convert_pcm(samples, dtype)
+            if not summaries:
+                return block
+            block_summary, summary = summary, new_summary()
+            return block, block_summary
+        
+        summary = new_summary(self._build_metadata(algorithm, base_freq, base_duration, 0))
+        
+        for chunk in text_iter:
+            if not chunk:
+                continue
+            
+            codes = self._char_codes(chunk)
+            frequencies, durations, amplitudes = self._map_characters(
+                codes, key, base_freq, base_duration, algorithm, start_index=char_index
+            )
+            char_index += len(codes)
+            total_duration = np.cumsum(np.concatenate(([total_duration], durations)))[-1]
+            
+            if summaries:
+                summary['char_count'] += len(codes)
+                if debug_chars:
+                    summary['original_chars'].extend(codes.tolist())
+                    summary['shifted_chars'].extend(self._shift_codes(codes, key).tolist())
+                summary['frequencies'].extend(frequencies.tolist())
+                summary['durations'].extend(durations.tolist())
+                summary['amplitudes'].extend(amplitudes.tolist())
+            
+            lengths = self._tone_lengths(durations)
+            ends = np.cumsum(lengths)
+            
+            # Render per kelompok nada sekitar block_size sampel
+            i0 = 0
+            while i0 < len(lengths):
+                offset = ends[i0 - 1] if i0 > 0 else 0
+                i1 = max(int(np.searchsorted(ends, offset + block_size, side='right')), i0 + 1)
+                rendered = np.zeros(ends[i1 - 1] - offset, dtype=self.dtype)
+                self._render_into(rendered, frequencies[i0:i1], durations[i0:i1],
+                                  amplitudes[i0:i1], lengths[i0:i1])
+                pending = np.concatenate((pending, rendered))
+                i0 = i1
+                
+                # Sampel sebelum int(total_duration * sample_rate) pasti tidak terpotong
+                ready = min(int(total_duration * self.sample_rate) - emitted, len(pending))
+                while ready >= block_size:
+                    yield output(pending[:block_size])
+                    pending = pending[block_size:]
+                    emitted += block_size
+                    ready -= block_size
+        
+        # Potong atau tambahkan sampel hening agar panjangnya sama dengan encrypt_to_audio
+        remaining = int(total_duration * self.sample_rate) - emitted
+        if remaining > len(pending):
+            pending = np.concatenate((pending, np.zeros(remaining - len(pending), dtype=self.dtype)))
+        pending = pending[:max(remaining, 0)]
+        
+        for start in range(0, len(pending), block_size):
+            yield output(pending[start:start + block_size])
+        
+        if summaries and not len(pending) and (summary['char_count'] or not emitted):
+            # Ringkasan yang tersisa tanpa sampel audio
+            yield output(pending)
+    
+    def _convert_pcm(self, samples, dtype):
+        """
+        Mengonversi sampel float ke dtype PCM keluaran
+        """
+        if np.dtype(dtype) == np.int16:
+            # Normalisasi audio ke range 16-bit, sama seperti save_audio
+            return np.int16(samples * 32767)
+        return samples.astype(dtype)
+    
+    def _generate_audio_signal(self, frequencies, durations, amplitudes=None, progress_callback=None):
         """
         Menghasilkan sinyal audio dari frekuensi dan durasi
+        
+        Posisi, fase, dan envelope fade seluruh nada dihitung dengan operasi
+        array (float64) lalu ditulis langsung ke satu buffer keluaran bertipe
+        dtype kerja. Dengan dtype float64 hasilnya identik sampel demi sampel
+        dengan sintesis per karakter.
         """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        durations = np.asarray(durations, dtype=np.float64)
         if amplitudes is None:
-            amplitudes = [0.5] * len(frequencies)
+            amplitudes = np.full(len(frequencies), 0.5)
+        else:
+            amplitudes = np.asarray(amplitudes, dtype=np.float64)
+        
+        # cumsum menjumlahkan secara berurutan, sama seperti sum() bawaan Python
+        total_duration = np.cumsum(durations)[-1] if len(durations) > 0 else 0.0
+        total_samples = int(total_duration * self.sample_rate)
+        audio_signal = np.zeros(total_samples, dtype=self.dtype)
+        
+        self._render_into(audio_signal, frequencies, durations, amplitudes, progress_callback=progress_callback)
+        return audio_signal
+    
+    def _render_into(self, out, frequencies, durations, amplitudes, lengths=None, progress_callback=None):
+        """
+        Menulis nada-nada secara berurutan ke buffer `out` mulai dari sampel 0
+        """
+        if lengths is None:
+            lengths = self._tone_lengths(durations)
+        starts = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        
+        if self.tone_cache is not None:
+            self._render_cached_tones(out, starts, lengths, frequencies, durations, amplitudes, progress_callback)
+        else:
+            self._render_tones(out, starts, lengths, frequencies, amplitudes, progress_callback)
+        
+        if progress_callback:
+            progress_callback(len(lengths), len(lengths))
+    
+    def _tone_lengths(self, durations):
+        """
+        Menghitung jumlah sampel setiap nada, sama dengan panjang
+        np.arange(0, duration, 1/sample_rate)
+        """
+        step = 1 / self.sample_rate
+        lengths = np.ceil(np.asarray(durations, dtype=np.float64) / step)
+        return np.maximum(lengths, 0).astype(np.int64)
+    
+    def _render_tones(self, out, starts, lengths, frequencies, amplitudes, progress_callback=None):
+        """
+        Menulis nada-nada ke buffer `out` pada posisi sampel `starts`
+        
+        Nada diproses per blok sekitar SYNTH_BLOCK_SAMPLES sampel. Di dalam
+        blok, nada dengan panjang sama disintesis sekaligus sebagai array 2D
+        (nada x sampel). Sampel yang melewati panjang `out` dipotong.
+        """
+        omegas = 2 * np.pi * frequencies
+        ends = starts + lengths
+        
+        # Nada yang seluruhnya muat di buffer; paling banyak satu nada terpotong
+        n_inside = int(np.searchsorted(ends, len(out), side='right'))
+        
+        i0 = 0
+        while i0 < n_inside:
+            i1 = int(np.searchsorted(ends, starts[i0] + SYNTH_BLOCK_SAMPLES, side='right'))
+            i1 = min(max(i1, i0 + 1), n_inside)
+            
+            block_lengths = lengths[i0:i1]
+            for n in np.unique(block_lengths):
+                rows = i0 + np.flatnonzero(block_lengths == n)
+                tones = self._synthesize_tones(int(n), omegas[rows], amplitudes[rows])
+                
+                if rows[-1] - rows[0] + 1 == len(rows):
+                    # Nada berurutan: tulis langsung sebagai satu potongan
+                    out[starts[rows[0]]:ends[rows[-1]]] = tones.ravel()
+                else:
+                    out[starts[rows][:, None] + np.arange(n)] = tones
             
-        total_samples = int(sum(durations) * self.sample_rate)
-        audio_signal = np.zeros(total_samples)
+            i0 = i1
+            if progress_callback:
+                progress_callback(i1, len(lengths))
+        
+        if n_inside < len(lengths) and starts[n_inside] < len(out):
+            tone = self._synthesize_tones(int(lengths[n_inside]), omegas[n_inside:n_inside + 1],
+                                          amplitudes[n_inside:n_inside + 1])[0]
+            out[starts[n_inside]:] = tone[:len(out) - starts[n_inside]]
+    
+    def _render_cached_tones(self, out, starts, lengths, frequencies, durations, amplitudes, progress_callback=None):
+        """
+        Seperti _render_tones, tetapi setiap nada unik diambil dari tone cache
+        
+        Nada yang belum ada di cache disintesis secara batch lalu disimpan;
+        sinyal kemudian disusun dengan menyalin nada-nada dari cache.
+        """
+        keys = list(zip(frequencies.tolist(), durations.tolist(), amplitudes.tolist(),
+                        [self.sample_rate] * len(lengths), [self.dtype.str] * len(lengths)))
+        ends = starts + lengths
         
-        current_sample = 0
-        for freq, duration, amplitude in zip(frequencies, durations, amplitudes):
-            t = np.arange(0, duration, 1/self.sample_rate)
-            samples = amplitude * np.sin(2 * np.pi * freq * t)
+        i0 = 0
+        while i0 < len(lengths) and starts[i0] < len(out):
+            i1 = int(np.searchsorted(ends, starts[i0] + SYNTH_BLOCK_SAMPLES, side='right'))
+            i1 = max(i1, i0 + 1)
+            block_keys = keys[i0:i1]
             
-            # Tambahkan fade in/out untuk menghindari klik
-            fade_samples = min(int(0.01 * self.sample_rate), len(samples) // 4)
-            fade_in = np.linspace(0, 1, fade_samples)
-            fade_out = np.linspace(1, 0, fade_samples)
+            # Ambil nada unik di blok ini dari cache
+            tones = {}
+            missing = []
+            for index, key in enumerate(block_keys):
+                if key not in tones:
+                    tones[key] = self.tone_cache.get(key)
+                    if tones[key] is None:
+                        missing.append(i0 + index)
             
-            samples[:fade_samples] *= fade_in
-            samples[-fade_samples:] *= fade_out
+            # Sintesis nada yang belum ada di cache, dikelompokkan per panjang
+            if missing:
+                missing = np.array(missing)
+                for n in np.unique(lengths[missing]):
+                    rows = missing[lengths[missing] == n]
+                    rendered = self._synthesize_tones(int(n), 2 * np.pi * frequencies[rows], amplitudes[rows])
+                    for row, tone in zip(rows, rendered):
+                        tone = tone.astype(self.dtype)
+                        tones[keys[row]] = tone
+                        self.tone_cache.put(keys[row], tone)
             
-            # Tambahkan ke sinyal utama
-            end_sample = current_sample + len(samples)
-            if end_sample <= total_samples:
-                audio_signal[current_sample:end_sample] = samples
+            block_tones = [tones[key] for key in block_keys]
+            if ends[i1 - 1] <= len(out):
+                np.concatenate(block_tones, out=out[starts[i0]:ends[i1 - 1]])
             else:
-                audio_signal[current_sample:] = samples[:total_samples-current_sample]
+                block = np.concatenate(block_tones)
+                out[starts[i0]:] = block[:len(out) - starts[i0]]
             
-            current_sample = end_sample
+            i0 = i1
+            if progress_callback:
+                progress_callback(i1, len(lengths))
+    
+    def _synthesize_tones(self, n_samples, omegas, amplitudes):
+        """
+        Mensintesis beberapa nada dengan panjang sama sebagai array 2D
+        """
+        t = np.arange(n_samples) * (1 / self.sample_rate)
+        tones = np.multiply.outer(omegas, t)
+        np.sin(tones, out=tones)
+        tones *= amplitudes[:, None]
         
-        return audio_signal
+        # Tambahkan fade in/out untuk menghindari klik
+        fade_samples = min(int(0.01 * self.sample_rate), n_samples // 4)
+        if fade_samples > 0:
+            tones[:, :fade_samples] *= np.linspace(0, 1, fade_samples)
+            tones[:, -fade_samples:] *= np.linspace(1, 0, fade_samples)
+        
+        return tones
     
     def play_audio(self, audio_data, sample_rate):
         """
         Memutar data audio
         """
-        # Normalisasi audio ke range 16-bit
-        audio_data = np.int16(audio_data * 32767)
-        
-        # Buat file sementara
-        temp_file = "temp_audio.wav"
-        wav.write(temp_file, sample_rate, audio_data)
-        
-        # Putar audio
-        pygame.mixer.music.load(temp_file)
-        pygame.mixer.music.play()
+        self.playback.play(audio_data, sample_rate)
     
     def stop_audio(self):
         """
         Menghentikan pemutaran audio
         """
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.stop()
+        if self._playback is not None:
+            self._playback.stop()
     
-    def save_audio(self, file_path, audio_data, sample_rate, metadata):
+    def save_audio(self, file_path, audio_data, sample_rate, metadata, metadata_storage="sidecar"):
         """
         Menyimpan audio terenkripsi dan metadata ke file
+        
+        `metadata_storage` memilih tempat metadata (lihat METADATA_STORAGE):
+        "embedded" menyimpannya sebagai chunk di dalam file WAV sehingga hanya
+        satu file yang ditulis.
         """
-        # Normalisasi audio ke range 16-bit
-        audio_data = np.int16(audio_data * 32767)
+        # Konversi ke 16-bit per blok agar tidak ada salinan penuh kedua
+        with WavStreamWriter(file_path, sample_rate, metadata, metadata_storage) as writer:
+            for start in range(0, len(audio_data), SAVE_BLOCK_SAMPLES):
+                writer.write(audio_data[start:start + SAVE_BLOCK_SAMPLES])
+    
+    def save_audio_stream(self, file_path, blocks, sample_rate=None, metadata=None, metadata_storage="sidecar"):
+        """
+        Menyimpan blok-blok PCM ke file WAV secara bertahap
         
-        # Simpan audio
-        wav.write(file_path, sample_rate, audio_data)
+        `blocks` dapat berisi array PCM atau pasangan (blok, ringkasan) dari
+        encrypt_to_audio_stream(..., summaries=True); metadata disusun dari
+        ringkasan tersebut dan disimpan sesuai `metadata_storage`.
+        """
+        if sample_rate is None:
+            sample_rate = self.sample_rate
         
-        # Simpan metadata dalam file terpisah
-        metadata_file = file_path + ".metadata"
-        try:
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            print(f"Metadata berhasil disimpan ke {metadata_file}")
-        except Exception as e:
-            print(f"Error saat menyimpan metadata: {str(e)}")
-            
-        # Simpan juga sebagai file teks biasa untuk backup
-        text_file = file_path + ".info.txt"
-        try:
-            with open(text_file, 'w') as f:
-                f.write(f"SonicCipher Encrypted Audio\n")
-                f.write(f"Encrypted on: {metadata.get('encryption_date', 'Unknown')}\n")
-                f.write(f"Algorithm: {metadata.get('algorithm', 'FSAE Standard')}\n")
-                f.write(f"Base Frequency: {metadata.get('base_freq', 220)} Hz\n")
-                f.write(f"Frequency Range: {metadata.get('freq_range', 660)} Hz\n")
-                f.write(f"Character Count: {metadata.get('char_count', 0)}\n")
-                
-                if 'frequencies' in metadata:
-                    f.write(f"Frequencies: {', '.join([f'{freq:.2f}' for freq in metadata['frequencies'][:10]])}")
-                    if len(metadata['frequencies']) > 10:
-                        f.write(f"... (and {len(metadata['frequencies']) - 10} more)")
-                    f.write("\n")
-        except Exception as e:
-            print(f"Error saat menyimpan info file: {str(e)}")
+        with WavStreamWriter(file_path, sample_rate, metadata, metadata_storage) as writer:
+            for block in blocks:
+                if isinstance(block, tuple):
+                    writer.write(*block)
+                else:
+                    writer.write(block)
     
-    def load_audio(self, file_path):
+    def load_audio(self, file_path, lazy=False):
         """
         Memuat file audio dan metadata
-        """
-        # Baca file audio
-        sample_rate, audio_data = wav.read(file_path)
         
-        # Normalisasi ke range -1.0 hingga 1.0
-        audio_data = audio_data.astype(np.float32) / 32767.0
+        Dengan lazy=True, audio dikembalikan sebagai LazyAudio yang dipetakan
+        ke memori (mmap): file tidak dibaca seluruhnya dan normalisasi hanya
+        dilakukan pada bagian yang diakses. Array per karakter di metadata
+        biner juga dipetakan ke memori.
+        
+        Metadata yang disematkan di file WAV (chunk 'scmd') diutamakan; file
+        .metadata hanya dicari jika chunk tersebut tidak ada.
+        """
+        if lazy:
+            try:
+                sample_rate, raw = _read_wav(file_path, mmap=True)
+            except ValueError:
+                # Format yang tidak mendukung mmap (mis. 24-bit) dibaca biasa
+                sample_rate, raw = _read_wav(file_path)
+            audio_data = LazyAudio(raw, self.dtype)
+        else:
+            # Baca file audio
+            sample_rate, audio_data = _read_wav(file_path)
+            
+            # Normalisasi ke range -1.0 hingga 1.0
+            audio_data = audio_data.astype(self.dtype) / 32767.0
         
         # Coba baca metadata
         metadata = None
+        chunk = _find_riff_chunk(file_path, METADATA_CHUNK_ID)
         metadata_file = file_path + ".metadata"
-        if os.path.exists(metadata_file):
+        if chunk is not None:
             try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+                metadata = read_metadata(file_path, offset=chunk[0], mmap=lazy)
+                print(f"Metadata berhasil dimuat dari {file_path}")
+            except Exception as e:
+                print(f"Error saat memuat metadata: {str(e)}")
+        elif os.path.exists(metadata_file):
+            try:
+                metadata = read_metadata(metadata_file, mmap=lazy)
                 print(f"Metadata berhasil dimuat dari {metadata_file}")
             except Exception as e:
                 print(f"Error saat memuat metadata: {str(e)}")
@@ -219,7 +1019,8 @@ class AudioProcessor:
         
         return audio_data, sample_rate, metadata
     
-    def decrypt_from_audio(self, audio_data, sample_rate, key, tolerance=0.05, metadata=None):
+    def decrypt_from_audio(self, audio_data, sample_rate, key, tolerance=0.05, metadata=None, method="stft",
+                           progress_callback=None):
         """
         Mendekripsi audio kembali menjadi teks
         
@@ -229,16 +1030,46 @@ class AudioProcessor:
             key (int): Kunci dekripsi
             tolerance (float): Toleransi frekuensi (dalam persen)
             metadata (dict): Metadata dari enkripsi (opsional)
+            method (str): Mesin analisis audio tanpa metadata: "stft" (pencarian
+                puncak spektrum) atau "goertzel" (bank 256 frekuensi simbol)
+            progress_callback (callable): Dipanggil dengan (segmen teranalisis,
+                total segmen); boleh melempar OperationCancelled
             
         Returns:
             str: Teks terdekripsi
         """
-        if metadata is None:
-            # Jika tidak ada metadata, kita harus menganalisis audio
-            return self._decrypt_without_metadata(audio_data, sample_rate, key, base_freq=220, freq_range=660, tolerance=tolerance)
-        else:
+        if method not in ("stft", "goertzel"):
+            raise ValueError(f"Metode dekripsi tidak dikenal: {method}")
+        
+        if metadata is not None and 'frequencies' in metadata:
             # Jika ada metadata, gunakan untuk dekripsi yang lebih akurat
-            return self._decrypt_with_metadata(key, metadata)
+            text = self._decrypt_with_metadata(key, metadata)
+            if progress_callback:
+                progress_callback(len(text), len(text))
+            return text
+        
+        # Jika tidak ada daftar frekuensi, kita harus menganalisis audio
+        # dengan parameter dari metadata (jika ada) atau nilai default
+        metadata = metadata or {}
+        base_freq = metadata.get('base_freq', 220)
+        freq_range = metadata.get('freq_range', 660)
+        if method == "goertzel":
+            return self._decrypt_goertzel(audio_data, sample_rate, key, base_freq=base_freq, freq_range=freq_range,
+                                          progress_callback=progress_callback)
+        return self._decrypt_without_metadata(audio_data, sample_rate, key, base_freq=base_freq, freq_range=freq_range, tolerance=tolerance,
+                                              progress_callback=progress_callback)
+    
+    def decrypt_from_audio_stream(self, blocks, sample_rate, key, base_freq=220, freq_range=660,
+                                  tolerance=0.05, method="stft"):
+        """
+        Dekripsi bertahap tanpa metadata dari iterable blok PCM
+        
+        Yields:
+            str: Potongan teks begitu segmen nadanya selesai (lihat StreamingDecoder)
+        """
+        decoder = StreamingDecoder(self, sample_rate, key, base_freq=base_freq, freq_range=freq_range,
+                                   tolerance=tolerance, method=method)
+        return decoder.decode(blocks)
     
     def _decrypt_with_metadata(self, key, metadata):
         """
@@ -246,64 +1077,139 @@ class AudioProcessor:
         """
         base_freq = metadata.get('base_freq', 220)
         freq_range = metadata.get('freq_range', 660)
-        frequencies = metadata.get('frequencies', [])
+        frequencies = np.asarray(metadata.get('frequencies', []))
         
-        # Dekripsi frekuensi menjadi teks
-        text = ''
-        for freq in frequencies:
-            # Konversi kembali dari frekuensi ke kode karakter
-            normalized_freq = (freq - base_freq) / freq_range
-            char_code = int(round(normalized_freq * 256))
-            
-            # Terapkan shift balik
-            original_code = (char_code - key) % 256
-            
-            # Konversi ke karakter
-            text += chr(original_code)
+        # Konversi kembali dari frekuensi ke kode karakter (seluruh array
+        # sekaligus; np.round membulatkan ke genap seperti round)
+        normalized_freq = (frequencies - base_freq) / freq_range
+        char_codes = np.round(normalized_freq * 256).astype(np.int64)
         
-        return text
+        # Terapkan shift balik; kode 0-255 sama dengan chr() lewat latin-1
+        original_codes = (char_codes - key) % 256
+        return original_codes.astype(np.uint8).tobytes().decode('latin-1')
     
-    def _decrypt_without_metadata(self, audio_data, sample_rate, key, base_freq=220, freq_range=660, tolerance=0.05):
+    def _decrypt_without_metadata(self, audio_data, sample_rate, key, base_freq=220, freq_range=660, tolerance=0.05,
+                                  progress_callback=None):
         """
         Mendekripsi tanpa metadata menggunakan analisis frekuensi
         Metode ini lebih kompleks dan kurang akurat
         """
+        audio_data = self._analysis_audio(audio_data)
+        
         # Deteksi segmen audio yang berisi nada
         segments = self._improved_tone_detection(audio_data, sample_rate)
         
         # Analisis frekuensi dominan di setiap segmen
-        frequencies = []
-        for start, end in segments:
-            if end - start > 10:  # Pastikan segmen cukup panjang
-                segment_data = audio_data[start:end]
-                freq = self._get_dominant_frequency(segment_data, sample_rate)
-                if freq > 0:  # Pastikan frekuensi valid
-                    frequencies.append(freq)
+        segments = [(start, end) for start, end in segments if end - start > 10]  # Pastikan segmen cukup panjang
+        frequencies = self._estimate_dominant_frequencies(audio_data, segments, sample_rate, progress_callback)
+        frequencies = frequencies[frequencies > 0]  # Pastikan frekuensi valid
         
         # Dekripsi frekuensi menjadi teks
-        text = ''
-        for freq in frequencies:
-            # Konversi kembali dari frekuensi ke kode karakter dengan toleransi
-            normalized_freq = (freq - base_freq) / freq_range
-            
-            # Terapkan toleransi - coba beberapa nilai dalam rentang toleransi
-            possible_values = []
-            for t in [-tolerance, 0, tolerance]:
-                adjusted_freq = normalized_freq * (1 + t)
-                if 0 <= adjusted_freq <= 1:  # Pastikan dalam rentang valid
-                    char_code = int(round(adjusted_freq * 256))
-                    original_code = (char_code - key) % 256
-                    possible_values.append((original_code, abs(t)))  # Simpan nilai dan seberapa jauh dari asli
+        return ''.join(self._frequency_to_char(freq, key, base_freq, freq_range, tolerance)
+                       for freq in frequencies)
+    
+    def _decrypt_goertzel(self, audio_data, sample_rate, key, base_freq=220, freq_range=660, progress_callback=None):
+        """
+        Mendekripsi tanpa metadata dengan bank filter Goertzel
+        
+        Setiap segmen hanya dievaluasi pada 256 frekuensi yang dapat
+        dihasilkan encrypt_to_audio; simbol dengan energi terbesar dipilih,
+        sehingga tidak diperlukan toleransi frekuensi.
+        """
+        audio_data = self._analysis_audio(audio_data)
+        
+        segments = self._improved_tone_detection(audio_data, sample_rate)
+        segments = [(start, end) for start, end in segments if end - start > 10]
+        codes = self._goertzel_symbols(audio_data, segments, sample_rate, base_freq, freq_range, progress_callback)
+        codes = codes[codes >= 0]  # Lewati segmen yang terlalu pendek
+        
+        # Terapkan shift balik; kode 0-255 sama dengan karakter latin-1
+        return ((codes - key) % 256).astype(np.uint8).tobytes().decode('latin-1')
+    
+    def _analysis_audio(self, audio_data):
+        """
+        Audio dalam dtype kerja untuk analisis tanpa metadata
+        
+        LazyAudio tidak dimuat penuh: energi frame dihitung per potongan dan
+        hanya jendela segmen nada yang dibaca dari file (lihat _frame_energy
+        dan _segment_batches).
+        """
+        if isinstance(audio_data, LazyAudio):
+            if audio_data.dtype != self.dtype:
+                audio_data = LazyAudio(audio_data.raw, self.dtype)
+            return audio_data
+        return np.asarray(audio_data, dtype=self.dtype)
+    
+    def _goertzel_symbols(self, audio_data, segments, sample_rate, base_freq=220, freq_range=660,
+                          progress_callback=None):
+        """
+        Kode simbol (0-255) dengan energi terbesar untuk setiap segmen
+        
+        Keluaran Goertzel untuk semua kandidat dihitung dalam bentuk tertutup
+        sebagai perkalian matriks segmen dengan basis kosinus/sinus, satu
+        kali per kelompok segmen dengan panjang sama. Segmen yang terlalu
+        pendek (< 100 sampel) menghasilkan -1.
+        """
+        codes = np.full(len(segments), -1, dtype=np.int64)
+        
+        for rows, stack in self._segment_batches(audio_data, segments, progress_callback):
+            energy = self._symbol_energy(stack.astype(np.float32, copy=False), sample_rate,
+                                         float(base_freq), float(freq_range))
+            codes[rows] = np.argmax(energy, axis=1)
+        
+        return codes
+    
+    def _symbol_energy(self, segments, sample_rate, base_freq, freq_range):
+        """
+        Energi setiap baris segmen (berjendela Hann) pada 256 frekuensi simbol
+        
+        Segmen yang lebih panjang dari satu blok basis dipotong menjadi blok
+        berukuran SYMBOL_BASIS_SAMPLES; semua blok diproyeksikan dengan satu
+        perkalian matriks, lalu digabung dengan rotasi fase per blok.
+        """
+        n = segments.shape[1]
+        basis, omegas = _symbol_basis(sample_rate, base_freq, freq_range)
+        window = _analysis_plan(n, sample_rate)[0].astype(np.float32)
+        
+        if n <= SYMBOL_BASIS_SAMPLES:
+            projections = (segments * window) @ basis[:n]
+            spectrum = projections[:, :256] - 1j * projections[:, 256:]
+        else:
+            n_blocks = -(-n // SYMBOL_BASIS_SAMPLES)
+            blocks = np.zeros((len(segments), n_blocks * SYMBOL_BASIS_SAMPLES), dtype=np.float32)
+            np.multiply(segments, window, out=blocks[:, :n])
+            projections = blocks.reshape(-1, SYMBOL_BASIS_SAMPLES) @ basis
+            projections = projections.reshape(len(segments), n_blocks, 512)
             
-            # Pilih nilai dengan toleransi terkecil
-            if possible_values:
-                possible_values.sort(key=lambda x: x[1])  # Urutkan berdasarkan toleransi
-                best_char_code = possible_values[0][0]
-                text += chr(best_char_code)
-            else:
-                text += '?'  # Karakter tidak dapat didekripsi
+            # Blok ke-j memakai basis yang sama, digeser fasenya sebesar omega * j * B
+            offsets = np.arange(n_blocks) * SYMBOL_BASIS_SAMPLES
+            rotation = np.exp(-1j * np.outer(offsets, omegas)).astype(np.complex64)
+            spectrum = np.einsum('mbk,bk->mk', projections[..., :256] - 1j * projections[..., 256:], rotation)
         
-        return text
+        return np.square(spectrum.real) + np.square(spectrum.imag)
+    
+    def _frequency_to_char(self, freq, key, base_freq, freq_range, tolerance):
+        """
+        Mengonversi frekuensi hasil analisis menjadi karakter dengan toleransi
+        """
+        # Konversi kembali dari frekuensi ke kode karakter dengan toleransi
+        normalized_freq = (freq - base_freq) / freq_range
+        
+        # Terapkan toleransi - coba beberapa nilai dalam rentang toleransi
+        possible_values = []
+        for t in [-tolerance, 0, tolerance]:
+            adjusted_freq = normalized_freq * (1 + t)
+            if 0 <= adjusted_freq <= 1:  # Pastikan dalam rentang valid
+                char_code = int(round(adjusted_freq * 256))
+                original_code = (char_code - key) % 256
+                possible_values.append((original_code, abs(t)))  # Simpan nilai dan seberapa jauh dari asli
+        
+        # Pilih nilai dengan toleransi terkecil
+        if possible_values:
+            possible_values.sort(key=lambda x: x[1])  # Urutkan berdasarkan toleransi
+            return chr(possible_values[0][0])
+        
+        return '?'  # Karakter tidak dapat didekripsi
     
     def _improved_tone_detection(self, audio_data, sample_rate):
         """
@@ -313,12 +1219,9 @@ class AudioProcessor:
         frame_length = int(0.02 * sample_rate)  # 20ms frame
         hop_length = int(0.01 * sample_rate)    # 10ms hop
         
-        frames = []
-        for i in range(0, len(audio_data) - frame_length, hop_length):
-            frames.append(audio_data[i:i+frame_length])
-        
-        # Hitung energi untuk setiap frame
-        energy = np.array([np.sum(frame**2) for frame in frames])
+        energy = self._frame_energy(audio_data, frame_length, hop_length)
+        if len(energy) == 0:
+            return []
         
         # Normalisasi energi
         if np.max(energy) > 0:
@@ -335,38 +1238,50 @@ class AudioProcessor:
         segment_starts = np.where(transitions == 1)[0]
         segment_ends = np.where(transitions == -1)[0]
         
-        # Pastikan jumlah start dan end sama
-        if len(segment_starts) > len(segment_ends):
-            segment_ends = np.append(segment_ends, len(active_frames) - 1)
-        elif len(segment_starts) < len(segment_ends):
+        # Segmen yang aktif sejak frame pertama atau sampai frame terakhir
+        # (keduanya diperiksa agar pasangan start dan end tidak bergeser)
+        if active_frames[0]:
             segment_starts = np.insert(segment_starts, 0, 0)
+        if active_frames[-1]:
+            segment_ends = np.append(segment_ends, len(active_frames) - 1)
+        
+        if len(segment_starts) == 0:
+            return []
         
         # Konversi indeks frame ke indeks sampel
-        segments = []
-        for start, end in zip(segment_starts, segment_ends):
-            sample_start = start * hop_length
-            sample_end = (end + 1) * hop_length + frame_length
-            if sample_end > len(audio_data):
-                sample_end = len(audio_data)
-            segments.append((sample_start, sample_end))
-        
-        # Gabungkan segmen yang berdekatan
-        if segments:
-            merged_segments = [segments[0]]
-            for current_start, current_end in segments[1:]:
-                prev_start, prev_end = merged_segments[-1]
-                
-                # Jika segmen saat ini berdekatan dengan segmen sebelumnya
-                if current_start - prev_end < frame_length:
-                    # Gabungkan segmen
-                    merged_segments[-1] = (prev_start, current_end)
-                else:
-                    # Tambahkan segmen baru
-                    merged_segments.append((current_start, current_end))
+        sample_starts = segment_starts * hop_length
+        sample_ends = np.minimum((segment_ends + 1) * hop_length + frame_length, len(audio_data))
+        
+        # Gabungkan segmen yang berdekatan: segmen baru dimulai jika jaraknya
+        # dari akhir segmen sebelumnya minimal satu frame
+        new_segment = np.concatenate(([True], sample_starts[1:] - sample_ends[:-1] >= frame_length))
+        last_in_segment = np.concatenate((new_segment[1:], [True]))
+        
+        return list(zip(sample_starts[new_segment].tolist(), sample_ends[last_in_segment].tolist()))
+    
+    def _frame_energy(self, audio_data, frame_length, hop_length):
+        """
+        Energi (jumlah kuadrat sampel) setiap frame dengan jendela berlangkah
+        
+        Frame dimulai pada 0, hop_length, ... selama awal frame kurang dari
+        len(audio_data) - frame_length. Sinyal diproses per potongan sehingga
+        tidak ada salinan kuadrat sinyal penuh; LazyAudio juga hanya dibaca
+        per potongan.
+        """
+        n_frames = len(range(0, len(audio_data) - frame_length, hop_length))
+        energy = np.empty(n_frames, dtype=np.result_type(audio_data.dtype, np.float32))
+        
+        frames_per_chunk = max(1, FRAME_CHUNK_SAMPLES // hop_length)
+        for first in range(0, n_frames, frames_per_chunk):
+            last = min(first + frames_per_chunk, n_frames)
+            start = first * hop_length
+            end = (last - 1) * hop_length + frame_length
             
-            return merged_segments
+            squared = np.square(audio_data[start:end])
+            frames = sliding_window_view(squared, frame_length)[::hop_length]
+            energy[first:last] = frames.sum(axis=1)
         
-        return segments
+        return energy
     
     def _get_dominant_frequency(self, audio_segment, sample_rate):
         """
@@ -375,40 +1290,102 @@ class AudioProcessor:
         if len(audio_segment) < 100:  # Terlalu pendek untuk analisis yang akurat
             return 0
         
-        # Gunakan STFT untuk analisis frekuensi yang lebih baik
-        nperseg = min(1024, len(audio_segment))
-        f, t, Zxx = signal.stft(audio_segment, fs=sample_rate, nperseg=nperseg)
-        
-        # Ambil rata-rata magnitude spektrum
-        magnitude = np.mean(np.abs(Zxx), axis=1)
-        
-        # Temukan frekuensi dengan magnitude tertinggi
-        # Batasi pencarian ke rentang frekuensi yang diharapkan (200-1000 Hz)
-        freq_mask = (f >= 200) & (f <= 1000)
-        if np.sum(freq_mask) > 0:
-            filtered_magnitude = magnitude[freq_mask]
-            filtered_freqs = f[freq_mask]
+        return self._dominant_frequencies(np.asarray(audio_segment)[None, :], sample_rate)[0]
+    
+    def _estimate_dominant_frequencies(self, audio_data, segments, sample_rate, progress_callback=None):
+        """
+        Mendapatkan frekuensi dominan semua segmen sekaligus
+        
+        Segmen dengan panjang sama ditumpuk menjadi array 2D dan dianalisis
+        dengan satu STFT per kelompok. Segmen yang terlalu pendek (< 100
+        sampel) menghasilkan frekuensi 0.
+        
+        Returns:
+            numpy.array: Frekuensi dominan per segmen dalam Hz
+        """
+        frequencies = np.zeros(len(segments))
+        for rows, stack in self._segment_batches(audio_data, segments, progress_callback):
+            frequencies[rows] = self._dominant_frequencies(stack, sample_rate)
+        
+        return frequencies
+    
+    def _segment_batches(self, audio_data, segments, progress_callback=None):
+        """
+        Mengelompokkan segmen berdasarkan panjangnya
+        
+        Menghasilkan pasangan (indeks segmen, array 2D sampel) dengan ukuran
+        batch dibatasi ANALYSIS_BLOCK_SAMPLES. Segmen < 100 sampel dilewati.
+        Hanya sampel di dalam segmen yang diambil dari audio_data (juga dari
+        LazyAudio, lewat indeks ke sampel mentahnya).
+        progress_callback dipanggil setelah setiap batch selesai diproses.
+        """
+        if not segments:
+            if progress_callback:
+                progress_callback(0, 0)
+            return
+        
+        starts, ends = np.array(segments, dtype=np.int64).T
+        lengths = np.minimum(ends, len(audio_data)) - starts
+        done = 0
+        
+        for n in np.unique(lengths[lengths >= 100]):
+            group = np.flatnonzero(lengths == n)
+            rows_per_batch = max(1, ANALYSIS_BLOCK_SAMPLES // int(n))
             
-            if len(filtered_magnitude) > 0:
-                max_idx = np.argmax(filtered_magnitude)
-                return filtered_freqs[max_idx]
-        
-        # Fallback ke metode FFT sederhana jika STFT tidak berhasil
-        n = len(audio_segment)
-        freqs = np.fft.rfftfreq(n, d=1/sample_rate)
-        fft_data = np.abs(np.fft.rfft(audio_segment))
-        
-        # Filter ke rentang frekuensi yang diharapkan
-        freq_mask = (freqs >= 200) & (freqs <= 1000)
-        if np.sum(freq_mask) > 0:
-            filtered_fft = fft_data[freq_mask]
-            filtered_freqs = freqs[freq_mask]
+            for first in range(0, len(group), rows_per_batch):
+                rows = group[first:first + rows_per_batch]
+                yield rows, audio_data[starts[rows][:, None] + np.arange(n)]
+                
+                done += len(rows)
+                if progress_callback:
+                    progress_callback(done, len(segments))
+        
+        if progress_callback:
+            progress_callback(len(segments), len(segments))
+    
+    def _dominant_frequencies(self, segments, sample_rate):
+        """
+        Frekuensi dominan untuk setiap baris array 2D segmen (panjang sama)
+        
+        Puncak spektrum dicari pada rentang yang diharapkan (200-1000 Hz),
+        lalu posisinya diperhalus dengan interpolasi parabola pada magnitude
+        logaritmik sehingga tidak terbatas pada frekuensi tengah bin.
+        """
+        n = segments.shape[-1]
+        
+        # Gunakan STFT untuk analisis frekuensi yang lebih baik
+        nperseg = min(1024, n)
+        window, freqs, freq_mask = _analysis_plan(nperseg, sample_rate)
+        if freq_mask.any():
+            from scipy import signal
+            _, _, Zxx = signal.stft(segments, fs=sample_rate, window=window, nperseg=nperseg, axis=-1)
             
-            if len(filtered_fft) > 0:
-                max_idx = np.argmax(filtered_fft)
-                return filtered_freqs[max_idx]
+            # Ambil rata-rata magnitude spektrum
+            magnitude = np.mean(np.abs(Zxx), axis=-1)
+        else:
+            # Fallback ke metode FFT sederhana jika STFT tidak berhasil
+            _, freqs, freq_mask = _analysis_plan(n, sample_rate)
+            if not freq_mask.any():
+                return np.zeros(len(segments))
+            magnitude = np.abs(np.fft.rfft(segments, axis=-1))
+        
+        # Temukan frekuensi dengan magnitude tertinggi di rentang yang diharapkan
+        band = np.flatnonzero(freq_mask)
+        peaks = band[np.argmax(magnitude[:, band], axis=1)]
+        
+        # Interpolasi parabola dengan bin tetangga
+        rows = np.arange(len(peaks))
+        inner = (peaks > 0) & (peaks < magnitude.shape[1] - 1)
+        left = np.log(magnitude[rows, np.maximum(peaks - 1, 0)] + 1e-12)
+        center = np.log(magnitude[rows, peaks] + 1e-12)
+        right = np.log(magnitude[rows, np.minimum(peaks + 1, magnitude.shape[1] - 1)] + 1e-12)
+        
+        curvature = left - 2 * center + right
+        with np.errstate(divide='ignore', invalid='ignore'):
+            offset = np.where(inner & (curvature < 0), 0.5 * (left - right) / curvature, 0.0)
+        offset = np.clip(offset, -0.5, 0.5)
         
-        return 0
+        return freqs[peaks] + offset * (freqs[1] - freqs[0])
     
     def test_encryption_decryption(self, text, key=7):
         """
@@ -437,3 +1414,205 @@ class AudioProcessor:
                     print(f"  Indeks {i}: Asli='{orig}' ({ord(orig)}) vs Dekripsi='{decrypted}' ({ord(decrypted)})")
         
         return text == decrypted_text
+
+class StreamingDecoder:
+    """
+    Dekoder bertahap untuk audio FSAE tanpa metadata
+    
+    Menerima blok PCM berukuran bebas (misalnya dari mikrofon, pipe, atau
+    LazyAudio.blocks()) dan mengembalikan karakter begitu segmen nadanya
+    selesai. Segmentasi sama dengan _improved_tone_detection (frame 20 ms,
+    hop 10 ms, threshold 0.1, segmen digabung jika jaraknya kurang dari
+    satu frame), tetapi normalisasi energi memakai energi maksimum yang
+    sudah terlihat sejauh ini, bukan maksimum seluruh file.
+    
+    Karena itu hasilnya bisa berbeda dari decrypt_from_audio jika amplitudo
+    rekaman berubah: nada pelan di awal rekaman yang amplitudonya naik
+    tetap dikenali di sini, sedangkan mode batch membuangnya karena
+    energinya di bawah threshold relatif terhadap bagian paling keras.
+    Untuk amplitudo tetap atau menurun hasil keduanya sama.
+    
+    Memori yang dipakai sebanding dengan panjang segmen yang sedang
+    terbuka, dibatasi oleh max_segment_seconds.
+    """
+    
+    def __init__(self, audio_processor, sample_rate, key, base_freq=220, freq_range=660,
+                 tolerance=0.05, method="stft", max_segment_seconds=10.0):
+        if method not in ("stft", "goertzel"):
+            raise ValueError(f"Metode dekripsi tidak dikenal: {method}")
+        
+        self.audio_processor = audio_processor
+        self.sample_rate = sample_rate
+        self.key = key
+        self.base_freq = base_freq
+        self.freq_range = freq_range
+        self.tolerance = tolerance
+        self.method = method
+        self.max_segment_samples = int(max_segment_seconds * sample_rate) if max_segment_seconds else None
+        
+        self.frame_length = int(0.02 * sample_rate)  # 20ms frame
+        self.hop_length = int(0.01 * sample_rate)    # 10ms hop
+        self.threshold = 0.1
+        
+        self.dtype = audio_processor.dtype
+        self._buffer = np.zeros(0, dtype=self.dtype)
+        self._offset = 0            # Indeks sampel global untuk _buffer[0]
+        self._next_frame = 0        # Indeks frame berikutnya yang belum dihitung
+        self._max_energy = 0.0
+        self._active = False        # Status frame terakhir
+        self._open_start = None     # Awal segmen yang sedang aktif
+        self._pending = None        # Segmen selesai yang masih bisa digabung
+    
+    @property
+    def samples_seen(self):
+        return self._offset + len(self._buffer)
+    
+    def feed(self, block):
+        """
+        Menambahkan blok PCM dan mengembalikan karakter yang sudah dikenali
+        """
+        block = np.asarray(block)
+        if block.dtype.kind in 'iu':
+            block = block.astype(self.dtype) / 32767.0
+        self._buffer = np.concatenate((self._buffer, block.astype(self.dtype, copy=False)))
+        
+        # Hanya frame yang seluruh sampelnya sudah tersedia (dan bukan frame
+        # yang berakhir tepat di ujung sinyal, seperti pada mode batch)
+        first = self._next_frame * self.hop_length - self._offset
+        energy = self.audio_processor._frame_energy(self._buffer[first:], self.frame_length, self.hop_length)
+        
+        segments = self._track_segments(energy)
+        self._next_frame += len(energy)
+        segments.extend(self._release_pending())
+        
+        text = self._decode_segments(segments)
+        self._trim_buffer()
+        return text
+    
+    def finish(self):
+        """
+        Menutup aliran dan mengembalikan karakter dari segmen terakhir
+        """
+        segments = []
+        if self._open_start is not None:
+            # Segmen yang masih aktif berakhir di ujung sinyal
+            self._close_segment(self.samples_seen, segments)
+        if self._pending is not None:
+            segments.append(self._pending)
+            self._pending = None
+        
+        text = self._decode_segments(segments)
+        self._buffer = np.zeros(0, dtype=self.dtype)
+        return text
+    
+    def decode(self, blocks):
+        """
+        Generator: mendekode iterable blok PCM dan yield potongan teks
+        """
+        for block in blocks:
+            text = self.feed(block)
+            if text:
+                yield text
+        text = self.finish()
+        if text:
+            yield text
+    
+    def _track_segments(self, energy):
+        """
+        Memperbarui status segmen dari energi frame baru dan mengembalikan
+        segmen yang sudah final
+        """
+        segments = []
+        if len(energy) == 0:
+            return segments
+        
+        # Normalisasi dengan maksimum berjalan
+        running_max = np.maximum.accumulate(np.maximum(energy, self._max_energy))
+        self._max_energy = float(running_max[-1])
+        limit = np.where(running_max > 0, self.threshold * running_max, self.threshold)
+        active = energy > limit
+        
+        # Hanya frame transisi yang diproses di Python
+        previous = np.concatenate(([self._active], active[:-1]))
+        for index in np.flatnonzero(active != previous):
+            frame = self._next_frame + int(index)
+            if active[index]:
+                # Segmen dimulai satu frame sebelum frame aktif pertama
+                self._open_segment(max(frame - 1, 0) * self.hop_length, segments)
+            else:
+                # Frame aktif terakhir adalah frame - 1
+                self._close_segment(frame * self.hop_length + self.frame_length, segments)
+        self._active = bool(active[-1])
+        
+        if self._open_start is not None and self.max_segment_samples:
+            # Potong segmen yang terlalu panjang agar memori tetap terbatas
+            limit_end = (self._next_frame + len(energy)) * self.hop_length
+            while limit_end - self._open_start > self.max_segment_samples:
+                end = self._open_start + self.max_segment_samples
+                segments.append((self._open_start, end))
+                self._open_start = end
+        
+        return segments
+    
+    def _open_segment(self, start, segments):
+        if self._pending is not None:
+            pending_start, pending_end = self._pending
+            self._pending = None
+            if start - pending_end < self.frame_length:
+                # Gabungkan dengan segmen sebelumnya
+                self._open_start = pending_start
+                return
+            segments.append((pending_start, pending_end))
+        self._open_start = start
+    
+    def _close_segment(self, end, segments):
+        self._pending = (self._open_start, min(end, self.samples_seen))
+        self._open_start = None
+    
+    def _release_pending(self):
+        """
+        Segmen tertunda menjadi final jika segmen berikutnya pasti dimulai
+        setidaknya satu frame setelahnya
+        """
+        if self._pending is None or self._active:
+            return []
+        
+        # Segmen berikutnya paling awal dimulai pada frame terakhir yang sudah dihitung
+        earliest_start = max(self._next_frame - 1, 0) * self.hop_length
+        if earliest_start - self._pending[1] >= self.frame_length:
+            segment, self._pending = self._pending, None
+            return [segment]
+        return []
+    
+    def _trim_buffer(self):
+        """
+        Membuang sampel yang tidak lagi dibutuhkan segmen atau frame berikutnya
+        """
+        keep_from = max(self._next_frame - 1, 0) * self.hop_length
+        if self._open_start is not None:
+            keep_from = min(keep_from, self._open_start)
+        if self._pending is not None:
+            keep_from = min(keep_from, self._pending[0])
+        
+        drop = keep_from - self._offset
+        if drop > 0:
+            self._buffer = self._buffer[drop:]
+            self._offset = keep_from
+    
+    def _decode_segments(self, segments):
+        segments = [(start - self._offset, end - self._offset)
+                    for start, end in segments if end - start > 10]
+        if not segments:
+            return ''
+        
+        if self.method == "goertzel":
+            codes = self.audio_processor._goertzel_symbols(
+                self._buffer, segments, self.sample_rate, self.base_freq, self.freq_range)
+            codes = codes[codes >= 0]
+            return ((codes - self.key) % 256).astype(np.uint8).tobytes().decode('latin-1')
+        
+        frequencies = self.audio_processor._estimate_dominant_frequencies(
+            self._buffer, segments, self.sample_rate)
+        return ''.join(self.audio_processor._frequency_to_char(
+            freq, self.key, self.base_freq, self.freq_range, self.tolerance)
+            for freq in frequencies[frequencies > 0])
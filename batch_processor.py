@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Aplikasi Kriptografi Teks ke Suara
+Batch Processor - Enkripsi/dekripsi massal paralel dengan ProcessPoolExecutor
+"""
+
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+
+from audio_processor import AudioProcessor
+
+# Buffer audio yang lebih kecil dari ini dikirim biasa (pickle); yang lebih
+# besar dipindahkan lewat shared memory
+SHARED_MEMORY_THRESHOLD = 1 << 20
+
+# AudioProcessor milik proses worker, dibuat saat pekerjaan pertama
+_worker_processor = None
+
+def _get_worker_processor():
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = AudioProcessor()
+    return _worker_processor
+
+def _export_array(array, threshold):
+    """
+    Membungkus array untuk dikirim ke proses lain: deskriptor shared memory
+    (nama, shape, dtype) untuk array besar, atau array itu sendiri
+    """
+    array = np.asarray(array)
+    if array.nbytes < threshold:
+        return array
+
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    descriptor = ('shm', shm.name, array.shape, array.dtype.str)
+    shm.close()
+    return descriptor
+
+def _is_shared(payload):
+    return isinstance(payload, tuple) and len(payload) == 4 and payload[0] == 'shm'
+
+def _import_array(payload, copy):
+    """
+    Kebalikan _export_array. Dengan copy=True data disalin ke array biasa
+    dan blok shared memory dihapus; dengan copy=False dikembalikan
+    (view, shm) dan pemanggil wajib menutup shm setelah selesai.
+    """
+    if not _is_shared(payload):
+        return (payload, None) if not copy else payload
+
+    _, name, shape, dtype = payload
+    shm = shared_memory.SharedMemory(name=name)
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    if not copy:
+        return view, shm
+
+    array = view.copy()
+    del view
+    shm.close()
+    shm.unlink()
+    return array
+
+def _release(payload):
+    """
+    Menghapus blok shared memory yang tidak jadi dipakai
+    """
+    if _is_shared(payload):
+        try:
+            shm = shared_memory.SharedMemory(name=payload[1])
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+def _encrypt_job(job, threshold):
+    """
+    Dijalankan di worker: enkripsi satu pesan, audio dikirim lewat shared memory
+    """
+    result = _get_worker_processor().encrypt_to_audio(**job)
+    result['audio'] = _export_array(result['audio'], threshold)
+    return result
+
+def _decrypt_job(audio_payload, job):
+    """
+    Dijalankan di worker: dekripsi langsung dari view shared memory tanpa salinan
+    """
+    audio_data, shm = _import_array(audio_payload, copy=False)
+    try:
+        return _get_worker_processor().decrypt_from_audio(audio_data, **job)
+    finally:
+        del audio_data
+        if shm is not None:
+            shm.close()
+
+class BatchProcessor:
+    """
+    Layanan enkripsi/dekripsi massal di atas AudioProcessor
+
+    Pekerjaan dibagi ke beberapa proses worker. Buffer audio besar tidak
+    di-pickle: audio masukan dekripsi ditulis ke shared memory oleh proses
+    utama dan dibaca langsung oleh worker, sedangkan audio hasil enkripsi
+    ditulis worker ke shared memory lalu disalin sekali oleh proses utama.
+
+    Pekerjaan dikirim ke worker secara bertahap: paling banyak max_pending
+    (default 2 x max_workers) pekerjaan yang sedang berjalan atau hasilnya
+    belum diambil, sehingga shared memory dan memori hasil tetap terbatas
+    berapa pun jumlah pesannya.
+
+    Contoh:
+        with BatchProcessor(max_workers=4) as batch:
+            for result in batch.encrypt_many(texts, key=7):
+                ...
+    """
+
+    def __init__(self, max_workers=None, shared_memory_threshold=SHARED_MEMORY_THRESHOLD, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shared_memory_threshold = shared_memory_threshold
+        self.max_pending = max_pending or 2 * self.max_workers
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            # Worker harus memakai resource tracker yang sama dengan proses
+            # utama agar blok yang dihapus di sini tidak dianggap bocor
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        """
+        Menghentikan proses worker
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def encrypt_many(self, texts, key, base_freq=220, base_duration=0.1, algorithm="FSAE Standard",
+                     ordered=True):
+        """
+        Mengenkripsi banyak pesan secara paralel
+
+        Args:
+            texts (iterable): Pesan-pesan (str), atau dict argumen
+                encrypt_to_audio per pesan untuk parameter yang berbeda-beda
+            key, base_freq, base_duration, algorithm: Nilai default semua pesan
+            ordered (bool): True untuk hasil sesuai urutan masukan; False untuk
+                pasangan (indeks, hasil) segera setelah selesai
+
+        Yields:
+            dict: Hasil encrypt_to_audio ('audio', 'sample_rate', 'metadata')
+        """
+        defaults = {'key': key, 'base_freq': base_freq, 'base_duration': base_duration,
+                    'algorithm': algorithm}
+
+        def submit():
+            for text in texts:
+                job = dict(defaults, **text) if isinstance(text, dict) else dict(defaults, text=text)
+                yield self.executor.submit(_encrypt_job, job, self.shared_memory_threshold)
+
+        def unpack(result):
+            result['audio'] = _import_array(result['audio'], copy=True)
+            return result
+
+        return self._collect(submit(), unpack, ordered)
+
+    def decrypt_many(self, items, key, tolerance=0.05, method="stft", ordered=True):
+        """
+        Mendekripsi banyak audio secara paralel
+
+        Args:
+            items (iterable): Tuple (audio_data, sample_rate) atau
+                (audio_data, sample_rate, metadata), atau dict argumen
+                decrypt_from_audio per audio
+            key, tolerance, method: Nilai default semua audio
+            ordered (bool): Lihat encrypt_many
+
+        Yields:
+            str: Teks terdekripsi
+        """
+        def submit():
+            for item in items:
+                job = {'key': key, 'tolerance': tolerance, 'method': method}
+                if isinstance(item, dict):
+                    job.update(item)
+                else:
+                    job['audio_data'], job['sample_rate'] = item[0], item[1]
+                    job['metadata'] = item[2] if len(item) > 2 else None
+
+                # Audio baru ditulis ke shared memory saat pekerjaannya dikirim
+                payload = _export_array(job.pop('audio_data'), self.shared_memory_threshold)
+                try:
+                    future = self.executor.submit(_decrypt_job, payload, job)
+                except BaseException:
+                    _release(payload)
+                    raise
+
+                # Blok shared memory dihapus begitu pekerjaannya selesai/dibatalkan
+                future.add_done_callback(lambda _, payload=payload: _release(payload))
+                yield future
+
+        return self._collect(submit(), lambda text: text, ordered)
+
+    def _collect(self, submissions, unpack, ordered):
+        """
+        Generator hasil: berurutan, atau (indeks, hasil) sesuai waktu selesai
+
+        `submissions` adalah iterator yang mengirim satu pekerjaan setiap
+        kali dimajukan dan menghasilkan future-nya; iterator ini hanya
+        dimajukan selama kurang dari max_pending pekerjaan yang tertunda.
+        """
+        pending = deque()  # (indeks, future) sesuai urutan pengiriman
+        submitted = 0
+
+        def fill():
+            nonlocal submitted
+            while len(pending) < self.max_pending:
+                future = next(submissions, None)
+                if future is None:
+                    return
+                pending.append((submitted, future))
+                submitted += 1
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    index, future = pending[0]
+                else:
+                    done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                    index, future = next(entry for entry in pending if entry[1] in done)
+
+                value = unpack(future.result())
+                pending.remove((index, future))
+                fill()
+                yield value if ordered else (index, value)
+        finally:
+            submissions.close()
+            # Hasil yang tidak diambil (generator dihentikan atau error):
+            # batalkan, atau hapus shared memory-nya begitu selesai
+            for _, future in pending:
+                if not future.cancel():
+                    future.add_done_callback(_release_result)
+
+def _release_result(future):
+    if not future.cancelled() and future.exception() is None:
+        result = future.result()
+        if isinstance(result, dict):
+            _release(result.get('audio'))
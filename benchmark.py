@@ -0,0 +1,974 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Aplikasi Kriptografi Teks ke Suara
+Benchmark - Pengukuran kinerja pemrosesan audio
+
+Penggunaan:
+    python benchmark.py synthesis --chars 5000
+    python benchmark.py tone-cache --chars 5000
+    python benchmark.py save --chars 20000
+    python benchmark.py tone-detection --minutes 10 60
+    python benchmark.py segment-analysis --chars 5000
+    python benchmark.py symbol-decoder --chars 5000
+    python benchmark.py stream-decode --minutes 1 10
+    python benchmark.py batch --messages 200 --chars 500 --workers 4
+    python benchmark.py startup
+    python benchmark.py playback --minutes 1 10
+    python benchmark.py metadata --chars 100000
+    python benchmark.py metadata-decode --chars 1000000
+    python benchmark.py mapping --chars 1000000
+    python benchmark.py dtype --chars 2000
+    python benchmark.py visual --minutes 10
+    python benchmark.py tiles --minutes 1 10 60
+    python benchmark.py ui --minutes 1 10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import scipy.io.wavfile as wav
+from scipy import signal
+from concurrent.futures import ProcessPoolExecutor
+
+from audio_processor import AudioProcessor, StreamingDecoder, ToneCache
+from batch_processor import BatchProcessor
+from metadata_store import read_metadata, write_metadata
+from tests.reference import (ALGORITHMS, legacy_dominant_frequency, legacy_map_characters,
+                             legacy_tone_detection, random_text, synthetic_capture,
+                             text_chunks, tone_segments)
+
+def best_time(func, repeat=3):
+    """
+    Menjalankan fungsi beberapa kali dan mengembalikan waktu terbaik (detik)
+    beserta hasil terakhirnya
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def legacy_generate_audio_signal(sample_rate, frequencies, durations, amplitudes):
+    """
+    Sintesis per karakter (implementasi lama) sebagai pembanding
+    """
+    total_samples = int(sum(durations) * sample_rate)
+    audio_signal = np.zeros(total_samples)
+
+    current_sample = 0
+    for freq, duration, amplitude in zip(frequencies, durations, amplitudes):
+        t = np.arange(0, duration, 1/sample_rate)
+        samples = amplitude * np.sin(2 * np.pi * freq * t)
+
+        fade_samples = min(int(0.01 * sample_rate), len(samples) // 4)
+        samples[:fade_samples] *= np.linspace(0, 1, fade_samples)
+        samples[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+
+        end_sample = current_sample + len(samples)
+        if end_sample <= total_samples:
+            audio_signal[current_sample:end_sample] = samples
+        else:
+            audio_signal[current_sample:] = samples[:total_samples-current_sample]
+        current_sample = end_sample
+
+    return audio_signal
+
+def bench_synthesis(args):
+    """
+    Throughput sintesis nada (karakter per detik): loop lama vs batch
+    """
+    # float64 agar dapat dibandingkan sampel demi sampel dengan loop lama
+    processor = AudioProcessor(tone_cache=None, dtype=np.float64)
+    text = random_text(args.chars)
+    print(f"Sintesis {args.chars} karakter @ {processor.sample_rate} Hz")
+
+    for algorithm in ALGORITHMS:
+        metadata = processor.encrypt_to_audio(text, 7, algorithm=algorithm)['metadata']
+        params = (metadata['frequencies'], metadata['durations'], metadata['amplitudes'])
+
+        legacy_time, expected = best_time(
+            lambda: legacy_generate_audio_signal(processor.sample_rate, *params), args.repeat)
+        batch_time, actual = best_time(
+            lambda: processor._generate_audio_signal(*params), args.repeat)
+
+        identical = np.array_equal(expected, actual)
+        print(f"  {algorithm:14s} lama: {args.chars / legacy_time:10.0f} kar/detik | "
+              f"batch: {args.chars / batch_time:10.0f} kar/detik | "
+              f"x{legacy_time / batch_time:5.1f} | identik: {'ya' if identical else 'TIDAK'}")
+
+def bench_tone_cache(args):
+    """
+    Sintesis tanpa cache vs tone cache dingin (cold) dan hangat (warm)
+    """
+    uncached = AudioProcessor(tone_cache=None)
+    cache = ToneCache()
+    cached = AudioProcessor(tone_cache=cache)
+    print(f"Tone cache, {args.chars} karakter per pesan")
+
+    for algorithm in ALGORITHMS:
+        cache.clear()
+        text = random_text(args.chars)
+        metadata = uncached.encrypt_to_audio(text, 7, algorithm=algorithm)['metadata']
+        params = (metadata['frequencies'], metadata['durations'], metadata['amplitudes'])
+
+        uncached_time, expected = best_time(lambda: uncached._generate_audio_signal(*params), args.repeat)
+        cold_time, _ = best_time(lambda: (cache.clear(), cached._generate_audio_signal(*params)), 1)
+
+        # Pesan lain dengan parameter sama memakai ulang nada dari cache
+        other = random_text(args.chars, seed=1)
+        other_params = uncached.encrypt_to_audio(other, 7, algorithm=algorithm)['metadata']
+        cached._generate_audio_signal(other_params['frequencies'], other_params['durations'],
+                                      other_params['amplitudes'])
+        warm_time, actual = best_time(lambda: cached._generate_audio_signal(*params), args.repeat)
+
+        identical = np.array_equal(expected, actual)
+        stats = cache.stats()
+        print(f"  {algorithm:14s} tanpa cache: {uncached_time * 1000:8.1f} ms | "
+              f"dingin: {cold_time * 1000:8.1f} ms | hangat: {warm_time * 1000:8.1f} ms | "
+              f"x{uncached_time / warm_time:5.1f} | identik: {'ya' if identical else 'TIDAK'}")
+        print(f"  {'':14s} hit {stats['hits']}, miss {stats['misses']}, eviction {stats['evictions']}, "
+              f"{stats['entries']} nada, {stats['bytes'] / 2**20:.1f} MB")
+
+def legacy_save_audio(file_path, audio_data, sample_rate, metadata):
+    """
+    save_audio lama: konversi int16 penuh lalu scipy wav.write
+    """
+    wav.write(file_path, sample_rate, np.int16(audio_data * 32767))
+    with open(file_path + ".metadata", 'w') as f:
+        json.dump(legacy_metadata(metadata), f, indent=2)
+
+def run_save_case(case, chars, file_path):
+    """
+    Dijalankan di proses terpisah: enkripsi + simpan, kembalikan
+    (waktu total, waktu simpan, peak RSS dalam MB)
+    """
+    processor = AudioProcessor()
+    text = random_text(chars)
+
+    start = time.perf_counter()
+    if case == 'stream':
+        blocks = processor.encrypt_to_audio_stream(text_chunks(text), 7, summaries=True)
+        processor.save_audio_stream(file_path, blocks)
+        save_start = start
+    else:
+        result = processor.encrypt_to_audio(text, 7)
+        save_start = time.perf_counter()
+        save = legacy_save_audio if case == 'lama' else processor.save_audio
+        save(file_path, result['audio'], result['sample_rate'], result['metadata'])
+    end = time.perf_counter()
+    return end - start, end - save_start, peak_rss_mb()
+
+def peak_rss_mb():
+    """
+    Peak RSS proses ini dalam MB, atau None jika tidak tersedia (Windows)
+    """
+    if sys.platform == 'win32':
+        return None
+    import resource  # Hanya ada di POSIX
+
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == 'darwin' else 2**10)
+
+def bench_save(args):
+    """
+    Peak RSS dan waktu: save_audio lama vs save_audio per blok vs
+    encoder + writer streaming, masing-masing di proses baru
+    """
+    print(f"Enkripsi + simpan {args.chars} karakter "
+          f"({args.chars * 0.1 / 60:.1f} menit audio)")
+    context = multiprocessing.get_context('spawn')
+
+    with tempfile.TemporaryDirectory() as directory:
+        for case in ['lama', 'save_audio', 'stream']:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                file_path = os.path.join(directory, f"{case}.wav")
+                total, save, peak = executor.submit(run_save_case, case, args.chars, file_path).result()
+            peak = f"{peak:8.1f} MB" if peak is not None else "tidak tersedia"
+            print(f"  {case:10s} total: {total:6.2f} s | simpan: {save:6.2f} s | peak RSS: {peak}")
+
+def bench_tone_detection(args):
+    """
+    Segmentasi nada pada rekaman FSAE sintetis: frame list lama vs berlangkah
+    """
+    processor = AudioProcessor()
+    for minutes in args.minutes:
+        audio = synthetic_capture(processor, minutes)
+        print(f"Rekaman {minutes:g} menit ({len(audio)} sampel float32)")
+
+        legacy_time, expected = best_time(
+            lambda: legacy_tone_detection(audio, processor.sample_rate), args.repeat)
+        strided_time, actual = best_time(
+            lambda: processor._improved_tone_detection(audio, processor.sample_rate), args.repeat)
+
+        identical = [tuple(map(int, segment)) for segment in expected] == actual
+        print(f"  lama: {legacy_time:7.3f} s | berlangkah: {strided_time:7.3f} s | "
+              f"x{legacy_time / strided_time:5.1f} | {len(actual)} segmen | "
+              f"identik: {'ya' if identical else 'TIDAK'}")
+        del audio
+
+def bench_segment_analysis(args):
+    """
+    Frekuensi dominan semua segmen nada: STFT per segmen vs batch
+    """
+    processor = AudioProcessor()
+    text = random_text(args.chars)
+    print(f"Analisis {args.chars} segmen nada")
+
+    for algorithm in ALGORITHMS:
+        result = processor.encrypt_to_audio(text, 7, algorithm=algorithm, debug_chars=True)
+        audio = result['audio'].astype(np.float32)
+        segments = tone_segments(processor, result['metadata'], len(audio))
+        expected = np.array(result['metadata']['shifted_chars'])
+
+        legacy_time, legacy = best_time(
+            lambda: np.array([legacy_dominant_frequency(audio[start:end], processor.sample_rate)
+                              for start, end in segments]), args.repeat)
+        batch_time, batch = best_time(
+            lambda: processor._estimate_dominant_frequencies(audio, segments, processor.sample_rate),
+            args.repeat)
+
+        def accuracy(frequencies):
+            codes = np.round((frequencies - 220) / 660 * 256) % 256
+            return np.mean(codes == expected) * 100
+
+        print(f"  {algorithm:14s} lama: {legacy_time:7.3f} s ({accuracy(legacy):5.1f}% kode benar) | "
+              f"batch: {batch_time:7.3f} s ({accuracy(batch):5.1f}% kode benar) | "
+              f"x{legacy_time / batch_time:5.1f}")
+
+def bench_symbol_decoder(args):
+    """
+    Dekode simbol per segmen nada: STFT batch vs bank Goertzel 256 frekuensi
+    """
+    processor = AudioProcessor()
+    text = random_text(args.chars)
+    print(f"Dekode {args.chars} segmen nada")
+
+    for algorithm in ALGORITHMS:
+        for base_duration in [0.1, 0.03]:
+            result = processor.encrypt_to_audio(text, 7, base_duration=base_duration, algorithm=algorithm,
+                                               debug_chars=True)
+            audio = result['audio'].astype(np.float32)
+            segments = tone_segments(processor, result['metadata'], len(audio))
+            expected = np.array(result['metadata']['shifted_chars'])
+
+            stft_time, frequencies = best_time(
+                lambda: processor._estimate_dominant_frequencies(audio, segments, processor.sample_rate),
+                args.repeat)
+            goertzel_time, codes = best_time(
+                lambda: processor._goertzel_symbols(audio, segments, processor.sample_rate),
+                args.repeat)
+
+            stft_codes = np.round((frequencies - 220) / 660 * 256) % 256
+            print(f"  {algorithm:14s} {base_duration * 1000:3.0f} ms | "
+                  f"STFT: {stft_time:7.3f} s ({np.mean(stft_codes == expected) * 100:5.1f}% benar) | "
+                  f"Goertzel: {goertzel_time:7.3f} s ({np.mean(codes == expected) * 100:5.1f}% benar) | "
+                  f"x{stft_time / goertzel_time:5.1f}")
+
+def bench_stream_decode(args):
+    """
+    Dekripsi tanpa metadata: seluruh array vs StreamingDecoder per blok 100 ms
+    """
+    processor = AudioProcessor()
+    sample_rate = processor.sample_rate
+    for minutes in args.minutes:
+        audio = synthetic_capture(processor, minutes)
+        print(f"Rekaman {minutes:g} menit ({len(audio)} sampel float32)")
+
+        start = time.perf_counter()
+        expected = processor.decrypt_from_audio(audio, sample_rate, 7, metadata={})
+        batch_time = time.perf_counter() - start
+
+        decoder = StreamingDecoder(processor, sample_rate, 7)
+        block_size = sample_rate // 10
+        pieces = []
+        first_char = None
+        start = time.perf_counter()
+        for position in range(0, len(audio), block_size):
+            piece = decoder.feed(audio[position:position + block_size])
+            if piece and first_char is None:
+                first_char = time.perf_counter() - start
+            pieces.append(piece)
+        pieces.append(decoder.finish())
+        stream_time = time.perf_counter() - start
+
+        identical = ''.join(pieces) == expected
+        print(f"  batch: {batch_time:7.3f} s | stream: {stream_time:7.3f} s | "
+              f"karakter pertama: {first_char * 1000:6.1f} ms | {len(expected)} karakter | "
+              f"identik: {'ya' if identical else 'TIDAK'}")
+        del audio
+
+def bench_batch(args):
+    """
+    Enkripsi/dekripsi massal: satu proses vs BatchProcessor, dan pengiriman
+    audio lewat pickle vs shared memory
+    """
+    processor = AudioProcessor()
+    texts = [random_text(args.chars, seed) for seed in range(args.messages)]
+    print(f"{args.messages} pesan x {args.chars} karakter, {args.workers} worker (CPU: {os.cpu_count()})")
+
+    serial_time, expected = best_time(
+        lambda: [processor.encrypt_to_audio(text, 7) for text in texts], 1)
+    with BatchProcessor(max_workers=args.workers) as batch:
+        list(batch.encrypt_many(texts[:args.workers], 7))  # Memanaskan worker
+        batch_time, results = best_time(lambda: list(batch.encrypt_many(texts, 7)), 1)
+    identical = all(np.array_equal(a['audio'], b['audio']) for a, b in zip(expected, results))
+    print(f"  enkripsi  1 proses: {serial_time:7.3f} s | batch: {batch_time:7.3f} s | "
+          f"x{serial_time / batch_time:5.2f} | identik: {'ya' if identical else 'TIDAK'}")
+
+    items = [(result['audio'], result['sample_rate']) for result in results]
+    serial_time, expected = best_time(
+        lambda: [processor.decrypt_from_audio(audio, sample_rate, 7, metadata={}, method="goertzel")
+                 for audio, sample_rate in items], 1)
+    for label, threshold in [("pickle", float('inf')), ("shared memory", 0)]:
+        with BatchProcessor(max_workers=args.workers, shared_memory_threshold=threshold) as batch:
+            list(batch.decrypt_many(items[:args.workers], 7, method="goertzel"))
+            batch_time, texts_out = best_time(
+                lambda: list(batch.decrypt_many(items, 7, method="goertzel")), 1)
+        print(f"  dekripsi  1 proses: {serial_time:7.3f} s | batch ({label}): {batch_time:7.3f} s | "
+              f"x{serial_time / batch_time:5.2f} | identik: {'ya' if texts_out == expected else 'TIDAK'}")
+
+STARTUP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import audio_processor
+imported = time.perf_counter()
+processor = audio_processor.AudioProcessor()
+constructed = time.perf_counter()
+for _ in range(1000):
+    audio_processor.AudioProcessor()
+repeated = time.perf_counter()
+print(json.dumps({
+    'import': imported - start,
+    'construct': constructed - imported,
+    'construct_avg': (repeated - constructed) / 1000,
+    'modules': [name for name in ('pygame', 'PyQt5', 'matplotlib', 'scipy.signal') if name in sys.modules],
+}))
+"""
+
+def bench_startup(args):
+    """
+    Waktu impor dan konstruksi inti AudioProcessor di interpreter baru
+    """
+    runs = []
+    for _ in range(args.repeat):
+        output = subprocess.run([sys.executable, '-c', STARTUP_PROBE], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        runs.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    print(f"Startup inti ({args.repeat} interpreter baru, nilai terbaik)")
+    print(f"  impor audio_processor:      {min(run['import'] for run in runs) * 1000:8.1f} ms")
+    print(f"  AudioProcessor() pertama:   {min(run['construct'] for run in runs) * 1e6:8.1f} us")
+    print(f"  AudioProcessor() rata-rata: {min(run['construct_avg'] for run in runs) * 1e6:8.1f} us")
+    print(f"  modul berat yang dimuat:    {', '.join(runs[-1]['modules']) or 'tidak ada'}")
+
+def legacy_play_audio(audio_data, sample_rate):
+    """
+    Pemutaran lama: konversi penuh, tulis temp_audio.wav, lalu dimuat pygame
+    """
+    import pygame
+    audio_data = np.int16(np.asarray(audio_data) * 32767)
+    temp_file = "temp_audio.wav"
+    wav.write(temp_file, sample_rate, audio_data)
+    pygame.mixer.music.load(temp_file)
+    pygame.mixer.music.play()
+
+def bench_playback(args):
+    """
+    Waktu sampai suara pertama: temp_audio.wav vs pemutaran dari memori
+
+    Memakai pygame sungguhan; tanpa perangkat audio jalankan dengan
+    SDL_AUDIODRIVER=dummy.
+    """
+    try:
+        import pygame
+    except ImportError:
+        print("pygame tidak terpasang; benchmark playback dilewati")
+        return
+
+    processor = AudioProcessor()
+    processor.playback.mixer()  # Inisialisasi perangkat tidak ikut diukur
+    sample_rate = processor.sample_rate
+    for minutes in args.minutes:
+        audio = synthetic_capture(processor, minutes).astype(np.float64)
+        print(f"Sinyal {minutes:g} menit ({len(audio)} sampel)")
+
+        def legacy():
+            legacy_play_audio(audio, sample_rate)
+            pygame.mixer.music.stop()
+
+        def streamed():
+            processor.play_audio(audio, sample_rate)
+            processor.stop_audio()
+
+        legacy_time, _ = best_time(legacy, args.repeat)
+        stream_time, _ = best_time(streamed, args.repeat)
+        print(f"  temp_audio.wav: {legacy_time * 1000:8.1f} ms | memori: {stream_time * 1000:8.1f} ms | "
+              f"x{legacy_time / stream_time:6.1f}")
+        del audio
+
+    if os.path.exists("temp_audio.wav"):
+        os.remove("temp_audio.wav")
+
+def legacy_metadata(metadata):
+    """
+    Metadata dengan array diubah menjadi list, seperti hasil enkripsi lama
+    """
+    return {key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in metadata.items()}
+
+def bench_mapping(args):
+    """
+    Pemetaan karakter ke nada: loop lama + list debug vs array, waktu dan
+    puncak memori (tracemalloc)
+    """
+    processor = AudioProcessor()
+    text = random_text(args.chars) + ''.join(chr(code) for code in range(300))
+    print(f"Pemetaan {len(text)} karakter")
+
+    def traced(func):
+        tracemalloc.start()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, peak
+
+    for algorithm in ALGORITHMS:
+        def vector(debug_chars):
+            codes = processor._char_codes(text)
+            mapped = processor._map_characters(codes, 7, 220, 0.1, algorithm)
+            if debug_chars:
+                mapped += (codes, processor._shift_codes(codes, 7))
+            return mapped
+
+        legacy_time, expected = best_time(lambda: legacy_map_characters(text, 7, 220, 0.1, algorithm), args.repeat)
+        vector_time, actual = best_time(lambda: vector(True), args.repeat)
+        _, legacy_peak = traced(lambda: legacy_map_characters(text, 7, 220, 0.1, algorithm))
+        _, vector_peak = traced(lambda: vector(True))
+        _, lean_peak = traced(lambda: vector(False))
+
+        identical = all(np.array_equal(np.asarray(a), np.asarray(b)) for a, b in zip(expected, actual))
+        print(f"  {algorithm:14s} lama: {legacy_time * 1000:8.1f} ms | array: {vector_time * 1000:7.1f} ms | "
+              f"x{legacy_time / vector_time:5.1f} | identik: {'ya' if identical else 'TIDAK'}")
+        print(f"  {'':14s} memori lama: {legacy_peak / 2**20:7.1f} MB | array: {vector_peak / 2**20:6.1f} MB | "
+              f"tanpa list debug: {lean_peak / 2**20:6.1f} MB")
+
+def message_metadata(processor, text, key=7, algorithm="FSAE Standard"):
+    """
+    Metadata enkripsi lengkap tanpa mensintesis audionya, dalam bentuk lama
+    (list per karakter) seperti yang dulu ditulis ke JSON
+    """
+    metadata = processor._build_metadata(algorithm, 220, 0.1, len(text))
+    codes = processor._char_codes(text)
+    frequencies, durations, amplitudes = processor._map_characters(
+        codes, key, 220, 0.1, algorithm, metadata['freq_range'])
+    metadata['original_chars'] = codes
+    metadata['shifted_chars'] = processor._shift_codes(codes, key)
+    metadata['frequencies'] = frequencies
+    metadata['durations'] = durations
+    metadata['amplitudes'] = amplitudes
+    return legacy_metadata(metadata)
+
+def legacy_decrypt_with_metadata(key, metadata):
+    """
+    _decrypt_with_metadata lama: loop Python per frekuensi dengan text += chr()
+    """
+    base_freq = metadata.get('base_freq', 220)
+    freq_range = metadata.get('freq_range', 660)
+    text = ''
+    for freq in metadata.get('frequencies', []):
+        normalized_freq = (freq - base_freq) / freq_range
+        char_code = int(round(normalized_freq * 256))
+        text += chr((char_code - key) % 256)
+    return text
+
+def bench_metadata_decode(args):
+    """
+    Dekripsi dengan metadata: loop lama vs versi vektor, untuk list
+    frekuensi (hasil enkripsi/JSON) dan array float32 (metadata biner)
+    """
+    processor = AudioProcessor()
+    # Semua kode 0-255 ikut diuji, termasuk karakter di luar ASCII
+    text = random_text(args.chars) + ''.join(chr(code) for code in range(256))
+    metadata = message_metadata(processor, text, algorithm="FSAE Enhanced")
+    print(f"Dekripsi dengan metadata, {len(text)} karakter")
+
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path = os.path.join(directory, "binary.metadata")
+        write_metadata(binary_path, metadata)
+        cases = [("list", metadata), ("float32", read_metadata(binary_path))]
+
+        for label, case in cases:
+            legacy_time, expected = best_time(lambda: legacy_decrypt_with_metadata(7, case), 1)
+            vector_time, actual = best_time(lambda: processor._decrypt_with_metadata(7, case), args.repeat)
+            print(f"  {label:8s} lama: {legacy_time * 1000:9.1f} ms | vektor: {vector_time * 1000:8.1f} ms | "
+                  f"x{legacy_time / vector_time:6.1f} | identik: {'ya' if actual == expected else 'TIDAK'}")
+
+SHORT_MESSAGE_CHARS = 200
+
+def bench_metadata(args):
+    """
+    Ukuran dan waktu baca file .metadata: JSON lama vs format biner; lalu
+    simpan + muat dengan metadata terpisah vs disematkan di file WAV
+    """
+    processor = AudioProcessor()
+    print(f"Metadata {args.chars} karakter")
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "json.metadata")
+        binary_path = os.path.join(directory, "binary.metadata")
+
+        for algorithm in ALGORITHMS:
+            metadata = message_metadata(processor, random_text(args.chars), algorithm=algorithm)
+
+            def write_json():
+                with open(json_path, 'w') as f:
+                    json.dump(metadata, f, indent=2)
+
+            def read_json():
+                with open(json_path, 'r') as f:
+                    return json.load(f)
+
+            json_write, _ = best_time(write_json, args.repeat)
+            binary_write, _ = best_time(lambda: write_metadata(binary_path, metadata), args.repeat)
+            json_read, _ = best_time(read_json, args.repeat)
+            binary_read, loaded = best_time(lambda: read_metadata(binary_path), args.repeat)
+            mmap_read, mapped = best_time(lambda: read_metadata(binary_path, mmap=True), args.repeat)
+
+            # Dekripsi dengan metadata biner harus sama dengan metadata asli
+            expected = processor._decrypt_with_metadata(7, metadata)
+            identical = (processor._decrypt_with_metadata(7, loaded) == expected
+                         and processor._decrypt_with_metadata(7, mapped) == expected
+                         and read_metadata(json_path) == read_json())
+            json_size = os.path.getsize(json_path)
+            binary_size = os.path.getsize(binary_path)
+            del mapped
+
+            print(f"  {algorithm:14s} ukuran JSON: {json_size / 2**20:7.2f} MB | biner: {binary_size / 2**20:7.2f} MB | "
+                  f"x{json_size / binary_size:5.1f}")
+            print(f"  {'':14s} tulis JSON: {json_write * 1000:8.1f} ms | biner: {binary_write * 1000:8.1f} ms")
+            print(f"  {'':14s} baca JSON:  {json_read * 1000:8.1f} ms | biner: {binary_read * 1000:8.2f} ms | "
+                  f"mmap: {mmap_read * 1000:6.2f} ms | x{json_read / binary_read:6.1f} | "
+                  f"dekripsi identik: {'ya' if identical else 'TIDAK'}")
+
+    # Simpan + muat pesan pendek: metadata di file terpisah vs di dalam WAV
+    print(f"\nSimpan + muat pesan {SHORT_MESSAGE_CHARS} karakter")
+    result = processor.encrypt_to_audio(random_text(SHORT_MESSAGE_CHARS), 7)
+    with tempfile.TemporaryDirectory() as directory:
+        for storage in ["sidecar", "embedded"]:
+            file_path = os.path.join(directory, f"{storage}.wav")
+
+            def save():
+                processor.save_audio(file_path, result['audio'], result['sample_rate'], result['metadata'], storage)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                save_time, _ = best_time(save, args.repeat)
+                load_time, loaded = best_time(lambda: processor.load_audio(file_path), args.repeat)
+            files = len([name for name in os.listdir(directory) if name.startswith(storage)])
+            identical = processor._decrypt_with_metadata(7, loaded[2]) == \
+                processor._decrypt_with_metadata(7, result['metadata'])
+            print(f"  {storage:10s} file: {files} | simpan: {save_time * 1000:7.2f} ms | "
+                  f"muat: {load_time * 1000:7.2f} ms | metadata identik: {'ya' if identical else 'TIDAK'}")
+
+def bench_dtype(args):
+    """
+    Pipeline float64 vs float32: memori dan waktu enkripsi + simpan, lalu
+    regresi akurasi dekripsi dari file WAV: teks via metadata, dan kode
+    simbol per nada (segmen dari metadata) via STFT dan Goertzel
+    """
+    text = random_text(args.chars)
+    expected = np.array([(ord(c) + 7) % 256 for c in text])
+    print(f"dtype kerja, {args.chars} karakter")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for algorithm in ALGORITHMS:
+            decoded = {}
+            pcm = {}
+            for dtype in (np.float64, np.float32):
+                processor = AudioProcessor(tone_cache=None, dtype=dtype)
+                name = np.dtype(dtype).name
+                file_path = os.path.join(directory, f"{name}.wav")
+
+                tracemalloc.start()
+                start = time.perf_counter()
+                result = processor.encrypt_to_audio(text, 7, algorithm=algorithm)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    processor.save_audio(file_path, result['audio'], result['sample_rate'], result['metadata'])
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                signal_bytes = result['audio'].nbytes
+                del result
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    audio, sample_rate, metadata = processor.load_audio(file_path)
+                segments = tone_segments(processor, metadata, len(audio))
+                frequencies = processor._estimate_dominant_frequencies(audio, segments, sample_rate)
+                decoded[name] = [
+                    processor.decrypt_from_audio(audio, sample_rate, 7, metadata=metadata),
+                    np.round((frequencies - 220) / 660 * 256) % 256,
+                    processor._goertzel_symbols(audio, segments, sample_rate),
+                ]
+                pcm[name] = wav.read(file_path, mmap=True)[1]
+                text_accuracy = np.mean([a == b for a, b in zip(text, decoded[name][0])]) * 100
+                accuracy = (f"metadata {text_accuracy:5.1f}% | STFT {np.mean(decoded[name][1] == expected) * 100:5.1f}% | "
+                            f"Goertzel {np.mean(decoded[name][2] == expected) * 100:5.1f}%")
+                print(f"  {algorithm:14s} {name:7s} sinyal: {signal_bytes / 2**20:7.1f} MB | "
+                      f"puncak: {peak / 2**20:7.1f} MB | enkripsi + simpan: {elapsed:6.2f} s | {accuracy}")
+                del audio
+
+            differing = np.abs(pcm['float64'].astype(np.int32) - pcm['float32'])
+            same = (decoded['float64'][0] == decoded['float32'][0]
+                    and all(np.array_equal(a, b) for a, b in zip(decoded['float64'][1:], decoded['float32'][1:])))
+            print(f"  {'':14s} hasil dekripsi sama: {'ya' if same else 'TIDAK'} | "
+                  f"sampel WAV berbeda: {np.count_nonzero(differing)} (maks {differing.max(initial=0)} LSB)")
+            del pcm
+
+def legacy_spectrogram_data(audio, sample_rate, nperseg):
+    """
+    Data plot_spectrogram lama: STFT penuh dihitung ulang setiap kali
+    """
+    f, t, Sxx = signal.spectrogram(audio, fs=sample_rate, nperseg=nperseg)
+    return f, t, 10 * np.log10(Sxx + 1e-10)
+
+def legacy_spectrum_data(audio, sample_rate):
+    """
+    Data plot_frequency_analysis lama: FFT penuh dan pencarian 5 puncak
+    """
+    fft_data = np.abs(np.fft.rfft(audio))
+    freqs = np.fft.rfftfreq(len(audio), d=1/sample_rate)
+    fft_data = fft_data / np.max(fft_data)
+    peaks = []
+    for i in range(5):
+        idx = np.argmax(fft_data)
+        peaks.append((freqs[idx], fft_data[idx]))
+        fft_data[max(0, idx-5):min(len(fft_data), idx+5)] = 0
+    return peaks
+
+def bench_visual(args):
+    """
+    Data plot saat pengaturan visual diganti: hitung ulang STFT/FFT vs
+    memotong ulang hasil dari SpectrumCache; bentuk gelombang dengan semua
+    sampel vs envelope min/max (termasuk gambar ulang saat zoom)
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from visualizer import AudioVisualizer
+    processor = AudioProcessor()
+    settings = [("viridis", (0, 1000)), ("plasma", (0, 1000)), ("plasma", (200, 900)), ("jet", (0, 2000))]
+
+    for minutes in args.minutes:
+        audio = synthetic_capture(processor, minutes)
+        print(f"Audio {minutes:g} menit ({len(audio)} sampel), {len(settings)} pengaturan berturut-turut")
+
+        for nperseg in [1024, 4096]:
+            visualizer = AudioVisualizer()
+            legacy_time, _ = best_time(lambda: legacy_spectrogram_data(audio, processor.sample_rate, nperseg), 1)
+
+            start = time.perf_counter()
+            f, _, Sxx_db, _, _ = visualizer._spectrogram(audio, processor.sample_rate, nperseg)
+            cold_time = time.perf_counter() - start
+
+            def switch():
+                for _, freq_range in settings:
+                    f, _, Sxx_db, _, _ = visualizer._spectrogram(audio, processor.sample_rate, nperseg)
+                    Sxx_db[visualizer._band(f, freq_range)]
+            warm_time, _ = best_time(switch, args.repeat)
+            print(f"  spektrogram nperseg {nperseg:4d} lama: {legacy_time * len(settings):7.2f} s | "
+                  f"cache dingin: {cold_time:6.2f} s | cache hangat: {warm_time * 1000:6.2f} ms")
+
+        visualizer = AudioVisualizer()
+        legacy_time, _ = best_time(lambda: legacy_spectrum_data(audio, processor.sample_rate), 1)
+        start = time.perf_counter()
+        visualizer._spectrum(audio, processor.sample_rate)
+        cold_time = time.perf_counter() - start
+
+        def switch():
+            for _, freq_range in settings:
+                freqs, magnitude, peaks = visualizer._spectrum(audio, processor.sample_rate)
+                magnitude[visualizer._band(freqs, freq_range)]
+        warm_time, _ = best_time(switch, args.repeat)
+        print(f"  FFT                     lama: {legacy_time * len(settings):7.2f} s | "
+              f"cache dingin: {cold_time:6.2f} s | cache hangat: {warm_time * 1000:6.2f} ms")
+
+        # Bentuk gelombang: semua sampel vs envelope min/max dari piramida
+        def render(plot):
+            figure = Figure(figsize=(10, 4), dpi=100)
+            FigureCanvasAgg(figure)
+            start = time.perf_counter()
+            plot(figure)
+            figure.canvas.draw()
+            return figure, np.asarray(figure.canvas.buffer_rgba()).copy(), time.perf_counter() - start
+
+        def legacy_waveform(figure):
+            ax = figure.add_subplot(111)
+            ax.plot(np.arange(len(audio)) / processor.sample_rate, audio, color='#3498db')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.set_ylim(-1.1, 1.1)
+            figure.tight_layout()
+
+        def envelope_waveform(figure):
+            ax = figure.add_subplot(111)
+            visualizer._plot_envelope(ax, audio, processor.sample_rate, '#3498db')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.set_ylim(-1.1, 1.1)
+            figure.tight_layout()
+
+        visualizer = AudioVisualizer()
+        _, legacy_pixels, legacy_time = render(legacy_waveform)
+        _, _, cold_time = render(envelope_waveform)
+        figure, pixels, warm_time = render(envelope_waveform)
+        differing = (np.abs(legacy_pixels.astype(np.int16) - pixels).max(axis=2) > 32).mean()
+        line = figure.axes[0].lines[0]
+        print(f"  bentuk gelombang        lama: {legacy_time:7.2f} s ({len(audio)} titik) | "
+              f"piramida dingin: {cold_time:6.2f} s | hangat: {warm_time:6.3f} s "
+              f"({len(line.get_xdata())} titik) | piksel berbeda: {differing * 100:.2f}%")
+
+        ax = figure.axes[0]
+        for window in [0.05, 1.0, 30.0]:
+            start = time.perf_counter()
+            ax.set_xlim(10.0, 10.0 + window)
+            figure.canvas.draw()
+            print(f"    zoom {window:5.2f} s: {len(line.get_xdata()):5d} titik, "
+                  f"gambar ulang {(time.perf_counter() - start) * 1000:6.1f} ms")
+        del audio
+
+def bench_tiles(args):
+    """
+    Spektrogram di tab visual: pcolormesh gouraud dari STFT penuh vs imshow
+    dari piramida tile (bangun, ganti pengaturan, zoom/geser, buka ulang
+    dari file tile)
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from visualizer import AudioVisualizer
+    processor = AudioProcessor()
+    sample_rate = processor.sample_rate
+    settings = [("viridis", (0, 1000)), ("plasma", (0, 1000)), ("plasma", (200, 900)), ("jet", (0, 2000))]
+
+    def render(plot):
+        figure = Figure(figsize=(10, 4), dpi=100)
+        FigureCanvasAgg(figure)
+        start = time.perf_counter()
+        plot(figure)
+        figure.canvas.draw()
+        return figure, np.asarray(figure.canvas.buffer_rgba()).copy(), time.perf_counter() - start
+
+    for minutes in args.minutes:
+        audio = synthetic_capture(processor, minutes)
+        print(f"Audio {minutes:g} menit ({len(audio)} sampel), nperseg {args.nperseg}")
+
+        def legacy_plot(figure, colormap="viridis", freq_range=(0, 1000)):
+            # plot_spectrogram sebelum piramida tile
+            f, t, Sxx_db = legacy_spectrogram_data(audio, sample_rate, args.nperseg)
+            visualizer = AudioVisualizer()
+            band = visualizer._band(f, freq_range)
+            ax = figure.add_subplot(111)
+            pcm = ax.pcolormesh(t, f[band], Sxx_db[band], shading='gouraud', cmap=colormap,
+                                vmin=Sxx_db.min(), vmax=Sxx_db.max())
+            ax.set_ylabel('Frekuensi (Hz)')
+            ax.set_xlabel('Waktu (detik)')
+            ax.set_title('Spektrogram Audio')
+            ax.set_ylim(freq_range)
+            figure.colorbar(pcm, ax=ax, label='Intensitas (dB)')
+            info_text = (f"Durasi: {len(audio) / sample_rate:.2f} detik\nSample rate: {sample_rate} Hz\n"
+                         f"Resolusi: {args.nperseg} points")
+            ax.text(0.02, 0.95, info_text, transform=ax.transAxes,
+                    bbox=dict(facecolor='white', alpha=0.8), fontsize=8)
+            figure.tight_layout()
+
+        legacy_pixels = None
+        if minutes <= args.legacy_minutes:
+            tracemalloc.start()
+            _, legacy_pixels, legacy_time = render(legacy_plot)
+            legacy_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  lama (pcolormesh gouraud): {legacy_time:7.2f} s per gambar, "
+                  f"puncak memori {legacy_peak / 1e6:7.1f} MB")
+        else:
+            print(f"  lama (pcolormesh gouraud): dilewati (> {args.legacy_minutes:g} menit)")
+
+        with tempfile.TemporaryDirectory() as directory:
+            visualizer = AudioVisualizer(tile_dir=directory)
+
+            tracemalloc.start()
+            figure, pixels, cold_time = render(lambda figure: visualizer.plot_spectrogram(
+                audio, sample_rate, figure, resolution=args.nperseg))
+            cold_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            tile_file = visualizer.tile_file(visualizer.fingerprint(audio), args.nperseg)
+            print(f"  tile dingin (bangun + simpan): {cold_time:7.2f} s, puncak memori {cold_peak / 1e6:7.1f} MB, "
+                  f"file tile {os.path.getsize(tile_file) / 1e6:.1f} MB")
+
+            warm_times = []
+            for colormap, freq_range in settings:
+                _, _, elapsed = render(lambda figure: visualizer.plot_spectrogram(
+                    audio, sample_rate, figure, colormap, freq_range, args.nperseg))
+                warm_times.append(elapsed)
+            print(f"  tile hangat (ganti pengaturan): {np.mean(warm_times):7.3f} s per gambar")
+
+            if legacy_pixels is not None:
+                difference = np.abs(legacy_pixels.astype(np.int16) - pixels).max(axis=2)
+                print(f"  piksel berbeda dari gambar lama: {(difference > 32).mean() * 100:.2f}% "
+                      f"(rata-rata selisih {difference.mean():.1f} level)")
+
+            ax = figure.axes[0]
+            image = ax.images[0]
+            for window in [1.0, 10.0, 60.0]:
+                start = time.perf_counter()
+                ax.set_xlim(10.0, 10.0 + window)
+                figure.canvas.draw()
+                print(f"    zoom {window:5.1f} s: gambar {image.get_array().shape[1]:5d} kolom, "
+                      f"gambar ulang {(time.perf_counter() - start) * 1000:6.1f} ms")
+
+            reopened = AudioVisualizer(tile_dir=directory)
+            _, _, reopen_time = render(lambda figure: reopened.plot_spectrogram(
+                audio, sample_rate, figure, resolution=args.nperseg))
+            pyramid = reopened._spectrogram_tiles(audio, sample_rate, args.nperseg)
+            tiles = sum(-(-count // 512) for count in pyramid.frame_counts)
+            print(f"  buka ulang dari file tile: {reopen_time:7.3f} s "
+                  f"({len(pyramid._tiles)} dari {tiles} tile dibaca)")
+            pyramid.close()
+        del audio
+
+def bench_ui(args):
+    """
+    Responsivitas tab visual (Qt offscreen): waktu blok terlama di thread
+    GUI saat memuat file, mengganti pengaturan, dan menahan tombol panah
+    pada spinbox frekuensi, beserta jumlah render yang diminta, dijalankan
+    penjadwal, dikerjakan thread render, dan digambar
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    from ui_design import SonicCipherApp
+
+    window = SonicCipherApp()
+    window.resize(1200, 900)
+    window.show()
+    processor = window.audio_processor
+    scheduler = window.visual_scheduler
+    worker = window.render_worker
+
+    def pump(timeout=600):
+        # Jalankan event loop sampai debounce dan render tab visual selesai
+        start = time.perf_counter()
+        longest = 0.0
+        while ((scheduler.pending or 'visual' in window._render_handlers)
+               and time.perf_counter() - start < timeout):
+            event_start = time.perf_counter()
+            app.processEvents()
+            longest = max(longest, time.perf_counter() - event_start)
+            time.sleep(0.001)
+        return longest
+
+    def hold_key(spinbox, steps, interval=0.03):
+        # Tombol panah ditahan: satu langkah setiap interval detik
+        longest = 0.0
+        for _ in range(steps):
+            spinbox.stepBy(1)
+            deadline = time.perf_counter() + interval
+            while time.perf_counter() < deadline:
+                event_start = time.perf_counter()
+                app.processEvents()
+                longest = max(longest, time.perf_counter() - event_start)
+                time.sleep(0.001)
+        return longest
+
+    def counters():
+        return (scheduler.requested, scheduler.performed, scheduler.skipped,
+                worker.started_jobs, worker.delivered)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for minutes in args.minutes:
+            file_path = os.path.join(directory, f"{minutes:g}.wav")
+            audio = synthetic_capture(processor, minutes)
+            with contextlib.redirect_stdout(io.StringIO()):
+                processor.save_audio(file_path, audio, processor.sample_rate, None)
+            del audio
+            print(f"Audio {minutes:g} menit")
+
+            window.visual_file_path.setText(file_path)
+            freq_max = window.visual_freq_max
+
+            def timed(action):
+                # Aksi sinkron di thread GUI; durasinya juga dihitung sebagai blok
+                def run():
+                    start = time.perf_counter()
+                    action()
+                    return time.perf_counter() - start
+                return run
+
+            cases = [
+                ("buka file", timed(window.analyze_visual_file)),
+                ("ganti resolusi x4", timed(lambda: [window.visual_resolution.setCurrentIndex(index)
+                                                     for index in [0, 1, 2, 3]])),
+                ("tahan panah 1 s", lambda: hold_key(freq_max, 33)),
+                ("naik lalu turun", timed(lambda: (freq_max.stepBy(1), freq_max.stepBy(-1)))),
+                ("jenis: waveform", timed(lambda: window.visual_type.setCurrentIndex(1))),
+                ("colormap (waveform)", timed(lambda: window.visual_colormap.setCurrentIndex(2))),
+            ]
+            for name, action in cases:
+                before = counters()
+                start = time.perf_counter()
+                longest = max(action(), pump())
+                requested, performed, skipped, started, delivered = (
+                    after - previous for after, previous in zip(counters(), before))
+                print(f"  {name:20s} selesai {time.perf_counter() - start:6.2f} s | blok GUI terlama "
+                      f"{longest * 1000:6.1f} ms | diminta {requested:2d}, dijalankan {performed:2d}, "
+                      f"dilewati {skipped:2d}, dikerjakan {started:2d}, digambar {delivered:2d}")
+            window.reset_visualization()
+
+    print(f"Total penjadwal: {scheduler.stats()}")
+    window.close()
+
+BENCHMARKS = {
+    'synthesis': bench_synthesis,
+    'tone-cache': bench_tone_cache,
+    'save': bench_save,
+    'tone-detection': bench_tone_detection,
+    'segment-analysis': bench_segment_analysis,
+    'symbol-decoder': bench_symbol_decoder,
+    'stream-decode': bench_stream_decode,
+    'batch': bench_batch,
+    'startup': bench_startup,
+    'playback': bench_playback,
+    'metadata': bench_metadata,
+    'metadata-decode': bench_metadata_decode,
+    'mapping': bench_mapping,
+    'dtype': bench_dtype,
+    'visual': bench_visual,
+    'tiles': bench_tiles,
+    'ui': bench_ui,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SonicCipher")
+    parser.add_argument('name', choices=sorted(BENCHMARKS), help="Benchmark yang dijalankan")
+    parser.add_argument('--chars', type=int, default=5000, help="Jumlah karakter pesan uji")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan per pengukuran")
+    parser.add_argument('--messages', type=int, default=200, help="Jumlah pesan untuk benchmark batch")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Jumlah worker untuk benchmark batch")
+    parser.add_argument('--minutes', type=float, nargs='+', default=[10, 60],
+                        help="Durasi rekaman sintetis dalam menit")
+    parser.add_argument('--nperseg', type=int, default=1024, help="Resolusi spektrogram untuk benchmark tiles")
+    parser.add_argument('--legacy-minutes', type=float, default=10,
+                        help="Durasi maksimum untuk menggambar versi lama di benchmark tiles (memori)")
+    args = parser.parse_args()
+
+    BENCHMARKS[args.name](args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Aplikasi Kriptografi Teks ke Suara
+CLI - Mode baris perintah tanpa tampilan (tanpa PyQt5, pygame, matplotlib)
+
+Penggunaan:
+    python cli.py encrypt pesan/*.txt --key 7 --output-dir hasil/
+    python cli.py decrypt "hasil/*.wav" --key 7 --workers 4
+    find arsip -name "*.wav" | python cli.py analyze - --workers 8
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from audio_processor import METADATA_STORAGE, AudioProcessor
+
+ALGORITHMS = ["FSAE Standard", "FSAE Enhanced", "FSAE + AES"]
+
+DECRYPT_METHODS = ["auto", "metadata", "stft", "goertzel"]
+
+# Akhiran file hasil dekripsi; berbeda dari .txt agar file teks asal
+# (pesan.txt -> pesan.wav) tidak tertimpa
+DECRYPTED_SUFFIX = '.decrypted.txt'
+
+# Satu AudioProcessor per proses, dibuat saat pekerjaan pertama
+_processor = None
+
+def get_processor():
+    """
+    AudioProcessor tanpa pemutaran audio untuk proses ini
+    """
+    global _processor
+    if _processor is None:
+        _processor = AudioProcessor()
+    return _processor
+
+def expand_inputs(patterns):
+    """
+    Mengembangkan pola glob menjadi daftar file; "-" membaca daftar file
+    dari stdin (satu path per baris)
+    """
+    paths = []
+    for pattern in patterns:
+        if pattern == '-':
+            candidates = [line.strip() for line in sys.stdin if line.strip()]
+        else:
+            candidates = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        paths.extend(candidates)
+    return paths
+
+def output_path(input_path, output_dir, extension):
+    """
+    Path keluaran: nama file masukan dengan ekstensi baru, di output_dir
+    (atau di folder yang sama dengan file masukan)
+    """
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    directory = output_dir if output_dir else os.path.dirname(input_path)
+    return os.path.join(directory, stem + extension)
+
+def check_overwrite(target, options):
+    """
+    Menolak menimpa file yang sudah ada kecuali dengan --force
+    """
+    if os.path.exists(target) and not options.force:
+        raise FileExistsError(f"File keluaran sudah ada: {target} (gunakan --force untuk menimpa)")
+
+def encrypt_file(path, options):
+    """
+    Mengenkripsi satu file teks menjadi WAV beserta metadata
+    """
+    processor = get_processor()
+    target = output_path(path, options.output_dir, '.wav')
+    check_overwrite(target, options)
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    result = processor.encrypt_to_audio(text, options.key, options.base_freq,
+                                        options.duration / 1000.0, options.algorithm)
+    processor.save_audio(target, result['audio'], result['sample_rate'], result['metadata'],
+                         options.metadata_storage)
+
+    return {
+        'output': target,
+        'chars': len(text),
+        'audio_seconds': len(result['audio']) / result['sample_rate'],
+    }
+
+def decrypt_file(path, options):
+    """
+    Mendekripsi satu file WAV menjadi file teks
+    """
+    processor = get_processor()
+    target = output_path(path, options.output_dir, DECRYPTED_SUFFIX)
+    check_overwrite(target, options)
+    audio_data, sample_rate, metadata = processor.load_audio(path)
+
+    if options.method == "metadata" and metadata is None:
+        raise ValueError("File metadata tidak ditemukan")
+    if options.method in ("stft", "goertzel") or metadata is None:
+        # Analisis audio dengan parameter manual
+        metadata = {'base_freq': options.base_freq, 'freq_range': 660}
+    method = "goertzel" if options.method == "goertzel" else "stft"
+
+    text = processor.decrypt_from_audio(audio_data, sample_rate, options.key,
+                                        options.tolerance / 100.0, metadata, method)
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+    return {
+        'output': target,
+        'chars': len(text),
+        'audio_seconds': len(audio_data) / sample_rate,
+        'text': text if options.print_text else None,
+    }
+
+def analyze_file(path, options):
+    """
+    Ringkasan satu file WAV: durasi, level, segmen nada, dan metadata
+    """
+    processor = get_processor()
+    audio_data, sample_rate, metadata = processor.load_audio(path)
+
+    segments = processor._improved_tone_detection(audio_data, sample_rate)
+    segments = [(start, end) for start, end in segments if end - start > 10]
+    frequencies = processor._estimate_dominant_frequencies(audio_data, segments, sample_rate)
+    frequencies = frequencies[frequencies > 0]
+
+    summary = {
+        'audio_seconds': len(audio_data) / sample_rate,
+        'sample_rate': sample_rate,
+        'peak': float(abs(audio_data).max()) if len(audio_data) else 0.0,
+        'segments': len(segments),
+        'freq_min': float(frequencies.min()) if len(frequencies) else 0.0,
+        'freq_max': float(frequencies.max()) if len(frequencies) else 0.0,
+        'metadata': metadata is not None,
+        'chars': 0,
+    }
+    if metadata:
+        summary['chars'] = metadata.get('char_count', 0)
+        summary['algorithm'] = metadata.get('algorithm', 'Tidak diketahui')
+    return summary
+
+COMMANDS = {
+    'encrypt': encrypt_file,
+    'decrypt': decrypt_file,
+    'analyze': analyze_file,
+}
+
+def run_job(command, path, options):
+    """
+    Menjalankan satu pekerjaan dan mencatat waktunya; error tidak
+    menghentikan batch. Pesan print() dari AudioProcessor ditampung per file
+    agar tidak bercampur dengan baris laporan worker lain.
+    """
+    start = time.perf_counter()
+    messages = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(messages):
+            result = COMMANDS[command](path, options)
+        result['error'] = None
+    except Exception as e:
+        result = {'error': str(e), 'chars': 0, 'audio_seconds': 0.0}
+    result['path'] = path
+    result['messages'] = messages.getvalue().splitlines()
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def report_job(command, result, verbose=False):
+    """
+    Mencetak hasil satu file; dengan verbose, pesan pemrosesan file tersebut
+    dicetak di bawahnya
+    """
+    if result['error']:
+        print(f"[GAGAL] {result['path']}: {result['error']}")
+        report_messages(result, verbose)
+        return
+
+    line = f"[OK] {result['path']} ({result['seconds']:.3f} s)"
+    if command == 'analyze':
+        line += (f" | {result['audio_seconds']:.2f} s audio, {result['sample_rate']} Hz"
+                 f" | puncak {result['peak']:.3f} | {result['segments']} segmen"
+                 f" | {result['freq_min']:.1f}-{result['freq_max']:.1f} Hz"
+                 f" | metadata: {'ada' if result['metadata'] else 'tidak ada'}")
+        if result['metadata']:
+            line += f" ({result['algorithm']}, {result['chars']} karakter)"
+    else:
+        line += f" -> {result['output']} | {result['chars']} karakter, {result['audio_seconds']:.2f} s audio"
+    print(line)
+    report_messages(result, verbose)
+
+    if result.get('text') is not None:
+        print(result['text'])
+
+def report_messages(result, verbose):
+    """
+    Mencetak pesan AudioProcessor yang ditampung run_job
+    """
+    if verbose:
+        for message in result['messages']:
+            print(f"    {message}")
+
+def run_batch(command, paths, options):
+    """
+    Memproses semua file (paralel jika workers > 1) dan mencetak ringkasan
+    """
+    start = time.perf_counter()
+    results = []
+
+    if options.workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=options.workers) as executor:
+            jobs = [executor.submit(run_job, command, path, options) for path in paths]
+            for job in jobs:
+                results.append(job.result())
+                report_job(command, results[-1], options.verbose)
+    else:
+        for path in paths:
+            results.append(run_job(command, path, options))
+            report_job(command, results[-1], options.verbose)
+
+    elapsed = time.perf_counter() - start
+    succeeded = [result for result in results if not result['error']]
+    chars = sum(result['chars'] for result in succeeded)
+    audio_seconds = sum(result['audio_seconds'] for result in succeeded)
+
+    print(f"\nSelesai: {len(succeeded)}/{len(results)} file berhasil dalam {elapsed:.3f} s "
+          f"({options.workers} worker)")
+    if elapsed > 0:
+        print(f"Throughput: {len(succeeded) / elapsed:.2f} file/s | {chars / elapsed:.0f} karakter/s | "
+              f"{audio_seconds / elapsed:.1f} detik audio/s")
+    return len(succeeded) == len(results)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="SonicCipher tanpa tampilan")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_common(subparser, input_help):
+        subparser.add_argument('inputs', nargs='+', help=input_help + ' (pola glob, atau "-" untuk daftar dari stdin)')
+        subparser.add_argument('--workers', type=int, default=1, help="Jumlah proses paralel")
+        subparser.add_argument('--verbose', action='store_true', help="Tampilkan pesan pemrosesan tiap file")
+
+    encrypt = subparsers.add_parser('encrypt', help="Enkripsi file teks menjadi WAV")
+    add_common(encrypt, "File teks")
+    encrypt.add_argument('--key', type=int, default=7, help="Kunci enkripsi (1-25)")
+    encrypt.add_argument('--base-freq', type=int, default=220, help="Frekuensi dasar (Hz)")
+    encrypt.add_argument('--duration', type=int, default=100, help="Durasi dasar per karakter (ms)")
+    encrypt.add_argument('--algorithm', choices=ALGORITHMS, default=ALGORITHMS[0])
+    encrypt.add_argument('--output-dir', help="Folder keluaran (default: folder file masukan)")
+    encrypt.add_argument('--force', action='store_true', help="Timpa file WAV keluaran yang sudah ada")
+    encrypt.add_argument('--metadata', dest='metadata_storage', choices=METADATA_STORAGE, default="sidecar",
+                         help="embedded: metadata disimpan di dalam file WAV, tanpa file .metadata")
+
+    decrypt = subparsers.add_parser('decrypt', help="Dekripsi file WAV menjadi teks")
+    add_common(decrypt, "File WAV")
+    decrypt.add_argument('--key', type=int, default=7, help="Kunci dekripsi (1-25)")
+    decrypt.add_argument('--method', choices=DECRYPT_METHODS, default="auto",
+                         help="auto: metadata jika tersedia, selain itu analisis audio STFT")
+    decrypt.add_argument('--base-freq', type=int, default=220, help="Frekuensi dasar untuk analisis audio (Hz)")
+    decrypt.add_argument('--tolerance', type=int, default=5, help="Toleransi frekuensi (%%)")
+    decrypt.add_argument('--output-dir', help="Folder keluaran (default: folder file masukan)")
+    decrypt.add_argument('--force', action='store_true', help="Timpa file teks keluaran yang sudah ada")
+    decrypt.add_argument('--print', dest='print_text', action='store_true', help="Cetak teks hasil dekripsi")
+
+    analyze = subparsers.add_parser('analyze', help="Ringkasan analisis file WAV")
+    add_common(analyze, "File WAV")
+
+    return parser
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    paths = expand_inputs(options.inputs)
+    if not paths:
+        print("Tidak ada file masukan.")
+        return 1
+
+    if getattr(options, 'output_dir', None):
+        os.makedirs(options.output_dir, exist_ok=True)
+
+    return 0 if run_batch(options.command, paths, options) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
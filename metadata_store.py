@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Aplikasi Kriptografi Teks ke Suara
+Metadata Store - Format biner metadata enkripsi (file .metadata)
+
+Susunan format (little-endian):
+    prefix  : magic b'SCMD', versi (uint16), flag (uint16, 0), panjang header (uint32)
+    header  : JSON UTF-8 berisi nilai skalar metadata dan tabel array
+              {"fields": {...}, "arrays": {nama: [dtype, offset, jumlah]}}
+    array   : data array per karakter, masing-masing rata 8 byte; offset
+              dihitung dari awal blok metadata
+
+File .metadata lama (JSON) tetap dapat dibaca; jenisnya dikenali dari isi.
+"""
+
+import json
+import os
+import struct
+import numpy as np
+
+MAGIC = b'SCMD'
+VERSION = 1
+
+_PREFIX = struct.Struct('<4sHHI')
+_ALIGNMENT = 8
+
+# Tipe penyimpanan array per karakter. Frekuensi float32 tetap membedakan
+# setiap kode karakter (jarak antar kode > 2 Hz, galat float32 < 0.0001 Hz).
+# Durasi tetap float64: jumlah sampel per nada (ceil(durasi * sample_rate))
+# bergeser satu sampel jika durasi dibulatkan ke float32
+ARRAY_DTYPES = {
+    'frequencies': '<f4',
+    'durations': '<f8',
+    'amplitudes': '<f4',
+    'original_chars': '<u4',
+    'shifted_chars': 'u1',
+}
+
+def _json_default(value):
+    # Skalar/array numpy di nilai skalar metadata
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Tipe tidak dapat disimpan: {type(value).__name__}")
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+def encode_metadata(metadata):
+    """
+    Mengubah dict metadata menjadi bytes format biner
+    """
+    fields = {}
+    arrays = {}
+    for key, value in metadata.items():
+        if key in ARRAY_DTYPES and value is not None:
+            arrays[key] = np.asarray(value).astype(ARRAY_DTYPES[key], copy=False).ravel()
+        else:
+            fields[key] = value
+
+    # Offset array bergantung pada panjang header, dan sebaliknya; header
+    # disusun ulang sampai panjangnya stabil (biasanya dua kali)
+    header_size = 0
+    while True:
+        offset = _aligned(_PREFIX.size + header_size)
+        table = {}
+        for key, array in arrays.items():
+            table[key] = [array.dtype.str, offset, len(array)]
+            offset = _aligned(offset + array.nbytes)
+        header = json.dumps({'fields': fields, 'arrays': table}, default=_json_default).encode('utf-8')
+        if len(header) == header_size:
+            break
+        header_size = len(header)
+
+    parts = [_PREFIX.pack(MAGIC, VERSION, 0, len(header)), header]
+    position = _PREFIX.size + len(header)
+    for key, array in arrays.items():
+        start = table[key][1]
+        parts.append(b'\0' * (start - position))
+        parts.append(array.tobytes())
+        position = start + array.nbytes
+    parts.append(b'\0' * (_aligned(position) - position))
+    return b''.join(parts)
+
+def write_metadata(file_path, metadata):
+    """
+    Menyimpan metadata ke file dalam format biner
+
+    Ditulis ke file sementara lalu diganti, sehingga pembaca yang masih
+    memetakan file lama (mmap) tetap melihat isi lama yang utuh
+    """
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(encode_metadata(metadata))
+    os.replace(temp_path, file_path)
+
+def _read_header(f):
+    """
+    Membaca prefix dan header dari posisi file saat ini
+
+    Returns:
+        dict atau None: Header, atau None jika bukan format biner
+    """
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size or prefix[:4] != MAGIC:
+        return None
+
+    _, version, _, header_size = _PREFIX.unpack(prefix)
+    if version > VERSION:
+        raise ValueError(f"Versi metadata {version} tidak didukung (maksimum {VERSION})")
+    return json.loads(f.read(header_size).decode('utf-8'))
+
+def read_metadata(file_path, offset=0, mmap=False):
+    """
+    Membaca metadata biner mulai dari `offset`, atau file JSON lama
+
+    Hanya header yang di-parse. Dengan mmap=True array per karakter
+    dipetakan ke memori (np.memmap) dan baru dibaca dari disk saat diakses;
+    selain itu setiap array dibaca langsung sebagai blok biner.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        header = _read_header(f)
+        if header is None:
+            if offset:
+                raise ValueError("Blok metadata tidak valid")
+            # Format lama: JSON dengan list per karakter
+            f.seek(0)
+            return json.loads(f.read().decode('utf-8'))
+
+        metadata = dict(header['fields'])
+        for key, (dtype, start, count) in header['arrays'].items():
+            if count == 0:
+                metadata[key] = np.empty(0, dtype=dtype)
+            elif mmap:
+                metadata[key] = np.memmap(file_path, dtype=dtype, mode='r', offset=offset + start, shape=(count,))
+            else:
+                f.seek(offset + start)
+                array = np.fromfile(f, dtype=dtype, count=count)
+                if len(array) != count:
+                    raise ValueError("File metadata terpotong")
+                metadata[key] = array
+        return metadata
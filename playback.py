@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Aplikasi Kriptografi Teks ke Suara
+Playback - Backend pemutaran audio (pygame) yang diinisialisasi saat dibutuhkan
+"""
+
+import io
+import threading
+import numpy as np
+import scipy.io.wavfile as wav
+
+# Jumlah sampel potongan pertama; kecil agar suara cepat terdengar
+FIRST_CHUNK_SAMPLES = 1 << 13
+
+# Jumlah sampel potongan berikutnya yang diantrekan ke channel
+STREAM_CHUNK_SAMPLES = 1 << 16
+
+class PygamePlayback:
+    """
+    Pemutaran audio lewat pygame.mixer
+
+    pygame baru diimpor dan perangkat audio baru dibuka pada pemutaran
+    pertama, sehingga membuat objek ini (dan AudioProcessor) tidak
+    membutuhkan perangkat audio sama sekali.
+
+    Audio diputar langsung dari memori tanpa file sementara. Jika format
+    mixer cocok (mono 16-bit dengan sample rate yang sama), sinyal diubah
+    ke 16-bit per potongan: potongan pertama langsung diputar dan sisanya
+    diantrekan oleh thread pengumpan, sehingga pemutaran dimulai sebelum
+    seluruh sinyal dikonversi. Selain itu, WAV dibuat di memori (BytesIO)
+    dan mixer yang menyesuaikan formatnya.
+    """
+
+    def __init__(self, sample_rate=44100):
+        self.sample_rate = sample_rate
+        self._mixer = None
+        self._lock = threading.Lock()
+        self._channel = None
+        self._feeder = None
+        self._stop_event = threading.Event()
+
+    @property
+    def initialized(self):
+        return self._mixer is not None
+
+    def mixer(self):
+        """
+        Modul pygame.mixer yang sudah diinisialisasi (sekali per backend)
+        """
+        if self._mixer is None:
+            with self._lock:
+                if self._mixer is None:
+                    import pygame
+                    pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1)
+                    self._mixer = pygame.mixer
+        return self._mixer
+
+    def play(self, audio_data, sample_rate):
+        """
+        Memutar data audio; pemutaran sebelumnya dihentikan
+        """
+        mixer = self.mixer()
+        self.stop()
+
+        frequency, size, channels = mixer.get_init()
+        if frequency == sample_rate and size == -16 and channels == 1:
+            self._play_stream(mixer, audio_data)
+        else:
+            self._play_file_object(mixer, audio_data, sample_rate)
+
+    def _play_stream(self, mixer, audio_data):
+        """
+        Memutar potongan pertama lalu mengantrekan sisanya dari thread pengumpan
+        """
+        if self._channel is None:
+            self._channel = mixer.Channel(0)
+        channel = self._channel
+
+        first = self._sound(mixer, audio_data[:FIRST_CHUNK_SAMPLES])
+        channel.play(first)
+        if len(audio_data) <= FIRST_CHUNK_SAMPLES:
+            return
+
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+
+        def feed():
+            queued = [first]  # Referensi dijaga sampai potongan selesai diputar
+            for start in range(FIRST_CHUNK_SAMPLES, len(audio_data), STREAM_CHUNK_SAMPLES):
+                sound = self._sound(mixer, audio_data[start:start + STREAM_CHUNK_SAMPLES])
+
+                # Channel hanya menampung satu antrean; tunggu sampai kosong
+                while channel.get_queue() is not None:
+                    if stop_event.wait(0.01):
+                        return
+                if stop_event.is_set():
+                    return
+
+                if channel.get_busy():
+                    channel.queue(sound)
+                else:
+                    # Potongan sebelumnya sudah habis diputar
+                    channel.play(sound)
+                queued = queued[-1:] + [sound]
+
+        self._feeder = threading.Thread(target=feed, daemon=True)
+        self._feeder.start()
+
+    def _sound(self, mixer, samples):
+        """
+        Objek Sound dari potongan sinyal (dikonversi ke 16-bit)
+        """
+        pcm = np.int16(np.asarray(samples) * 32767)
+        return mixer.Sound(buffer=pcm.tobytes())
+
+    def _play_file_object(self, mixer, audio_data, sample_rate):
+        """
+        Cadangan: WAV 16-bit di memori, diputar oleh mixer.music
+        """
+        buffer = io.BytesIO()
+        wav.write(buffer, sample_rate, np.int16(np.asarray(audio_data) * 32767))
+        buffer.seek(0)
+        mixer.music.load(buffer, "wav")
+        mixer.music.play()
+
+    def stop(self):
+        """
+        Menghentikan pemutaran audio
+        """
+        self._stop_event.set()
+        if self._feeder is not None:
+            self._feeder.join()
+            self._feeder = None
+
+        if self._mixer is not None:
+            if self._channel is not None:
+                self._channel.stop()
+            if self._mixer.music.get_busy():
+                self._mixer.music.stop()
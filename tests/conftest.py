@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Fixture bersama untuk pengujian
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Modul aplikasi berada di direktori induk (bukan paket terpasang)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio_processor import AudioProcessor
+
+
+@pytest.fixture
+def processor():
+    return AudioProcessor(tone_cache=None)
+
+
+@pytest.fixture
+def capture(processor):
+    """
+    Membuat rekaman FSAE tanpa metadata: setiap karakter dienkripsi sebagai
+    satu nada lalu diikuti jeda hening, sehingga segmentasi menemukan satu
+    segmen per karakter
+    """
+    def make(text, key=7, gap_seconds=0.2, algorithm="FSAE Standard"):
+        gap = np.zeros(int(gap_seconds * processor.sample_rate), dtype=processor.dtype)
+        parts = []
+        for char in text:
+            parts.append(processor.encrypt_to_audio(char, key, algorithm=algorithm)['audio'])
+            parts.append(gap)
+        return np.concatenate(parts)
+    return make
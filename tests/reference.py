@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Data uji dan implementasi lama sebagai pembanding
+
+Dipakai oleh pengujian dan oleh benchmark.py.
+"""
+
+import numpy as np
+from scipy import signal
+
+ALGORITHMS = ["FSAE Standard", "FSAE Enhanced", "FSAE + AES"]
+
+def random_text(length, seed=0):
+    """
+    Membuat teks ASCII acak yang dapat dicetak
+    """
+    rng = np.random.default_rng(seed)
+    return ''.join(chr(code) for code in rng.integers(32, 127, length))
+
+def text_chunks(text, size=4096):
+    """
+    Memecah teks menjadi potongan untuk encoder streaming
+    """
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+def synthetic_capture(processor, minutes, algorithm="FSAE Standard", seed=0):
+    """
+    Membuat rekaman FSAE sintetis (float32) dengan durasi tertentu
+    
+    Setiap detik diakhiri jeda hening 250 ms seperti rekaman lapangan,
+    sehingga segmentasi menghasilkan banyak segmen.
+    """
+    chars = int(minutes * 60 / 0.1)
+    text = random_text(chars, seed)
+    blocks = processor.encrypt_to_audio_stream(text_chunks(text), 7, algorithm=algorithm,
+                                               block_size=1 << 20, dtype=np.float32)
+    audio = np.empty(int(chars * 0.1 * processor.sample_rate) + 1, dtype=np.float32)
+    position = 0
+    for block in blocks:
+        audio[position:position + len(block)] = block
+        position += len(block)
+    audio = audio[:position]
+
+    seconds = len(audio) // processor.sample_rate
+    pauses = audio[:seconds * processor.sample_rate].reshape(seconds, processor.sample_rate)
+    pauses[:, int(0.75 * processor.sample_rate):] = 0
+    return audio
+
+def legacy_tone_detection(audio_data, sample_rate):
+    """
+    Segmentasi lama: daftar frame Python dan energi per frame
+    """
+    frame_length = int(0.02 * sample_rate)
+    hop_length = int(0.01 * sample_rate)
+
+    frames = []
+    for i in range(0, len(audio_data) - frame_length, hop_length):
+        frames.append(audio_data[i:i+frame_length])
+    energy = np.array([np.sum(frame**2) for frame in frames])
+    if np.max(energy) > 0:
+        energy = energy / np.max(energy)
+
+    active_frames = energy > 0.1
+    transitions = np.diff(active_frames.astype(int))
+    segment_starts = np.where(transitions == 1)[0]
+    segment_ends = np.where(transitions == -1)[0]
+    if len(segment_starts) > len(segment_ends):
+        segment_ends = np.append(segment_ends, len(active_frames) - 1)
+    elif len(segment_starts) < len(segment_ends):
+        segment_starts = np.insert(segment_starts, 0, 0)
+
+    segments = []
+    for start, end in zip(segment_starts, segment_ends):
+        sample_end = min((end + 1) * hop_length + frame_length, len(audio_data))
+        segments.append((start * hop_length, sample_end))
+
+    if segments:
+        merged_segments = [segments[0]]
+        for current_start, current_end in segments[1:]:
+            prev_start, prev_end = merged_segments[-1]
+            if current_start - prev_end < frame_length:
+                merged_segments[-1] = (prev_start, current_end)
+            else:
+                merged_segments.append((current_start, current_end))
+        return merged_segments
+    return segments
+
+def legacy_dominant_frequency(audio_segment, sample_rate):
+    """
+    Estimasi frekuensi lama: satu STFT per segmen, hasil di tengah bin
+    """
+    if len(audio_segment) < 100:
+        return 0
+
+    nperseg = min(1024, len(audio_segment))
+    f, t, Zxx = signal.stft(audio_segment, fs=sample_rate, nperseg=nperseg)
+    magnitude = np.mean(np.abs(Zxx), axis=1)
+    freq_mask = (f >= 200) & (f <= 1000)
+    return f[freq_mask][np.argmax(magnitude[freq_mask])]
+
+def tone_segments(processor, metadata, n_samples):
+    """
+    Segmen (start, end) setiap nada karakter berdasarkan metadata
+    """
+    lengths = processor._tone_lengths(metadata['durations'])
+    ends = np.minimum(np.cumsum(lengths), n_samples)
+    starts = np.concatenate(([0], ends[:-1]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def legacy_map_characters(text, key, base_freq, base_duration, algorithm, freq_range=660):
+    """
+    _map_characters lama beserta list debug: loop Python per karakter
+    """
+    frequencies = []
+    durations = []
+    amplitudes = []
+    for i, char in enumerate(text):
+        shifted_code = (ord(char) + key) % 256
+        frequencies.append(base_freq + (shifted_code / 256) * freq_range)
+        if algorithm == "FSAE Enhanced":
+            durations.append(base_duration + (i % 5) * 0.05)
+        elif algorithm == "FSAE + AES":
+            durations.append(base_duration + (((i * key) % 10) / 100))
+        else:
+            durations.append(base_duration)
+        if algorithm in ["FSAE Enhanced", "FSAE + AES"]:
+            amplitudes.append(0.4 + (shifted_code % 50) / 100)
+        else:
+            amplitudes.append(0.5)
+    original_chars = [ord(c) for c in text]
+    shifted_chars = [(ord(c) + key) % 256 for c in text]
+    return frequencies, durations, amplitudes, original_chars, shifted_chars
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - BatchProcessor: urutan hasil, batas pekerjaan tertunda, dan
+pembersihan shared memory
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from batch_processor import BatchProcessor
+
+TEXTS = [f"Pesan nomor {index}" for index in range(12)]
+
+
+@pytest.fixture
+def batch():
+    # Ambang 0: semua audio dikirim lewat shared memory
+    with BatchProcessor(max_workers=2, shared_memory_threshold=0) as batch:
+        yield batch
+
+
+def shm_blocks():
+    return set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+
+def test_encrypt_and_decrypt_many_match_serial(processor, batch):
+    expected = [processor.encrypt_to_audio(text, 7) for text in TEXTS]
+
+    results = list(batch.encrypt_many(TEXTS, 7))
+    for result, reference in zip(results, expected):
+        np.testing.assert_array_equal(result['audio'], reference['audio'])
+
+    items = [(result['audio'], result['sample_rate'], result['metadata']) for result in results]
+    assert list(batch.decrypt_many(items, 7)) == TEXTS
+
+    unordered = dict(batch.decrypt_many(items, 7, ordered=False))
+    assert [unordered[index] for index in range(len(TEXTS))] == TEXTS
+
+
+def test_submits_lazily_within_window(batch):
+    pulled = []
+
+    def texts():
+        for text in TEXTS:
+            pulled.append(text)
+            yield text
+
+    results = batch.encrypt_many(texts(), 7)
+    next(results)
+    # Hasil pertama diambil: satu pekerjaan diganti dengan pekerjaan berikutnya
+    assert len(pulled) <= batch.max_pending + 1
+    results.close()
+    assert len(pulled) <= batch.max_pending + 1
+
+
+def test_closing_early_releases_shared_memory(batch):
+    before = shm_blocks()
+    results = batch.encrypt_many(TEXTS, 7)
+    next(results)
+    results.close()
+    batch.close()
+
+    # Hasil yang sedang berjalan dilepas lewat callback saat selesai
+    deadline = time.time() + 10
+    while shm_blocks() - before and time.time() < deadline:
+        time.sleep(0.05)
+    assert not shm_blocks() - before
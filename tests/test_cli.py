@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - CLI: file keluaran yang sudah ada dan pesan per file
+"""
+
+import cli
+
+
+def write_texts(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"pesan{index}.txt"
+        path.write_text(f"Pesan {index}", encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+def test_existing_output_rejected_before_encrypting(tmp_path, monkeypatch, capsys):
+    path, = write_texts(tmp_path, 1)
+    (tmp_path / "pesan0.wav").write_bytes(b"lama")
+
+    def encrypt_to_audio(*args, **kwargs):
+        raise AssertionError("audio disintesis untuk file yang akan ditolak")
+    monkeypatch.setattr(cli.get_processor(), 'encrypt_to_audio', encrypt_to_audio)
+
+    assert cli.main(['encrypt', path]) == 1
+    assert "--force" in capsys.readouterr().out
+    assert (tmp_path / "pesan0.wav").read_bytes() == b"lama"
+
+
+def test_processor_messages_follow_their_report_line(tmp_path, capsys):
+    paths = write_texts(tmp_path, 4)
+    assert cli.main(['encrypt', *paths]) == 0
+    capsys.readouterr()
+
+    wavs = [str(tmp_path / f"pesan{index}.wav") for index in range(4)]
+    assert cli.main(['decrypt', *wavs, '--workers', '2']) == 0
+    assert "Metadata berhasil dimuat" not in capsys.readouterr().out
+
+    assert cli.main(['decrypt', *wavs, '--workers', '2', '--force', '--verbose']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    for wav in wavs:
+        index = lines.index(next(line for line in lines if line.startswith(f"[OK] {wav} ")))
+        assert lines[index + 1] == f"    Metadata berhasil dimuat dari {wav}.metadata"
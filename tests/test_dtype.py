@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Regresi akurasi dekripsi untuk dtype kerja float32 vs float64
+"""
+
+import numpy as np
+import pytest
+import scipy.io.wavfile as wav
+
+from audio_processor import AudioProcessor
+from tests.reference import ALGORITHMS, random_text, tone_segments
+
+KEY = 7
+
+
+def decode_all(dtype, text, algorithm, file_path):
+    """
+    Enkripsi, simpan, muat ulang, lalu dekripsi dengan semua jalur: teks via
+    metadata, kode per nada via STFT dan Goertzel, dan teks tanpa metadata
+    """
+    processor = AudioProcessor(tone_cache=None, dtype=dtype)
+    result = processor.encrypt_to_audio(text, KEY, algorithm=algorithm)
+    assert result['audio'].dtype == np.dtype(dtype)
+    processor.save_audio(file_path, result['audio'], result['sample_rate'], result['metadata'])
+
+    audio, sample_rate, metadata = processor.load_audio(file_path)
+    assert audio.dtype == np.dtype(dtype)
+    segments = tone_segments(processor, metadata, len(audio))
+    frequencies = processor._estimate_dominant_frequencies(audio, segments, sample_rate)
+    return {
+        'metadata': processor.decrypt_from_audio(audio, sample_rate, KEY, metadata=metadata),
+        'stft': np.round((frequencies - 220) / 660 * 256) % 256,
+        'goertzel': processor._goertzel_symbols(audio, segments, sample_rate),
+    }
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_float32_decodes_like_float64(tmp_path, algorithm):
+    text = random_text(200)
+    expected = np.array([(ord(char) + KEY) % 256 for char in text])
+
+    decoded = {dtype: decode_all(dtype, text, algorithm, str(tmp_path / f"{np.dtype(dtype).name}.wav"))
+               for dtype in (np.float64, np.float32)}
+
+    for result in decoded.values():
+        assert result['metadata'] == text
+        np.testing.assert_array_equal(result['stft'], expected)
+        np.testing.assert_array_equal(result['goertzel'], expected)
+
+    # Sampel WAV paling banyak berbeda 1 LSB karena pembulatan float32
+    pcm64 = wav.read(str(tmp_path / "float64.wav"))[1].astype(np.int32)
+    pcm32 = wav.read(str(tmp_path / "float32.wav"))[1].astype(np.int32)
+    assert np.abs(pcm64 - pcm32).max() <= 1
+
+
+def test_decrypt_without_metadata_matches_across_dtypes(capture):
+    text = "Float32 vs float64"
+    audio = capture(text)
+    for dtype in (np.float64, np.float32):
+        processor = AudioProcessor(tone_cache=None, dtype=dtype)
+        signal = audio.astype(dtype)
+        for method in ("stft", "goertzel"):
+            assert processor.decrypt_from_audio(signal, processor.sample_rate, KEY, metadata={},
+                                                method=method) == text
+
+
+def test_rejects_non_float_dtype():
+    with pytest.raises(ValueError):
+        AudioProcessor(dtype=np.int16)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Dekripsi tanpa metadata langsung dari LazyAudio (memmap)
+"""
+
+import numpy as np
+import pytest
+import scipy.io.wavfile as wav
+
+from audio_processor import LazyAudio
+
+
+@pytest.mark.parametrize('method', ["stft", "goertzel"])
+def test_decrypts_without_loading_whole_file(processor, capture, tmp_path, monkeypatch, method):
+    text = "Audio besar"
+    file_path = str(tmp_path / "rekaman.wav")
+    wav.write(file_path, processor.sample_rate, np.int16(capture(text) * 32767))
+
+    audio, sample_rate, metadata = processor.load_audio(file_path)
+    expected = processor.decrypt_from_audio(audio, sample_rate, 7, metadata=metadata, method=method)
+
+    lazy, sample_rate, metadata = processor.load_audio(file_path, lazy=True)
+    assert isinstance(lazy, LazyAudio)
+    assert metadata is None
+
+    # Seluruh file tidak boleh diubah menjadi satu array
+    def whole_file(self):
+        raise AssertionError("LazyAudio dimuat penuh")
+    monkeypatch.setattr(LazyAudio, 'to_array', whole_file)
+
+    assert processor.decrypt_from_audio(lazy, sample_rate, 7, metadata=metadata, method=method) == expected == text
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Pemetaan karakter ke nada berbasis array dibandingkan loop lama
+"""
+
+import numpy as np
+import pytest
+
+from tests.reference import ALGORITHMS, legacy_map_characters, random_text
+
+# Termasuk karakter di luar BMP dan surrogate tunggal (mis. dari nama file
+# yang didekode dengan surrogateescape)
+TEXT = random_text(200) + ''.join(chr(code) for code in range(300)) + "é😀\ud800x\udfff"
+
+
+def test_char_codes_match_ord(processor):
+    np.testing.assert_array_equal(processor._char_codes(TEXT), [ord(char) for char in TEXT])
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_matches_legacy_mapping(processor, algorithm):
+    codes = processor._char_codes(TEXT)
+    actual = processor._map_characters(codes, 7, 220, 0.1, algorithm) + (codes, processor._shift_codes(codes, 7))
+    expected = legacy_map_characters(TEXT, 7, 220, 0.1, algorithm)
+    for a, b in zip(actual, expected):
+        np.testing.assert_array_equal(np.asarray(a), np.asarray(b))
+
+
+def test_encrypts_lone_surrogates(processor):
+    result = processor.encrypt_to_audio("a\ud800b", 7, debug_chars=True)
+    assert result['metadata']['original_chars'].tolist() == [ord('a'), 0xD800, ord('b')]
+    assert len(result['metadata']['frequencies']) == 3
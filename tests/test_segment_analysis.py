@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Estimasi frekuensi dominan batch dibandingkan STFT per segmen
+"""
+
+import numpy as np
+import pytest
+
+from tests.reference import ALGORITHMS, legacy_dominant_frequency, random_text, tone_segments
+
+KEY = 7
+
+
+def encrypted_segments(processor, algorithm, chars=120, base_duration=0.1):
+    result = processor.encrypt_to_audio(random_text(chars), KEY, base_duration=base_duration,
+                                        algorithm=algorithm, debug_chars=True)
+    audio = result['audio']
+    segments = tone_segments(processor, result['metadata'], len(audio))
+    return audio, segments, np.array(result['metadata']['shifted_chars'])
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_batch_estimate_decodes_every_symbol(processor, algorithm):
+    audio, segments, expected = encrypted_segments(processor, algorithm)
+    frequencies = processor._estimate_dominant_frequencies(audio, segments, processor.sample_rate)
+    np.testing.assert_array_equal(np.round((frequencies - 220) / 660 * 256) % 256, expected)
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_batch_estimate_keeps_legacy_peak_bin(processor, algorithm):
+    # Interpolasi parabola hanya menggeser estimasi di dalam bin puncak lama
+    audio, segments, _ = encrypted_segments(processor, algorithm)
+    sample_rate = processor.sample_rate
+    frequencies = processor._estimate_dominant_frequencies(audio, segments, sample_rate)
+
+    for (start, end), frequency in zip(segments, frequencies):
+        legacy = legacy_dominant_frequency(audio[start:end], sample_rate)
+        bin_width = sample_rate / min(1024, end - start)
+        assert abs(frequency - legacy) <= bin_width / 2 + 1e-6
+
+
+def test_single_segment_matches_batch(processor):
+    audio, segments, _ = encrypted_segments(processor, "FSAE Enhanced", chars=20)
+    frequencies = processor._estimate_dominant_frequencies(audio, segments, processor.sample_rate)
+    for (start, end), frequency in zip(segments, frequencies):
+        assert processor._get_dominant_frequency(audio[start:end], processor.sample_rate) == pytest.approx(frequency)
+
+
+def test_short_segments_yield_zero(processor):
+    audio = np.zeros(1000, dtype=processor.dtype)
+    assert processor._get_dominant_frequency(audio[:50], processor.sample_rate) == 0
+    frequencies = processor._estimate_dominant_frequencies(audio, [(0, 50), (100, 150)], processor.sample_rate)
+    np.testing.assert_array_equal(frequencies, [0, 0])
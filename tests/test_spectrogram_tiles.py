@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - File tile spektrogram ditutup saat piramida keluar dari cache
+"""
+
+import numpy as np
+
+from visualizer import AudioVisualizer, SpectrogramPyramid, SpectrumCache
+
+
+def test_evicted_pyramid_closes_and_reopens_archive(processor, tmp_path):
+    audio = processor.encrypt_to_audio("Tile spektrogram", 7)['audio']
+    fingerprint = AudioVisualizer().fingerprint(audio)
+    built = SpectrogramPyramid.from_audio(audio, processor.sample_rate, 1024, fingerprint=fingerprint)
+    file_path = str(tmp_path / "tiles.npz")
+    built.save(file_path)
+
+    pyramid = SpectrogramPyramid.load(file_path)
+    cache = SpectrumCache(max_bytes=pyramid.nbytes)
+    cache.put('a', pyramid)
+    cache.put('b', np.zeros(pyramid.nbytes, dtype=np.uint8))
+    assert cache.get('a') is None
+    assert pyramid._archive is None
+
+    # Plot yang masih memakai piramida membaca tile dari file lagi
+    band = slice(None)
+    image, _ = pyramid.view(pyramid.start_time, pyramid.end_time, band, 100)
+    expected, _ = built.view(built.start_time, built.end_time, band, 100)
+    np.testing.assert_array_equal(image, expected)
+    pyramid.close()
+
+
+def test_visualizer_cache_clear_closes_loaded_tiles(processor, tmp_path):
+    audio = processor.encrypt_to_audio("Tile dari disk", 7)['audio']
+    AudioVisualizer(tile_dir=str(tmp_path))._spectrogram_tiles(audio, processor.sample_rate, 1024)
+
+    visualizer = AudioVisualizer(tile_dir=str(tmp_path))
+    pyramid = visualizer._spectrogram_tiles(audio, processor.sample_rate, 1024)
+    assert pyramid._archive is not None
+    visualizer.cache.clear()
+    assert pyramid._archive is None
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Pengujian StreamingDecoder dibandingkan dekripsi batch
+"""
+
+import numpy as np
+
+from audio_processor import StreamingDecoder
+
+TEXT = "Hello streaming world"
+
+
+def stream_decode(processor, audio, key=7, block_seconds=0.1):
+    decoder = StreamingDecoder(processor, processor.sample_rate, key)
+    block_size = int(block_seconds * processor.sample_rate)
+    pieces = [decoder.feed(audio[start:start + block_size]) for start in range(0, len(audio), block_size)]
+    pieces.append(decoder.finish())
+    return ''.join(pieces)
+
+
+def batch_decode(processor, audio, key=7):
+    return processor.decrypt_from_audio(audio, processor.sample_rate, key, metadata={})
+
+
+def test_constant_amplitude_matches_batch(processor, capture):
+    audio = capture(TEXT)
+    assert batch_decode(processor, audio) == TEXT
+    assert stream_decode(processor, audio) == TEXT
+
+
+def test_block_size_does_not_change_result(processor, capture):
+    audio = capture(TEXT)
+    for block_seconds in (0.013, 0.1, 1.0):
+        assert stream_decode(processor, audio, block_seconds=block_seconds) == TEXT
+
+
+def test_falling_amplitude_matches_batch(processor, capture):
+    audio = capture(TEXT)
+    audio = audio * np.linspace(1.0, 0.1, len(audio), dtype=audio.dtype)
+    assert stream_decode(processor, audio) == batch_decode(processor, audio)
+
+
+def test_rising_amplitude_uses_running_maximum(processor, capture):
+    # Normalisasi dengan maksimum berjalan: nada pelan di awal tetap dikenali,
+    # sedangkan batch membuangnya karena dibandingkan dengan bagian terkeras
+    audio = capture(TEXT)
+    audio = audio * np.linspace(0.1, 1.0, len(audio), dtype=audio.dtype)
+
+    streamed = stream_decode(processor, audio)
+    batch = batch_decode(processor, audio)
+
+    assert streamed == TEXT
+    assert batch != streamed
+    assert TEXT.endswith(batch)
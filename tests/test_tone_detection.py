@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Segmentasi nada berlangkah dibandingkan implementasi lama
+"""
+
+import numpy as np
+
+from tests.reference import legacy_tone_detection, synthetic_capture
+
+
+def legacy_segments(audio, sample_rate):
+    return [tuple(map(int, segment)) for segment in legacy_tone_detection(audio, sample_rate)]
+
+
+def test_matches_legacy_on_synthetic_capture(processor):
+    # Dipotong ke detik penuh agar rekaman berakhir di jeda: implementasi
+    # lama salah memasangkan awal/akhir jika nada aktif di kedua ujung
+    audio = synthetic_capture(processor, 0.25)
+    audio = audio[:len(audio) // processor.sample_rate * processor.sample_rate]
+    segments = processor._improved_tone_detection(audio, processor.sample_rate)
+    assert len(segments) > 10
+    assert segments == legacy_segments(audio, processor.sample_rate)
+
+
+def test_matches_legacy_with_leading_silence_and_short_gaps(processor, capture):
+    sample_rate = processor.sample_rate
+    # Jeda 15 ms lebih pendek dari satu frame sehingga segmen digabung
+    for gap_seconds in (0.015, 0.05, 0.2):
+        audio = np.concatenate((np.zeros(sample_rate // 4, dtype=processor.dtype),
+                                capture("Segmen", gap_seconds=gap_seconds)))
+        segments = processor._improved_tone_detection(audio, sample_rate)
+        assert segments == legacy_segments(audio, sample_rate)
+
+
+def test_one_segment_per_tone(processor, capture):
+    audio = capture("Segmen")
+    assert len(processor._improved_tone_detection(audio, processor.sample_rate)) == len("Segmen")
+
+
+def test_silence_and_short_audio(processor):
+    sample_rate = processor.sample_rate
+    assert processor._improved_tone_detection(np.zeros(sample_rate, dtype=processor.dtype), sample_rate) == []
+    assert processor._improved_tone_detection(np.zeros(10, dtype=processor.dtype), sample_rate) == []
+
+
+def test_segment_active_at_both_ends(processor):
+    # Nada dari sampel pertama sampai terakhir: satu segmen yang mencakup
+    # seluruh sinyal (implementasi lama tidak menghasilkan segmen di sini)
+    sample_rate = processor.sample_rate
+    audio = np.sin(2 * np.pi * 440 * np.arange(sample_rate) / sample_rate).astype(processor.dtype)
+    assert processor._improved_tone_detection(audio, sample_rate) == [(0, sample_rate)]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SonicCipher - Penulisan WAV bertahap: file selesai, dibatalkan, atau gagal
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from audio_processor import OperationCancelled, WavStreamWriter
+
+
+def test_written_file_round_trips(processor, tmp_path):
+    file_path = str(tmp_path / "pesan.wav")
+    result = processor.encrypt_to_audio("Halo", 7)
+    processor.save_audio(file_path, result['audio'], result['sample_rate'], result['metadata'], "both")
+
+    audio, sample_rate, metadata = processor.load_audio(file_path)
+    assert sample_rate == result['sample_rate']
+    assert len(audio) == len(result['audio'])
+    assert processor.decrypt_from_audio(audio, sample_rate, 7, metadata=metadata) == "Halo"
+    assert not os.path.exists(file_path + ".tmp")
+
+
+def test_error_keeps_existing_file(processor, tmp_path):
+    file_path = str(tmp_path / "pesan.wav")
+    result = processor.encrypt_to_audio("Lama", 7)
+    processor.save_audio(file_path, result['audio'], result['sample_rate'], result['metadata'])
+    with open(file_path, 'rb') as f:
+        original = f.read()
+
+    def cancelled_text():
+        yield "x" * 5000
+        raise OperationCancelled()
+
+    with pytest.raises(OperationCancelled):
+        processor.save_audio_stream(file_path, processor.encrypt_to_audio_stream(
+            cancelled_text(), 7, block_size=4096, summaries=True))
+
+    with open(file_path, 'rb') as f:
+        assert f.read() == original
+    assert not os.path.exists(file_path + ".tmp")
+
+
+def test_error_leaves_no_partial_file(tmp_path):
+    file_path = str(tmp_path / "baru.wav")
+    with pytest.raises(RuntimeError):
+        with WavStreamWriter(file_path, 44100, metadata={'char_count': 0}) as writer:
+            writer.write(np.zeros(1000))
+            raise RuntimeError("gagal")
+
+    assert os.listdir(tmp_path) == []
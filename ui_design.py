@@ -6,6 +6,9 @@ UI Design - Antarmuka pengguna utama
 """
 
 import os
+import threading
+import time
+from collections import OrderedDict
 import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QTabWidget, QLabel, QLineEdit, QTextEdit, 
@@ -14,22 +17,66 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QComboBox, QCheckBox, QInputDialog, QToolTip, 
                             QStatusBar, QAction, QMenu, QToolBar, QFrame,
                             QRadioButton, QButtonGroup, QSizePolicy, QApplication)  # Tambahkan QApplication di sini
-from PyQt5.QtCore import Qt, QUrl, QSize, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, QUrl, QSize, QThread, QObject, pyqtSignal, QTimer
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QPalette, QColor, QDesktopServices
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib
 matplotlib.use('Qt5Agg')
 
-from audio_processor import AudioProcessor
+from audio_processor import AudioProcessor, AudioAssetCache, OperationCancelled
 from visualizer import AudioVisualizer
 from utils import create_icon_button, set_dark_theme, create_separator
 
-class EncryptionThread(QThread):
-    """Thread terpisah untuk proses enkripsi"""
-    finished = pyqtSignal(dict)
+class ProcessingThread(QThread):
+    """Dasar thread enkripsi/dekripsi dengan progress nyata dan pembatalan"""
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
+    cancelled = pyqtSignal()
+    
+    # Jarak minimum antar sinyal progress agar event loop Qt tidak kebanjiran
+    PROGRESS_INTERVAL = 0.05
+    
+    def __init__(self):
+        super().__init__()
+        self._cancel_requested = False
+        self._last_percent = -1
+        self._last_emit = 0.0
+    
+    def cancel(self):
+        """Meminta proses berhenti pada titik pemeriksaan berikutnya"""
+        self._cancel_requested = True
+    
+    def report_progress(self, done, total):
+        """Callback progress untuk AudioProcessor (dipanggil dari thread ini)"""
+        if self._cancel_requested:
+            raise OperationCancelled()
+        
+        percent = 100 if total <= 0 else min(100, int(100 * done / total))
+        now = time.monotonic()
+        if percent != self._last_percent and (percent == 100 or now - self._last_emit >= self.PROGRESS_INTERVAL):
+            self._last_percent = percent
+            self._last_emit = now
+            self.progress.emit(percent)
+    
+    def run(self):
+        try:
+            result = self.process()
+            if self._cancel_requested:
+                self.cancelled.emit()
+            else:
+                self.finished.emit(result)
+        except OperationCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def process(self):
+        raise NotImplementedError
+
+class EncryptionThread(ProcessingThread):
+    """Thread terpisah untuk proses enkripsi"""
+    finished = pyqtSignal(dict)
     
     def __init__(self, audio_processor, text, key, base_freq, base_duration):
         super().__init__()
@@ -39,28 +86,17 @@ class EncryptionThread(QThread):
         self.base_freq = base_freq
         self.base_duration = base_duration
     
-    def run(self):
-        try:
-            # Simulasi progress
-            for i in range(0, 101, 5):
-                self.progress.emit(i)
-                self.msleep(50)  # Delay kecil untuk simulasi proses
-                
-            # Proses enkripsi sebenarnya
-            result = self.audio_processor.encrypt_to_audio(
-                self.text, self.key, self.base_freq, self.base_duration
-            )
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+    def process(self):
+        return self.audio_processor.encrypt_to_audio(
+            self.text, self.key, self.base_freq, self.base_duration,
+            progress_callback=self.report_progress
+        )
 
-class DecryptionThread(QThread):
+class DecryptionThread(ProcessingThread):
     """Thread terpisah untuk proses dekripsi"""
     finished = pyqtSignal(str)
-    error = pyqtSignal(str)
-    progress = pyqtSignal(int)
     
-    def __init__(self, audio_processor, audio_data, sample_rate, key, tolerance, metadata):
+    def __init__(self, audio_processor, audio_data, sample_rate, key, tolerance, metadata, method="stft"):
         super().__init__()
         self.audio_processor = audio_processor
         self.audio_data = audio_data
@@ -68,21 +104,176 @@ class DecryptionThread(QThread):
         self.key = key
         self.tolerance = tolerance
         self.metadata = metadata
+        self.method = method
+    
+    def process(self):
+        return self.audio_processor.decrypt_from_audio(
+            self.audio_data, self.sample_rate, self.key, self.tolerance, self.metadata, self.method,
+            progress_callback=self.report_progress
+        )
+
+class RenderWorker(QThread):
+    """
+    Thread latar untuk menyiapkan data visualisasi (memuat audio, STFT, FFT,
+    piramida) agar GUI tidak membeku; menggambar tetap di thread GUI
+    
+    Setiap permintaan punya target (mis. 'visual') dan nomor generasi per
+    target. Permintaan yang belum dijalankan diganti oleh permintaan baru
+    untuk target yang sama, dan hasil permintaan yang sudah digantikan
+    dibuang, sehingga hanya permintaan terakhir per target yang dikirim.
+    Permintaan yang sedang berjalan diselesaikan (hasilnya tetap masuk
+    cache visualizer) tetapi tidak dikirim.
+    """
+    ready = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str, int, str)
+    
+    def __init__(self):
+        super().__init__()
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()  # target -> (generasi, job)
+        self._generations = {}
+        self._stopping = False
+        
+        # Statistik: permintaan diterima, dijalankan, dan hasil dikirim
+        self.submitted = 0
+        self.started_jobs = 0
+        self.delivered = 0
+    
+    def submit(self, target, job):
+        """
+        Menjadwalkan job (callable tanpa argumen) untuk target tertentu
+        
+        Returns:
+            int: Nomor generasi permintaan ini
+        """
+        with self._condition:
+            generation = self._generations.get(target, 0) + 1
+            self._generations[target] = generation
+            self._pending[target] = (generation, job)
+            self._pending.move_to_end(target)
+            self.submitted += 1
+            self._condition.notify()
+        return generation
+    
+    def cancel(self, target):
+        """Membatalkan permintaan target yang belum dikirim hasilnya"""
+        with self._condition:
+            self._pending.pop(target, None)
+            self._generations[target] = self._generations.get(target, 0) + 1
+    
+    def is_current(self, target, generation):
+        """True jika belum ada permintaan yang lebih baru untuk target ini"""
+        with self._condition:
+            return self._generations.get(target) == generation
+    
+    def stop(self):
+        """Membatalkan permintaan yang tertunda dan menunggu thread selesai"""
+        with self._condition:
+            self._stopping = True
+            self._pending.clear()
+            self._condition.notify()
+        self.wait()
     
     def run(self):
-        try:
-            # Simulasi progress
-            for i in range(0, 101, 5):
-                self.progress.emit(i)
-                self.msleep(50)  # Delay kecil untuk simulasi proses
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                target, (generation, job) = self._pending.popitem(last=False)
+                self.started_jobs += 1
             
-            # Proses dekripsi sebenarnya
-            result = self.audio_processor.decrypt_from_audio(
-                self.audio_data, self.sample_rate, self.key, self.tolerance, self.metadata
-            )
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+            try:
+                result = job()
+            except Exception as e:
+                if self.is_current(target, generation):
+                    self.failed.emit(target, generation, str(e))
+                continue
+            
+            if self.is_current(target, generation):
+                self.delivered += 1
+                self.ready.emit(target, generation, result)
+
+class VisualizationScheduler(QObject):
+    """
+    Penjadwal render tab visualisasi dengan debounce
+    
+    Sinyal pengaturan hanya memanggil request(). Render dijalankan setelah
+    tidak ada perubahan selama delay_ms (paling lambat max_delay_ms sejak
+    permintaan pertama, misalnya saat tombol panah ditahan) dengan nilai
+    pengaturan saat itu, sehingga beberapa perubahan digabung menjadi satu
+    render. Render dilewati jika parameter efektif (hasil key_fn) sama
+    dengan render terakhir.
+    """
+    
+    def __init__(self, key_fn, render_fn, delay_ms=150, max_delay_ms=500, parent=None):
+        super().__init__(parent)
+        self.key_fn = key_fn
+        self.render_fn = render_fn
+        self.delay_ms = delay_ms
+        self.max_delay_ms = max_delay_ms
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._first_request = None
+        self._last_key = None
+        
+        # Statistik: permintaan, render yang dijalankan, dan yang dilewati
+        self.requested = 0
+        self.performed = 0
+        self.skipped = 0
+    
+    @property
+    def pending(self):
+        """True jika ada permintaan yang menunggu debounce"""
+        return self._timer.isActive()
+    
+    def request(self, *args):
+        """Slot untuk sinyal pengaturan; argumen sinyal diabaikan"""
+        self.requested += 1
+        now = time.monotonic()
+        if self._first_request is None:
+            self._first_request = now
+        remaining = self.max_delay_ms - (now - self._first_request) * 1000
+        self._timer.start(int(max(0, min(self.delay_ms, remaining))))
+    
+    def render_now(self, force=True):
+        """Permintaan yang langsung dijalankan tanpa debounce"""
+        self.requested += 1
+        self.flush(force)
+    
+    def flush(self, force=False):
+        """
+        Menjalankan permintaan yang tertunda sekarang
+        
+        Args:
+            force (bool): Render walaupun parameter efektifnya tidak berubah
+        """
+        self._timer.stop()
+        self._first_request = None
+        
+        key = self.key_fn()
+        if key is None or (not force and key == self._last_key):
+            self.skipped += 1
+            return
+        
+        self._last_key = key
+        self.performed += 1
+        self.render_fn()
+    
+    def cancel(self):
+        """Membuang permintaan yang tertunda"""
+        self._timer.stop()
+        self._first_request = None
+    
+    def invalidate(self):
+        """Render berikutnya dijalankan walaupun parameternya sama (mis. figure dikosongkan)"""
+        self._last_key = None
+    
+    def stats(self):
+        return {'requested': self.requested, 'performed': self.performed, 'skipped': self.skipped}
 
 class SonicCipherApp(QMainWindow):
     def __init__(self):
@@ -90,7 +281,21 @@ class SonicCipherApp(QMainWindow):
         
         # Inisialisasi processor dan visualizer
         self.audio_processor = AudioProcessor()
-        self.visualizer = AudioVisualizer()
+        self.visualizer = AudioVisualizer(self.audio_processor.dtype)
+        
+        # Cache audio yang sudah dimuat agar file yang sama tidak dibaca ulang
+        self.audio_cache = AudioAssetCache(self.audio_processor)
+        
+        # Data visualisasi disiapkan di thread latar, digambar di thread GUI
+        self.render_worker = RenderWorker()
+        self.render_worker.ready.connect(self.handle_render_ready)
+        self.render_worker.failed.connect(self.handle_render_failed)
+        self._render_handlers = {}
+        self._visual_info_pending = False
+        self.render_worker.start()
+        
+        # Perubahan pengaturan visualisasi digabung menjadi satu render
+        self.visual_scheduler = VisualizationScheduler(self.visual_render_key, self.update_visualization, parent=self)
         
         # Variabel untuk menyimpan data
         self.encrypted_data = None
@@ -421,6 +626,12 @@ class SonicCipherApp(QMainWindow):
         self.encrypt_btn.clicked.connect(self.encrypt_message)
         buttons_layout.addWidget(self.encrypt_btn)
         
+        self.encrypt_cancel_btn = QPushButton("Batalkan")
+        self.encrypt_cancel_btn.setFont(QFont('Segoe UI', 10))
+        self.encrypt_cancel_btn.clicked.connect(self.cancel_encryption)
+        self.encrypt_cancel_btn.setVisible(False)
+        buttons_layout.addWidget(self.encrypt_cancel_btn)
+        
         self.play_btn = QPushButton("Putar Suara")
         if os.path.exists('resources/play.png'):
             self.play_btn.setIcon(QIcon('resources/play.png'))
@@ -615,13 +826,18 @@ class SonicCipherApp(QMainWindow):
         # Metode dekripsi
         method_layout = QVBoxLayout()
         method_label = QLabel("Metode Dekripsi:")
-        method_label.setToolTip("Pilih metode dekripsi yang akan digunakan.")
+        method_label.setToolTip(
+            "Pilih metode dekripsi yang akan digunakan.\n"
+            "Analisis Audio: mencari puncak spektrum dengan STFT.\n"
+            "Analisis Audio (Goertzel): hanya memeriksa 256 frekuensi simbol, lebih cepat dan presisi."
+        )
         method_layout.addWidget(method_label)
         
         self.decrypt_method = QComboBox()
         self.decrypt_method.addItem("Otomatis (Metadata jika tersedia)")
         self.decrypt_method.addItem("Gunakan Metadata")
         self.decrypt_method.addItem("Analisis Audio")
+        self.decrypt_method.addItem("Analisis Audio (Goertzel)")
         self.decrypt_method.setFont(QFont('Segoe UI', 10))
         self.decrypt_method.setToolTip(method_label.toolTip())
         method_layout.addWidget(self.decrypt_method)
@@ -663,6 +879,12 @@ class SonicCipherApp(QMainWindow):
         self.decrypt_btn.setEnabled(False)
         buttons_layout.addWidget(self.decrypt_btn)
         
+        self.decrypt_cancel_btn = QPushButton("Batalkan")
+        self.decrypt_cancel_btn.setFont(QFont('Segoe UI', 10))
+        self.decrypt_cancel_btn.clicked.connect(self.cancel_decryption)
+        self.decrypt_cancel_btn.setVisible(False)
+        buttons_layout.addWidget(self.decrypt_cancel_btn)
+        
         self.copy_result_btn = QPushButton("Salin Hasil")
         if os.path.exists('resources/copy.png'):
             self.copy_result_btn.setIcon(QIcon('resources/copy.png'))
@@ -783,7 +1005,7 @@ class SonicCipherApp(QMainWindow):
         self.visual_type.addItem("Analisis Frekuensi")
         self.visual_type.addItem("3D Spektrogram")
         self.visual_type.addItem("Analisis Gabungan")
-        self.visual_type.currentIndexChanged.connect(self.update_visualization)
+        self.visual_type.currentIndexChanged.connect(self.visual_scheduler.request)
         type_layout.addWidget(self.visual_type)
         settings_layout.addLayout(type_layout)
         
@@ -797,7 +1019,7 @@ class SonicCipherApp(QMainWindow):
         self.visual_resolution.addItem("Tinggi")
         self.visual_resolution.addItem("Sangat Tinggi")
         self.visual_resolution.setCurrentIndex(1)  # Default: Sedang
-        self.visual_resolution.currentIndexChanged.connect(self.update_visualization)
+        self.visual_resolution.currentIndexChanged.connect(self.visual_scheduler.request)
         resolution_layout.addWidget(self.visual_resolution)
         settings_layout.addLayout(resolution_layout)
         
@@ -812,7 +1034,7 @@ class SonicCipherApp(QMainWindow):
         self.visual_colormap.addItem("magma")
         self.visual_colormap.addItem("cividis")
         self.visual_colormap.addItem("jet")
-        self.visual_colormap.currentIndexChanged.connect(self.update_visualization)
+        self.visual_colormap.currentIndexChanged.connect(self.visual_scheduler.request)
         color_layout.addWidget(self.visual_colormap)
         settings_layout.addLayout(color_layout)
         
@@ -828,7 +1050,7 @@ class SonicCipherApp(QMainWindow):
         self.visual_freq_min.setRange(0, 5000)
         self.visual_freq_min.setValue(0)
         self.visual_freq_min.setSingleStep(100)
-        self.visual_freq_min.valueChanged.connect(self.update_visualization)
+        self.visual_freq_min.valueChanged.connect(self.visual_scheduler.request)
         freq_range_inner.addWidget(self.visual_freq_min)
         
         freq_range_inner.addWidget(QLabel("-"))
@@ -837,7 +1059,7 @@ class SonicCipherApp(QMainWindow):
         self.visual_freq_max.setRange(100, 10000)
         self.visual_freq_max.setValue(1000)
         self.visual_freq_max.setSingleStep(100)
-        self.visual_freq_max.valueChanged.connect(self.update_visualization)
+        self.visual_freq_max.valueChanged.connect(self.visual_scheduler.request)
         freq_range_inner.addWidget(self.visual_freq_max)
         
         freq_range_layout.addWidget(freq_range_widget)
@@ -1061,7 +1283,7 @@ class SonicCipherApp(QMainWindow):
         <ul>
             <li>Pastikan file metadata (.wav.metadata) berada di lokasi yang sama dengan file audio.</li>
             <li>Coba simpan ulang file audio terenkripsi.</li>
-            <li>Gunakan metode dekripsi "Analisis Audio" jika metadata tidak tersedia.</li>
+            <li>Gunakan metode dekripsi "Analisis Audio" atau "Analisis Audio (Goertzel)" jika metadata tidak tersedia.</li>
             <li>Sesuaikan parameter dekripsi manual (frekuensi dasar, toleransi) jika menggunakan analisis audio.</li>
         </ul>
         
@@ -1199,6 +1421,7 @@ class SonicCipherApp(QMainWindow):
         self.encrypt_progress.setValue(0)
         self.encrypt_progress.setVisible(True)
         self.encrypt_btn.setEnabled(False)
+        self.encrypt_cancel_btn.setVisible(True)
         self.statusBar().showMessage("Memproses enkripsi...")
         
         # Jalankan enkripsi dalam thread terpisah
@@ -1208,44 +1431,58 @@ class SonicCipherApp(QMainWindow):
         self.encrypt_thread.progress.connect(self.update_encrypt_progress)
         self.encrypt_thread.finished.connect(self.handle_encryption_finished)
         self.encrypt_thread.error.connect(self.handle_encryption_error)
+        self.encrypt_thread.cancelled.connect(self.handle_encryption_cancelled)
         self.encrypt_thread.start()
     
     def update_encrypt_progress(self, value):
         """Update progress bar enkripsi"""
         self.encrypt_progress.setValue(value)
     
+    def cancel_encryption(self):
+        """Meminta thread enkripsi berhenti"""
+        if getattr(self, 'encrypt_thread', None) and self.encrypt_thread.isRunning():
+            self.encrypt_thread.cancel()
+            self.statusBar().showMessage("Membatalkan enkripsi...")
+    
+    def handle_encryption_cancelled(self):
+        """Menangani enkripsi yang dibatalkan"""
+        self.encrypt_btn.setEnabled(True)
+        self.encrypt_cancel_btn.setVisible(False)
+        self.encrypt_progress.setVisible(False)
+        self.statusBar().showMessage("Enkripsi dibatalkan.", 5000)
+    
     def handle_encryption_finished(self, result):
         """Menangani hasil enkripsi yang berhasil"""
         self.encrypted_data = result
         plaintext = self.plaintext_input.toPlainText()
         
-        # Visualisasi
-        self.visualizer.plot_spectrogram(
-            self.encrypted_data['audio'], 
-            self.encrypted_data['sample_rate'], 
-            self.encrypt_figure,
-            colormap=self.visual_colormap.currentText() if hasattr(self, 'visual_colormap') else 'viridis'
-        )
-        self.encrypt_canvas.draw()
+        # Visualisasi: data disiapkan di thread latar, lalu digambar
+        audio_data = self.encrypted_data['audio']
+        sample_rate = self.encrypted_data['sample_rate']
+        colormap = self.visual_colormap.currentText() if hasattr(self, 'visual_colormap') else 'viridis'
         
-        self.visualizer.plot_waveform(
-            self.encrypted_data['audio'], 
-            self.encrypted_data['sample_rate'], 
-            self.encrypt_wave_figure
-        )
-        self.encrypt_wave_canvas.draw()
+        def draw(prepared):
+            with self.visualizer.holding(prepared):
+                self.visualizer.plot_spectrogram(audio_data, sample_rate, self.encrypt_figure, colormap=colormap)
+                self.encrypt_canvas.draw()
+                
+                self.visualizer.plot_waveform(audio_data, sample_rate, self.encrypt_wave_figure)
+                self.encrypt_wave_canvas.draw()
+                
+                self.visualizer.plot_frequency_analysis(audio_data, sample_rate, self.encrypt_freq_figure)
+                self.encrypt_freq_canvas.draw()
         
-        self.visualizer.plot_frequency_analysis(
-            self.encrypted_data['audio'], 
-            self.encrypted_data['sample_rate'], 
-            self.encrypt_freq_figure
+        self.request_render(
+            'encrypt',
+            lambda: self.visualizer.prepare(['spectrogram', 'waveform', 'frequency'], audio_data, sample_rate),
+            draw
         )
-        self.encrypt_freq_canvas.draw()
         
         # Aktifkan tombol
         self.play_btn.setEnabled(True)
         self.save_btn.setEnabled(True)
         self.encrypt_btn.setEnabled(True)
+        self.encrypt_cancel_btn.setVisible(False)
         
         # Sembunyikan progress bar
         self.encrypt_progress.setVisible(False)
@@ -1258,6 +1495,7 @@ class SonicCipherApp(QMainWindow):
     def handle_encryption_error(self, error_msg):
         """Menangani error pada proses enkripsi"""
         self.encrypt_btn.setEnabled(True)
+        self.encrypt_cancel_btn.setVisible(False)
         self.encrypt_progress.setVisible(False)
         self.statusBar().showMessage("Enkripsi gagal!", 5000)
         
@@ -1315,24 +1553,26 @@ class SonicCipherApp(QMainWindow):
         self.audio_file_path = file_path
         self.file_path_display.setText(file_path)
         
-        # Periksa apakah file metadata ada
-        metadata_file = file_path + ".metadata"
-        if os.path.exists(metadata_file):
-            self.metadata_status.setText("Status Metadata: ✅ Ditemukan")
-            self.metadata_status.setStyleSheet("color: green;")
-            self.debug_text.append(f"File metadata ditemukan: {metadata_file}")
-        else:
-            self.metadata_status.setText("Status Metadata: ❌ Tidak ditemukan")
-            self.metadata_status.setStyleSheet("color: red;")
-            self.debug_text.append(f"File metadata tidak ditemukan: {metadata_file}")
-            self.debug_text.append("Dekripsi akan menggunakan analisis audio langsung yang mungkin kurang akurat.")
+        # Status metadata baru diketahui setelah file dimuat (metadata bisa
+        # tertanam di file WAV atau berupa file .metadata)
+        self.metadata_status.setText("Status Metadata: Memeriksa...")
+        self.metadata_status.setStyleSheet("")
         
-        try:
-            # Load audio dan visualisasi
-            audio_data, sample_rate, metadata = self.audio_processor.load_audio(file_path)
-            
-            self.visualizer.plot_spectrogram(audio_data, sample_rate, self.decrypt_figure)
-            self.decrypt_canvas.draw()
+        def load():
+            # Dijalankan di thread latar: muat audio dan siapkan spektrogram
+            audio_data, sample_rate, metadata = self.audio_cache.load(file_path)
+            prepared = self.visualizer.prepare(['spectrogram'], audio_data, sample_rate)
+            return audio_data, sample_rate, metadata, prepared
+        
+        def show(result):
+            audio_data, sample_rate, metadata, prepared = result
+            try:
+                with self.visualizer.holding(prepared):
+                    self.visualizer.plot_spectrogram(audio_data, sample_rate, self.decrypt_figure)
+                self.decrypt_canvas.draw()
+            except Exception as e:
+                show_error(str(e))
+                return
             
             # Tampilkan informasi audio
             self.debug_text.clear()
@@ -1341,6 +1581,15 @@ class SonicCipherApp(QMainWindow):
             self.debug_text.append(f"Durasi: {len(audio_data)/sample_rate:.2f} detik")
             self.debug_text.append(f"Jumlah sampel: {len(audio_data)}")
             
+            if metadata is not None:
+                self.metadata_status.setText("Status Metadata: ✅ Ditemukan")
+                self.metadata_status.setStyleSheet("color: green;")
+            else:
+                self.metadata_status.setText("Status Metadata: ❌ Tidak ditemukan")
+                self.metadata_status.setStyleSheet("color: red;")
+                self.debug_text.append("\nMetadata tidak ditemukan (di dalam file WAV maupun file .metadata).")
+                self.debug_text.append("Dekripsi akan menggunakan analisis audio langsung yang mungkin kurang akurat.")
+            
             if metadata:
                 self.debug_text.append("\nInformasi Metadata:")
                 for key, value in metadata.items():
@@ -1356,17 +1605,22 @@ class SonicCipherApp(QMainWindow):
             self.decrypt_btn.setEnabled(True)
             
             self.statusBar().showMessage(f"File audio dimuat: {os.path.basename(file_path)}", 5000)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal memuat file audio: {str(e)}")
-            self.debug_text.append(f"ERROR: {str(e)}")
+        
+        def show_error(error_msg):
+            self.metadata_status.setText("Status Metadata: Belum diperiksa")
+            self.metadata_status.setStyleSheet("")
+            QMessageBox.critical(self, "Error", f"Gagal memuat file audio: {error_msg}")
+            self.debug_text.append(f"ERROR: {error_msg}")
             self.statusBar().showMessage("Gagal memuat file audio", 5000)
+        
+        self.statusBar().showMessage(f"Memuat {os.path.basename(file_path)}...")
+        self.request_render('decrypt', load, show, show_error)
     
     def play_loaded_audio(self):
         """Memutar file audio yang telah dimuat"""
         if self.audio_file_path:
             self.statusBar().showMessage("Memutar audio...", 3000)
-            audio_data, sample_rate, _ = self.audio_processor.load_audio(self.audio_file_path)
+            audio_data, sample_rate, _ = self.audio_cache.load(self.audio_file_path)
             self.audio_processor.play_audio(audio_data, sample_rate)
     
     def decrypt_audio(self):
@@ -1385,7 +1639,7 @@ class SonicCipherApp(QMainWindow):
         
         try:
             # Load audio
-            audio_data, sample_rate, metadata = self.audio_processor.load_audio(self.audio_file_path)
+            audio_data, sample_rate, metadata = self.audio_cache.load(self.audio_file_path)
             
             if metadata is None and self.decrypt_method.currentText() == "Gunakan Metadata":
                 QMessageBox.warning(self, "Peringatan", 
@@ -1395,7 +1649,8 @@ class SonicCipherApp(QMainWindow):
                 return
             
             # Jika metode analisis audio dipilih, gunakan parameter manual
-            if self.decrypt_method.currentText() == "Analisis Audio" or (metadata is None and self.decrypt_method.currentText() == "Otomatis (Metadata jika tersedia)"):
+            method = "goertzel" if self.decrypt_method.currentText() == "Analisis Audio (Goertzel)" else "stft"
+            if self.decrypt_method.currentText().startswith("Analisis Audio") or (metadata is None and self.decrypt_method.currentText() == "Otomatis (Metadata jika tersedia)"):
                 metadata = {
                     'base_freq': self.decrypt_base_freq.value(),
                     'freq_range': 660  # Default
@@ -1406,11 +1661,13 @@ class SonicCipherApp(QMainWindow):
             
             # Jalankan dekripsi dalam thread terpisah
             self.decrypt_thread = DecryptionThread(
-                self.audio_processor, audio_data, sample_rate, key, tolerance, metadata
+                self.audio_processor, audio_data, sample_rate, key, tolerance, metadata, method
             )
             self.decrypt_thread.progress.connect(self.update_decrypt_progress)
             self.decrypt_thread.finished.connect(self.handle_decryption_finished)
             self.decrypt_thread.error.connect(self.handle_decryption_error)
+            self.decrypt_thread.cancelled.connect(self.handle_decryption_cancelled)
+            self.decrypt_cancel_btn.setVisible(True)
             self.decrypt_thread.start()
             
         except Exception as e:
@@ -1424,6 +1681,20 @@ class SonicCipherApp(QMainWindow):
         """Update progress bar dekripsi"""
         self.decrypt_progress.setValue(value)
     
+    def cancel_decryption(self):
+        """Meminta thread dekripsi berhenti"""
+        if getattr(self, 'decrypt_thread', None) and self.decrypt_thread.isRunning():
+            self.decrypt_thread.cancel()
+            self.statusBar().showMessage("Membatalkan dekripsi...")
+    
+    def handle_decryption_cancelled(self):
+        """Menangani dekripsi yang dibatalkan"""
+        self.decrypt_btn.setEnabled(True)
+        self.decrypt_cancel_btn.setVisible(False)
+        self.decrypt_progress.setVisible(False)
+        self.debug_text.append("\nDekripsi dibatalkan.")
+        self.statusBar().showMessage("Dekripsi dibatalkan.", 5000)
+    
     def handle_decryption_finished(self, result):
         """Menangani hasil dekripsi yang berhasil"""
         # Tampilkan hasil
@@ -1431,6 +1702,7 @@ class SonicCipherApp(QMainWindow):
         
         # Aktifkan tombol
         self.decrypt_btn.setEnabled(True)
+        self.decrypt_cancel_btn.setVisible(False)
         self.copy_result_btn.setEnabled(True)
         
         # Sembunyikan progress bar
@@ -1446,6 +1718,7 @@ class SonicCipherApp(QMainWindow):
     def handle_decryption_error(self, error_msg):
         """Menangani error pada proses dekripsi"""
         self.decrypt_btn.setEnabled(True)
+        self.decrypt_cancel_btn.setVisible(False)
         self.decrypt_progress.setVisible(False)
         self.statusBar().showMessage("Dekripsi gagal!", 5000)
         
@@ -1460,6 +1733,52 @@ class SonicCipherApp(QMainWindow):
             clipboard.setText(text)
             self.statusBar().showMessage("Teks berhasil disalin ke clipboard!", 3000)
     
+    # ===== Render Visualisasi di Thread Latar =====
+    
+    def request_render(self, target, job, on_ready, on_error=None):
+        """
+        Menjalankan job di RenderWorker, lalu on_ready(hasil) di thread GUI
+        
+        Permintaan baru untuk target yang sama ('encrypt', 'decrypt',
+        'visual') menggantikan permintaan sebelumnya yang belum selesai;
+        hasil permintaan lama tidak digambar.
+        """
+        generation = self.render_worker.submit(target, job)
+        self._render_handlers[target] = (generation, on_ready, on_error)
+    
+    def cancel_render(self, target):
+        """Membatalkan render target yang belum digambar"""
+        self.render_worker.cancel(target)
+        self._render_handlers.pop(target, None)
+    
+    def _take_render_handler(self, target, generation):
+        handler = self._render_handlers.get(target)
+        if handler is None or handler[0] != generation:
+            return None  # Sudah digantikan permintaan yang lebih baru
+        del self._render_handlers[target]
+        return handler
+    
+    def handle_render_ready(self, target, generation, result):
+        """Menggambar hasil RenderWorker (dipanggil di thread GUI)"""
+        handler = self._take_render_handler(target, generation)
+        if handler is not None:
+            handler[1](result)
+    
+    def handle_render_failed(self, target, generation, error_msg):
+        """Menangani error saat menyiapkan data visualisasi"""
+        handler = self._take_render_handler(target, generation)
+        if handler is None:
+            return
+        if handler[2] is not None:
+            handler[2](error_msg)
+        else:
+            self.statusBar().showMessage(f"Gagal menyiapkan visualisasi: {error_msg}", 5000)
+    
+    def closeEvent(self, event):
+        """Menghentikan thread render sebelum jendela ditutup"""
+        self.render_worker.stop()
+        super().closeEvent(event)
+    
     # ===== Fungsi-fungsi untuk Tab Visualisasi =====
     
     def browse_visual_file(self):
@@ -1479,41 +1798,55 @@ class SonicCipherApp(QMainWindow):
             QMessageBox.warning(self, "File Tidak Ditemukan", "Silakan pilih file audio terlebih dahulu.")
             return
         
-        try:
-            # Load audio
-            audio_data, sample_rate, metadata = self.audio_processor.load_audio(file_path)
-            
-            # Update visualisasi
-            self.update_visualization(audio_data=audio_data, sample_rate=sample_rate)
-            
-            # Tampilkan informasi audio
-            self.visual_info.clear()
-            self.visual_info.append(f"File: {os.path.basename(file_path)}")
-            self.visual_info.append(f"Sample rate: {sample_rate} Hz")
-            self.visual_info.append(f"Durasi: {len(audio_data)/sample_rate:.2f} detik")
-            
-            if metadata:
-                self.visual_info.append(f"Karakter terenkripsi: {metadata.get('char_count', 'Tidak diketahui')}")
-                self.visual_info.append(f"Algoritma: {metadata.get('algorithm', 'Tidak diketahui')}")
-            
-            self.statusBar().showMessage(f"Analisis selesai: {os.path.basename(file_path)}", 5000)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal menganalisis file: {str(e)}")
-            self.statusBar().showMessage("Analisis gagal", 5000)
+        # Informasi audio ditampilkan setelah render berikutnya selesai
+        self._visual_info_pending = True
+        self.statusBar().showMessage(f"Menganalisis {os.path.basename(file_path)}...")
+        self.visual_scheduler.render_now()
+    
+    def show_visual_info(self, file_path, audio_data, sample_rate, metadata):
+        """Menampilkan informasi audio di tab visualisasi"""
+        self.visual_info.clear()
+        self.visual_info.append(f"File: {os.path.basename(file_path)}")
+        self.visual_info.append(f"Sample rate: {sample_rate} Hz")
+        self.visual_info.append(f"Durasi: {len(audio_data)/sample_rate:.2f} detik")
+        
+        if metadata:
+            self.visual_info.append(f"Karakter terenkripsi: {metadata.get('char_count', 'Tidak diketahui')}")
+            self.visual_info.append(f"Algoritma: {metadata.get('algorithm', 'Tidak diketahui')}")
+        
+        self.statusBar().showMessage(f"Analisis selesai: {os.path.basename(file_path)}", 5000)
+    
+    def visual_render_key(self):
+        """
+        Parameter efektif render tab visualisasi (None jika belum ada file);
+        pengaturan yang tidak dipakai jenis visualisasi terpilih diabaikan
+        """
+        file_path = self.visual_file_path.text()
+        if not file_path or not os.path.exists(file_path):
+            return None
+        stat = os.stat(file_path)
+        
+        visual_type = self.visual_type.currentText()
+        colormap = self.visual_colormap.currentText()
+        freq_range = (self.visual_freq_min.value(), self.visual_freq_max.value())
+        resolution = self.visual_resolution.currentText()
+        
+        settings = {
+            "Spektrogram": (colormap, freq_range, resolution),
+            "Waveform": (),
+            "Analisis Frekuensi": (freq_range,),
+            "3D Spektrogram": (colormap, freq_range, resolution),
+            "Analisis Gabungan": (colormap, freq_range),
+        }[visual_type]
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, visual_type) + settings
     
     def update_visualization(self, index=None, audio_data=None, sample_rate=None):
         """Update visualisasi berdasarkan pengaturan yang dipilih"""
+        file_path = self.visual_file_path.text()
         if audio_data is None or sample_rate is None:
-            # Jika tidak ada data audio yang diberikan, coba muat dari file
-            file_path = self.visual_file_path.text()
+            # Jika tidak ada data audio yang diberikan, muat dari file
             if not file_path or not os.path.exists(file_path):
                 return
-                
-            try:
-                audio_data, sample_rate, _ = self.audio_processor.load_audio(file_path)
-            except:
-                return
         
         # Dapatkan pengaturan visualisasi
         visual_type = self.visual_type.currentText()
@@ -1530,39 +1863,75 @@ class SonicCipherApp(QMainWindow):
         }
         resolution = resolution_map[self.visual_resolution.currentText()]
         
-        # Bersihkan figure
-        self.visual_figure.clear()
+        plot_map = {
+            "Spektrogram": 'spectrogram',
+            "Waveform": 'waveform',
+            "Analisis Frekuensi": 'frequency',
+            "3D Spektrogram": '3d',
+            "Analisis Gabungan": 'combined'
+        }
         
-        # Buat visualisasi berdasarkan jenis yang dipilih
-        if visual_type == "Spektrogram":
-            self.visualizer.plot_spectrogram(
-                audio_data, sample_rate, self.visual_figure,
-                colormap=colormap, freq_range=(freq_min, freq_max),
-                resolution=resolution
-            )
-        elif visual_type == "Waveform":
-            self.visualizer.plot_waveform(
-                audio_data, sample_rate, self.visual_figure
-            )
-        elif visual_type == "Analisis Frekuensi":
-            self.visualizer.plot_frequency_analysis(
-                audio_data, sample_rate, self.visual_figure,
-                freq_range=(freq_min, freq_max)
-            )
-        elif visual_type == "3D Spektrogram":
-            self.visualizer.plot_3d_spectrogram(
-                audio_data, sample_rate, self.visual_figure,
-                colormap=colormap, freq_range=(freq_min, freq_max),
-                resolution=resolution
-            )
-        elif visual_type == "Analisis Gabungan":
-            self.visualizer.plot_combined_analysis(
-                audio_data, sample_rate, self.visual_figure,
-                colormap=colormap, freq_range=(freq_min, freq_max)
-            )
+        def prepare():
+            # Dijalankan di thread latar: muat audio dan siapkan data plot
+            data, rate, metadata = audio_data, sample_rate, None
+            if data is None or rate is None:
+                data, rate, metadata = self.audio_cache.load(file_path)
+            prepared = self.visualizer.prepare([plot_map[visual_type]], data, rate, resolution)
+            return data, rate, metadata, prepared
         
-        # Refresh canvas
-        self.visual_canvas.draw()
+        def draw(result):
+            audio_data, sample_rate, metadata, prepared = result
+            
+            # Bersihkan figure
+            self.visual_figure.clear()
+            
+            # Buat visualisasi berdasarkan jenis yang dipilih
+            with self.visualizer.holding(prepared):
+                if visual_type == "Spektrogram":
+                    self.visualizer.plot_spectrogram(
+                        audio_data, sample_rate, self.visual_figure,
+                        colormap=colormap, freq_range=(freq_min, freq_max),
+                        resolution=resolution
+                    )
+                elif visual_type == "Waveform":
+                    self.visualizer.plot_waveform(
+                        audio_data, sample_rate, self.visual_figure
+                    )
+                elif visual_type == "Analisis Frekuensi":
+                    self.visualizer.plot_frequency_analysis(
+                        audio_data, sample_rate, self.visual_figure,
+                        freq_range=(freq_min, freq_max)
+                    )
+                elif visual_type == "3D Spektrogram":
+                    self.visualizer.plot_3d_spectrogram(
+                        audio_data, sample_rate, self.visual_figure,
+                        colormap=colormap, freq_range=(freq_min, freq_max),
+                        resolution=resolution
+                    )
+                elif visual_type == "Analisis Gabungan":
+                    self.visualizer.plot_combined_analysis(
+                        audio_data, sample_rate, self.visual_figure,
+                        colormap=colormap, freq_range=(freq_min, freq_max)
+                    )
+            
+            # Refresh canvas
+            self.visual_canvas.draw()
+            
+            if self._visual_info_pending:
+                self._visual_info_pending = False
+                self.show_visual_info(file_path, audio_data, sample_rate, metadata)
+        
+        def show_error(error_msg):
+            # Pengaturan yang sama boleh dicoba lagi
+            self.visual_scheduler.invalidate()
+            if self._visual_info_pending:
+                self._visual_info_pending = False
+                QMessageBox.critical(self, "Error", f"Gagal menganalisis file: {error_msg}")
+                self.statusBar().showMessage("Analisis gagal", 5000)
+            else:
+                self.statusBar().showMessage(f"Gagal memperbarui visualisasi: {error_msg}", 5000)
+        
+        self.request_render('visual', prepare, draw, show_error)
     
     def export_visualization(self):
         """Ekspor visualisasi saat ini sebagai gambar"""
@@ -1586,6 +1955,12 @@ class SonicCipherApp(QMainWindow):
         self.visual_freq_min.setValue(0)
         self.visual_freq_max.setValue(1000)
         
+        # Render yang dipicu perubahan pengaturan di atas tidak digambar
+        self.visual_scheduler.cancel()
+        self.visual_scheduler.invalidate()
+        self.cancel_render('visual')
+        self._visual_info_pending = False
+        
         # Clear figure
         self.visual_figure.clear()
         self.visual_canvas.draw()
@@ -1684,7 +2059,8 @@ class SonicCipherApp(QMainWindow):
             self.decrypt_btn.setEnabled(False)
             self.copy_result_btn.setEnabled(False)
             
-            # Clear figure
+            # Clear figure (spektrogram yang masih disiapkan tidak digambar)
+            self.cancel_render('decrypt')
             self.decrypt_figure.clear()
             self.decrypt_canvas.draw()
     
@@ -5,15 +5,684 @@ SonicCipher - Aplikasi Kriptografi Teks ke Suara
 Visualizer - Visualisasi audio
 """
 
+import contextlib
+import hashlib
+import os
+import weakref
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from scipy import signal
 from mpl_toolkits.mplot3d import Axes3D
 
+from audio_processor import ByteBudgetCache, LazyAudio
+
+# Jumlah sampel per blok min/max pada level piramida waveform pertama
+WAVEFORM_BLOCK_SAMPLES = 64
+
+# Jumlah blok level sebelumnya yang digabung di setiap level berikutnya
+WAVEFORM_LEVEL_FACTOR = 4
+
+# Jumlah sampel per potongan saat membangun level pertama
+WAVEFORM_CHUNK_SAMPLES = 1 << 20
+
+# Jumlah frame STFT (kolom) per tile spektrogram; harus kelipatan
+# SPECTROGRAM_LEVEL_FACTOR
+SPECTROGRAM_TILE_FRAMES = 512
+
+# Jumlah frame level sebelumnya yang digabung di setiap level berikutnya
+SPECTROGRAM_LEVEL_FACTOR = 2
+
+# Tile hanya dipakai untuk tampilan; float16 cukup untuk nilai dB
+SPECTROGRAM_TILE_DTYPE = np.float16
+
+# Versi format file tile (.npz)
+SPECTROGRAM_TILE_VERSION = 1
+
+# nperseg spektrogram pada plot analisis gabungan
+COMBINED_RESOLUTION = 1024
+
+# Jenis plot yang datanya dapat disiapkan dengan AudioVisualizer.prepare
+PLOT_TYPES = ('spectrogram', 'waveform', 'frequency', '3d', 'combined')
+
+class WaveformPyramid:
+    """
+    Piramida envelope min/max untuk menggambar waveform panjang
+    
+    Level pertama berisi nilai minimum dan maksimum setiap blok
+    WAVEFORM_BLOCK_SAMPLES sampel; setiap level berikutnya menggabungkan
+    WAVEFORM_LEVEL_FACTOR blok level sebelumnya. Untuk rentang waktu yang
+    digambar, blok level terdekat digabung lagi sampai jumlahnya muat dalam
+    batas titik (dua titik, min dan max, per blok), sehingga biayanya
+    bergantung pada lebar layar, bukan panjang audio. Rentang yang cukup
+    pendek digambar langsung dari sampel aslinya.
+    
+    Piramida hanya menyimpan level min/max (yang dihitung nbytes); sampel
+    asli tidak ikut disimpan dan diberikan lagi saat memanggil envelope().
+    """
+    def __init__(self, audio_data, sample_rate, dtype=np.float32):
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.length = len(audio_data)
+        self.levels = []  # [(ukuran blok dalam sampel, mins, maxs)]
+        
+        block_size = WAVEFORM_BLOCK_SAMPLES
+        mins, maxs = self._first_level(audio_data)
+        self.levels.append((block_size, mins, maxs))
+        while len(mins) > WAVEFORM_LEVEL_FACTOR:
+            starts = np.arange(0, len(mins), WAVEFORM_LEVEL_FACTOR)
+            mins = np.minimum.reduceat(mins, starts)
+            maxs = np.maximum.reduceat(maxs, starts)
+            block_size *= WAVEFORM_LEVEL_FACTOR
+            self.levels.append((block_size, mins, maxs))
+        
+        for _, mins, maxs in self.levels:
+            mins.flags.writeable = False
+            maxs.flags.writeable = False
+    
+    def _first_level(self, audio_data):
+        """
+        Min/max per blok dari sampel asli, dibaca per potongan
+        """
+        n_blocks = -(-self.length // WAVEFORM_BLOCK_SAMPLES)
+        mins = np.empty(n_blocks, dtype=self.dtype)
+        maxs = np.empty(n_blocks, dtype=self.dtype)
+        for start in range(0, self.length, WAVEFORM_CHUNK_SAMPLES):
+            chunk = np.asarray(audio_data[start:start + WAVEFORM_CHUNK_SAMPLES], dtype=self.dtype)
+            starts = np.arange(0, len(chunk), WAVEFORM_BLOCK_SAMPLES)
+            first = start // WAVEFORM_BLOCK_SAMPLES
+            mins[first:first + len(starts)] = np.minimum.reduceat(chunk, starts)
+            maxs[first:first + len(starts)] = np.maximum.reduceat(chunk, starts)
+        return mins, maxs
+    
+    @property
+    def nbytes(self):
+        return sum(mins.nbytes + maxs.nbytes for _, mins, maxs in self.levels)
+    
+    def envelope(self, audio_data, start_time, end_time, max_points):
+        """
+        Titik-titik (waktu, amplitudo) untuk rentang waktu tertentu
+        
+        Ukuran blok yang dibutuhkan dihitung dari rentang dan max_points;
+        min/max diambil dari level terkasar yang bloknya tidak lebih besar
+        (atau dari sampel asli audio_data, audio yang sama dengan saat
+        piramida dibangun) lalu digabung lagi ke ukuran tersebut.
+        
+        Returns:
+            tuple: (times, values) dengan paling banyak sekitar max_points titik
+        """
+        start = min(max(int(np.floor(start_time * self.sample_rate)), 0), self.length)
+        stop = min(max(int(np.ceil(end_time * self.sample_rate)) + 1, start), self.length)
+        
+        if stop - start <= max_points:
+            values = np.asarray(audio_data[start:stop], dtype=self.dtype)
+            return np.arange(start, stop) / self.sample_rate, values
+        
+        # Ukuran blok agar jumlah blok (2 titik per blok) muat di max_points
+        target = -(-(stop - start) // max(max_points // 2, 1))
+        
+        if target < WAVEFORM_BLOCK_SAMPLES:
+            # Lebih halus dari level pertama: gabung langsung dari sampel
+            block_size, first = 1, start
+            mins = maxs = np.asarray(audio_data[start:stop], dtype=self.dtype)
+        else:
+            for size, level_mins, level_maxs in self.levels:
+                if size > target:
+                    break
+                block_size, first = size, start // size
+                last = min(-(-stop // size), len(level_mins))
+                mins, maxs = level_mins[first:last], level_maxs[first:last]
+        
+        group = -(-target // block_size)
+        starts = np.arange(0, len(mins), group)
+        times = np.repeat((first + starts) * (block_size / self.sample_rate), 2)
+        values = np.empty(2 * len(starts), dtype=self.dtype)
+        values[0::2] = np.minimum.reduceat(mins, starts)
+        values[1::2] = np.maximum.reduceat(maxs, starts)
+        return times, values
+
+class SpectrogramPyramid:
+    """
+    Piramida tile spektrogram (dB) multi-resolusi untuk satu audio
+    
+    Level pertama adalah spektrogram penuh yang dihitung per tile
+    SPECTROGRAM_TILE_FRAMES frame STFT, sehingga audio tidak pernah diproses
+    sekaligus. Setiap level berikutnya mengambil nilai maksimum
+    SPECTROGRAM_LEVEL_FACTOR frame level sebelumnya (nada tetap terlihat saat
+    diperkecil). Level pertama sama dengan signal.spectrogram pada seluruh
+    audio, dibulatkan ke float16.
+    
+    Untuk rentang waktu yang digambar dipilih level terkasar yang masih
+    memiliki setidaknya satu frame per kolom piksel, dan hanya tile yang
+    beririsan dengan rentang itu yang diambil: dari memori, atau dari file
+    .npz (dibaca per tile) jika piramida dimuat dengan load(). File itu
+    ditutup dengan close(), dan dibuka lagi jika masih ada tile yang perlu
+    dibaca setelahnya.
+    """
+    def __init__(self, info, f, frame_counts, tiles=None, archive=None, file_path=None):
+        self.info = info  # sample_rate, nperseg, t0, hop, vmin, vmax, fingerprint, dtype
+        self.f = f
+        self.frame_counts = list(frame_counts)
+        self._tiles = tiles if tiles is not None else {}
+        self._archive = archive
+        self._file_path = file_path
+    
+    @classmethod
+    def from_audio(cls, audio_data, sample_rate, nperseg, dtype=np.float32, fingerprint=None):
+        """
+        Membangun piramida dari audio
+        """
+        dtype = np.dtype(dtype)
+        length = len(audio_data)
+        noverlap = nperseg // 8  # Default signal.spectrogram
+        step = nperseg - noverlap
+        
+        if length < nperseg:
+            # Lebih pendek dari satu segmen: satu frame untuk seluruh audio
+            ranges = [(0, length)]
+            t0 = length / 2 / sample_rate
+            hop = length / sample_rate
+        else:
+            n_frames = (length - noverlap) // step
+            ranges = []
+            for first in range(0, n_frames, SPECTROGRAM_TILE_FRAMES):
+                count = min(SPECTROGRAM_TILE_FRAMES, n_frames - first)
+                ranges.append((first * step, first * step + (count - 1) * step + nperseg))
+            t0 = nperseg / 2 / sample_rate
+            hop = step / sample_rate
+        
+        tiles = {}
+        vmin, vmax = np.inf, -np.inf
+        for index, (start, stop) in enumerate(ranges):
+            chunk = np.asarray(audio_data[start:stop], dtype=dtype)
+            f, _, Sxx = signal.spectrogram(chunk, fs=sample_rate, nperseg=min(nperseg, len(chunk)))
+            Sxx_db = 10 * np.log10(Sxx + 1e-10)
+            vmin = min(vmin, float(Sxx_db.min()))
+            vmax = max(vmax, float(Sxx_db.max()))
+            tiles[(0, index)] = Sxx_db.astype(SPECTROGRAM_TILE_DTYPE)
+        
+        # Level berikutnya: maksimum per SPECTROGRAM_LEVEL_FACTOR frame;
+        # tile ke-i berasal dari tile i*faktor .. (i+1)*faktor-1 level sebelumnya
+        frame_counts = [sum(tile.shape[1] for tile in tiles.values())]
+        n_tiles = len(ranges)
+        while n_tiles > 1:
+            level = len(frame_counts)
+            for index in range(0, n_tiles, SPECTROGRAM_LEVEL_FACTOR):
+                parts = []
+                for previous in range(index, min(index + SPECTROGRAM_LEVEL_FACTOR, n_tiles)):
+                    tile = tiles[(level - 1, previous)]
+                    starts = np.arange(0, tile.shape[1], SPECTROGRAM_LEVEL_FACTOR)
+                    parts.append(np.maximum.reduceat(tile, starts, axis=1))
+                tiles[(level, index // SPECTROGRAM_LEVEL_FACTOR)] = np.concatenate(parts, axis=1)
+            frame_counts.append(-(-frame_counts[-1] // SPECTROGRAM_LEVEL_FACTOR))
+            n_tiles = -(-n_tiles // SPECTROGRAM_LEVEL_FACTOR)
+        
+        for tile in tiles.values():
+            tile.flags.writeable = False
+        
+        info = {
+            'sample_rate': sample_rate, 'nperseg': nperseg, 't0': t0, 'hop': hop,
+            'vmin': vmin, 'vmax': vmax, 'fingerprint': fingerprint, 'dtype': dtype.str,
+        }
+        return cls(info, f, frame_counts, tiles)
+    
+    @classmethod
+    def load(cls, file_path):
+        """
+        Membuka piramida dari file .npz; tile baru dibaca saat dibutuhkan
+        """
+        archive = np.load(file_path, allow_pickle=False)
+        try:
+            if int(archive['version']) > SPECTROGRAM_TILE_VERSION:
+                raise ValueError(f"Versi file tile {int(archive['version'])} tidak didukung")
+            digest, dtype_str, length = archive['fingerprint'].tolist()
+            info = {
+                'sample_rate': int(archive['sample_rate']), 'nperseg': int(archive['nperseg']),
+                't0': float(archive['t0']), 'hop': float(archive['hop']),
+                'vmin': float(archive['vmin']), 'vmax': float(archive['vmax']),
+                'fingerprint': (digest, dtype_str, int(length)), 'dtype': str(archive['dtype']),
+            }
+            return cls(info, archive['f'], archive['frame_counts'].tolist(), archive=archive, file_path=file_path)
+        except Exception:
+            archive.close()
+            raise
+    
+    def save(self, file_path):
+        """
+        Menyimpan semua tile ke file .npz (tanpa kompresi agar setiap tile
+        dapat dibaca langsung); ditulis ke file sementara lalu diganti
+        """
+        arrays = {
+            'version': np.array(SPECTROGRAM_TILE_VERSION),
+            'sample_rate': np.array(self.info['sample_rate']), 'nperseg': np.array(self.info['nperseg']),
+            't0': np.array(self.info['t0']), 'hop': np.array(self.info['hop']),
+            'vmin': np.array(self.info['vmin']), 'vmax': np.array(self.info['vmax']),
+            'fingerprint': np.array([str(item) for item in self.info['fingerprint']]),
+            'dtype': np.array(self.info['dtype']),
+            'f': self.f, 'frame_counts': np.array(self.frame_counts),
+        }
+        for level, count in enumerate(self.frame_counts):
+            for index in range(-(-count // SPECTROGRAM_TILE_FRAMES)):
+                arrays[f'L{level}_{index}'] = self.tile(level, index)
+        
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, file_path)
+    
+    def close(self):
+        """
+        Menutup file .npz; tile yang sudah dibaca tetap di memori
+        """
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+    
+    def matches(self, fingerprint, sample_rate, nperseg, dtype):
+        """
+        True jika piramida dibuat dari audio dan parameter yang sama
+        """
+        return (self.info['fingerprint'] == fingerprint and self.info['sample_rate'] == sample_rate
+                and self.info['nperseg'] == nperseg and self.info['dtype'] == np.dtype(dtype).str)
+    
+    @property
+    def vmin(self):
+        return self.info['vmin']
+    
+    @property
+    def vmax(self):
+        return self.info['vmax']
+    
+    @property
+    def start_time(self):
+        """Waktu tengah frame pertama (sama dengan t[0] signal.spectrogram)"""
+        return self.info['t0']
+    
+    @property
+    def end_time(self):
+        """Waktu tengah frame terakhir (sama dengan t[-1] signal.spectrogram)"""
+        return self.info['t0'] + (self.frame_counts[0] - 1) * self.info['hop']
+    
+    @property
+    def nbytes(self):
+        # Ukuran semua tile, termasuk yang belum dibaca dari file
+        itemsize = np.dtype(SPECTROGRAM_TILE_DTYPE).itemsize
+        return len(self.f) * sum(self.frame_counts) * itemsize
+    
+    def tile(self, level, index):
+        """
+        Tile (frekuensi x frame) pada level tertentu
+        """
+        key = (level, index)
+        tile = self._tiles.get(key)
+        if tile is None:
+            if self._archive is None:
+                self._archive = np.load(self._file_path, allow_pickle=False)
+            tile = self._archive[f'L{level}_{index}']
+            tile.flags.writeable = False
+            self._tiles[key] = tile
+        return tile
+    
+    def view(self, start_time, end_time, band, columns):
+        """
+        Gambar spektrogram untuk rentang waktu dan pita frekuensi tertentu
+        
+        Args:
+            band (slice): Potongan indeks frekuensi
+            columns (int): Lebar raster tujuan dalam piksel
+        
+        Returns:
+            tuple: (image, extent) untuk imshow; lebar image antara columns
+            dan SPECTROGRAM_LEVEL_FACTOR x columns frame (kecuali pada level
+            pertama)
+        """
+        t0, hop = self.info['t0'], self.info['hop']
+        edge = t0 - hop / 2
+        n_frames = self.frame_counts[0]
+        first = min(max(int(np.floor((start_time - edge) / hop)), 0), n_frames - 1)
+        last = min(max(int(np.ceil((end_time - edge) / hop)), first + 1), n_frames)
+        
+        level = 0
+        while (level + 1 < len(self.frame_counts)
+               and (last - first) // SPECTROGRAM_LEVEL_FACTOR ** (level + 1) >= columns):
+            level += 1
+        scale = SPECTROGRAM_LEVEL_FACTOR ** level
+        first, last = first // scale, -(-last // scale)
+        
+        first_tile = first // SPECTROGRAM_TILE_FRAMES
+        last_tile = (last - 1) // SPECTROGRAM_TILE_FRAMES
+        parts = [self.tile(level, index)[band] for index in range(first_tile, last_tile + 1)]
+        offset = first_tile * SPECTROGRAM_TILE_FRAMES
+        image = np.concatenate(parts, axis=1)[:, first - offset:last - offset].astype(np.float32)
+        
+        df = self.f[1] - self.f[0] if len(self.f) > 1 else 1.0
+        extent = (edge + first * scale * hop, edge + last * scale * hop,
+                  self.f[band][0] - df / 2, self.f[band][-1] + df / 2)
+        return image, extent
+
+class SpectrumCache(ByteBudgetCache):
+    """
+    Cache hasil spektrogram dan FFT yang dipakai bersama oleh semua plot
+    
+    Kunci cache adalah (sidik audio, sample_rate, nperseg, dtype) untuk
+    spektrogram, (sidik audio, sample_rate, 'fft', dtype) untuk FFT,
+    (sidik audio, sample_rate, 'waveform', dtype) untuk WaveformPyramid, dan
+    (sidik audio, sample_rate, nperseg, 'tiles', dtype) untuk
+    SpectrogramPyramid.
+    Nilai spektrogram/FFT berupa tuple yang berisi array read-only.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        super().__init__(max_bytes)
+    
+    def _sizeof(self, value):
+        if isinstance(value, tuple):
+            return sum(item.nbytes for item in value if isinstance(item, np.ndarray))
+        return value.nbytes
+    
+    def put(self, key, value):
+        if isinstance(value, tuple):
+            for item in value:
+                if isinstance(item, np.ndarray):
+                    item.flags.writeable = False
+        super().put(key, value)
+    
+    def _evicted(self, value):
+        # File .npz piramida yang dimuat dari disk tidak dibiarkan terbuka
+        if isinstance(value, SpectrogramPyramid):
+            value.close()
+
 class AudioVisualizer:
-    def __init__(self):
-        pass
+    def __init__(self, dtype=np.float32, cache=None, tile_dir=None):
+        # Tipe float kerja; sama dengan AudioProcessor agar audio tidak
+        # dikonversi ke float64 sebelum digambar
+        self.dtype = np.dtype(dtype)
+        
+        # Spektrogram/FFT yang sudah dihitung; mengganti colormap atau
+        # rentang frekuensi hanya memotong ulang data dari cache
+        self.cache = cache if cache is not None else SpectrumCache()
+        
+        # Direktori opsional untuk menyimpan piramida tile spektrogram di
+        # disk; None berarti tile hanya disimpan di cache memori
+        self.tile_dir = tile_dir
+        self._fingerprints = {}
+        self._held = {}
+    
+    def fingerprint(self, audio_data):
+        """
+        Sidik isi audio (SHA-1 dari sampelnya)
+        
+        Sidik diingat per objek audio selama objek itu masih ada, sehingga
+        plot berikutnya untuk audio yang sama tidak perlu membaca ulang
+        sampelnya. Audio dianggap tidak diubah di tempat setelah digambar.
+        """
+        entry = self._fingerprints.get(id(audio_data))
+        if entry is not None and entry[0]() is audio_data:
+            return entry[1]
+        
+        # LazyAudio: sampel mentah dari file, tanpa normalisasi
+        data = audio_data.raw if isinstance(audio_data, LazyAudio) else audio_data
+        data = np.ascontiguousarray(data)
+        digest = hashlib.sha1(data.view(np.uint8).ravel()).hexdigest()
+        fingerprint = (digest, data.dtype.str, len(data))
+        
+        try:
+            key = id(audio_data)
+            ref = weakref.ref(audio_data, lambda _, key=key: self._fingerprints.pop(key, None))
+            self._fingerprints[key] = (ref, fingerprint)
+        except TypeError:
+            pass  # Objek tanpa weakref (mis. list): sidik tidak diingat
+        return fingerprint
+    
+    def _key(self, audio_data, sample_rate, *parts):
+        """
+        Kunci cache: (sidik audio, sample_rate, *parts, dtype)
+        """
+        return (self.fingerprint(audio_data), sample_rate) + parts + (self.dtype.str,)
+    
+    def _lookup(self, key):
+        """
+        Data dari cache, atau dari data yang sedang ditahan holding()
+        """
+        value = self.cache.get(key)
+        if value is None:
+            value = self._held.get(key)
+        return value
+    
+    def prepare(self, plots, audio_data, sample_rate, resolution=1024):
+        """
+        Menghitung data plot (STFT, FFT, piramida) tanpa menggambar
+        
+        Aman dipanggil dari thread selain thread GUI. Hasilnya masuk ke
+        cache, sehingga plot_* berikutnya dengan audio dan resolusi yang sama
+        hanya menggambar.
+        
+        Args:
+            plots (iterable): Jenis plot dari PLOT_TYPES
+            resolution (int): nperseg untuk 'spectrogram' dan '3d'
+        
+        Returns:
+            dict: {kunci cache: data}; berikan ke holding() saat menggambar
+        """
+        prepared = {}
+        for plot in plots:
+            if plot not in PLOT_TYPES:
+                raise ValueError(f"Jenis plot tidak dikenal: {plot}")
+            if plot in ('waveform', 'combined'):
+                key = self._key(audio_data, sample_rate, 'waveform')
+                prepared[key] = self._waveform(audio_data, sample_rate)
+            if plot in ('spectrogram', 'combined'):
+                nperseg = resolution if plot == 'spectrogram' else COMBINED_RESOLUTION
+                key = self._key(audio_data, sample_rate, nperseg, 'tiles')
+                prepared[key] = self._spectrogram_tiles(audio_data, sample_rate, nperseg)
+            if plot == 'frequency':
+                key = self._key(audio_data, sample_rate, 'fft')
+                prepared[key] = self._spectrum(audio_data, sample_rate)
+            if plot == '3d':
+                key = self._key(audio_data, sample_rate, resolution)
+                prepared[key] = self._spectrogram(audio_data, sample_rate, resolution)
+        return prepared
+    
+    @contextlib.contextmanager
+    def holding(self, prepared):
+        """
+        Selama blok ini, data hasil prepare() tetap dipakai walaupun sudah
+        dibuang dari cache (mis. data audio panjang yang melebihi anggaran
+        cache), sehingga menggambar tidak menghitung ulang di thread GUI
+        """
+        previous = self._held
+        self._held = prepared
+        try:
+            yield
+        finally:
+            self._held = previous
+    
+    def _spectrogram(self, audio_data, sample_rate, nperseg):
+        """
+        Spektrogram dalam dB dari cache, dihitung jika belum ada
+        
+        Returns:
+            tuple: (f, t, Sxx_db, vmin, vmax); vmin/vmax adalah rentang dB
+            seluruh spektrogram, agar warna tidak berubah saat dipotong
+        """
+        key = self._key(audio_data, sample_rate, nperseg)
+        entry = self._lookup(key)
+        if entry is None:
+            f, t, Sxx = signal.spectrogram(self._prepare(audio_data), fs=sample_rate, nperseg=nperseg)
+            Sxx_db = 10 * np.log10(Sxx + 1e-10)
+            entry = (f, t, Sxx_db, float(Sxx_db.min()), float(Sxx_db.max()))
+            self.cache.put(key, entry)
+        return entry
+    
+    def _spectrum(self, audio_data, sample_rate):
+        """
+        Magnitude FFT ter-normalisasi dan 5 puncak dominan dari cache
+        
+        Returns:
+            tuple: (freqs, magnitude, peaks) dengan peaks berupa array
+            (frekuensi, magnitude) dari puncak terbesar ke terkecil
+        """
+        key = self._key(audio_data, sample_rate, 'fft')
+        entry = self._lookup(key)
+        if entry is None:
+            audio_data = self._prepare(audio_data)
+            n = len(audio_data)
+            fft_data = np.abs(np.fft.rfft(audio_data))
+            freqs = np.fft.rfftfreq(n, d=1/sample_rate)
+            
+            # Normalisasi
+            fft_data = fft_data / np.max(fft_data)
+            
+            # Cari 5 puncak terbesar; area sekitar puncak dihapus pada salinan
+            remaining = fft_data.copy()
+            peaks = []
+            for i in range(5):
+                if len(remaining) > 0:
+                    idx = np.argmax(remaining)
+                    peaks.append((freqs[idx], remaining[idx]))
+                    remaining[max(0, idx-5):min(len(remaining), idx+5)] = 0
+            
+            entry = (freqs, fft_data, np.array(peaks).reshape(-1, 2))
+            self.cache.put(key, entry)
+        return entry
+    
+    def _waveform(self, audio_data, sample_rate):
+        """
+        WaveformPyramid dari cache, dibangun jika belum ada
+        """
+        key = self._key(audio_data, sample_rate, 'waveform')
+        pyramid = self._lookup(key)
+        if pyramid is None:
+            pyramid = WaveformPyramid(audio_data, sample_rate, self.dtype)
+            self.cache.put(key, pyramid)
+        return pyramid
+    
+    def _plot_envelope(self, ax, audio_data, sample_rate, color):
+        """
+        Menggambar waveform dari piramida min/max
+        
+        Jumlah titik paling banyak sekitar 2x lebar axes dalam piksel. Saat
+        batas sumbu x berubah (zoom/geser), garis diganti dengan level yang
+        sesuai untuk rentang yang terlihat.
+        """
+        pyramid = self._waveform(audio_data, sample_rate)
+        
+        def max_points():
+            return 2 * max(int(ax.bbox.width), 1)
+        
+        times, values = pyramid.envelope(audio_data, 0, pyramid.length / sample_rate, max_points())
+        line, = ax.plot(times, values, color=color)
+        
+        # Batas data seperti saat semua sampel digambar
+        if pyramid.length:
+            ax.update_datalim([[0, 0], [(pyramid.length - 1) / sample_rate, 0]])
+            ax.autoscale_view(scaley=False)
+        
+        def redraw(ax):
+            start, end = ax.get_xlim()
+            line.set_data(*pyramid.envelope(audio_data, start, end, max_points()))
+        
+        ax.callbacks.connect('xlim_changed', redraw)
+        return line
+    
+    def _spectrogram_tiles(self, audio_data, sample_rate, nperseg):
+        """
+        SpectrogramPyramid dari cache, dari file tile, atau dibangun
+        
+        Jika tile_dir diberikan, piramida dimuat dari file tile_file() bila
+        file itu dibuat dengan parameter yang sama, dan disimpan ke sana
+        setelah dibangun.
+        """
+        fingerprint = self.fingerprint(audio_data)
+        key = self._key(audio_data, sample_rate, nperseg, 'tiles')
+        pyramid = self._lookup(key)
+        if pyramid is not None:
+            return pyramid
+        
+        tile_file = self.tile_file(fingerprint, nperseg)
+        if tile_file and os.path.exists(tile_file):
+            try:
+                pyramid = SpectrogramPyramid.load(tile_file)
+                if not pyramid.matches(fingerprint, sample_rate, nperseg, self.dtype):
+                    pyramid.close()
+                    pyramid = None
+            except Exception as e:
+                print(f"File tile spektrogram tidak dapat dibaca ({tile_file}): {e}")
+                pyramid = None
+        
+        if pyramid is None:
+            pyramid = SpectrogramPyramid.from_audio(audio_data, sample_rate, nperseg, self.dtype, fingerprint)
+            if tile_file:
+                try:
+                    os.makedirs(self.tile_dir, exist_ok=True)
+                    pyramid.save(tile_file)
+                except OSError as e:
+                    print(f"Gagal menyimpan tile spektrogram ({tile_file}): {e}")
+        
+        self.cache.put(key, pyramid)
+        return pyramid
+    
+    def tile_file(self, fingerprint, nperseg):
+        """
+        Path file tile untuk sidik audio dan nperseg, atau None jika
+        penyimpanan tile di disk tidak diaktifkan
+        
+        Nama file diambil dari sidik isi audio, sehingga file audio yang sama
+        di lokasi mana pun memakai tile yang sama.
+        """
+        if not self.tile_dir:
+            return None
+        return os.path.join(self.tile_dir, f"{fingerprint[0]}.spec{nperseg}.npz")
+    
+    def _plot_tiles(self, ax, pyramid, colormap, freq_range):
+        """
+        Menggambar spektrogram dari piramida tile dengan imshow
+        
+        Lebar gambar mengikuti lebar axes dalam piksel. Saat batas sumbu x
+        berubah (zoom/geser), gambar diganti dengan tile yang terlihat pada
+        level yang sesuai.
+        """
+        band = self._band(pyramid.f, freq_range)
+        
+        def columns():
+            return max(int(ax.bbox.width), 1)
+        
+        image, extent = pyramid.view(pyramid.start_time, pyramid.end_time, band, columns())
+        im = ax.imshow(image, origin='lower', aspect='auto', extent=extent, cmap=colormap,
+                       vmin=pyramid.vmin, vmax=pyramid.vmax, interpolation='bilinear')
+        # Sumbu x dari tengah frame pertama sampai terakhir (seperti
+        # pcolormesh); batasnya tidak ikut berubah saat extent diganti
+        if pyramid.end_time > pyramid.start_time:
+            ax.set_xlim(pyramid.start_time, pyramid.end_time)
+        else:
+            ax.set_xlim(extent[0], extent[1])
+        
+        def redraw(ax):
+            start, end = ax.get_xlim()
+            image, extent = pyramid.view(start, end, band, columns())
+            im.set_data(image)
+            im.set_extent(extent)
+        
+        ax.callbacks.connect('xlim_changed', redraw)
+        return im
+    
+    def _band(self, f, freq_range):
+        """
+        Potongan indeks frekuensi yang mencakup freq_range, ditambah satu bin
+        di setiap sisi agar tepi plot tetap terisi
+        
+        Urutan batas tidak berpengaruh; rentang di luar atau di antara bin
+        tetap menghasilkan paling sedikit satu bin terdekat.
+        """
+        low, high = sorted(freq_range)
+        start = max(int(np.searchsorted(f, low, side='right')) - 1, 0)
+        stop = min(int(np.searchsorted(f, high, side='left')) + 1, len(f) - 1)
+        return slice(start, stop + 1)
+    
+    def _prepare(self, audio_data):
+        """
+        Audio sebagai array dtype kerja (tanpa salinan jika sudah sesuai)
+        """
+        return np.asarray(audio_data, dtype=self.dtype)
     
     def plot_waveform(self, audio_data, sample_rate, figure):
         """
@@ -22,11 +691,8 @@ class AudioVisualizer:
         figure.clear()
         ax = figure.add_subplot(111)
         
-        # Buat array waktu
-        time = np.arange(0, len(audio_data)) / sample_rate
-        
-        # Plot waveform
-        ax.plot(time, audio_data, color='#3498db')
+        # Plot waveform (envelope min/max, bukan setiap sampel)
+        self._plot_envelope(ax, audio_data, sample_rate, '#3498db')
         ax.set_xlabel('Waktu (detik)')
         ax.set_ylabel('Amplitudo')
         ax.set_title('Bentuk Gelombang Audio')
@@ -46,14 +712,18 @@ class AudioVisualizer:
         """
         Menggambar spektrogram audio
         """
+        # Batas frekuensi terbalik (min > max) diperlakukan sebagai rentang yang sama
+        freq_range = tuple(sorted(freq_range))
+        
         figure.clear()
         ax = figure.add_subplot(111)
         
-        # Buat spektrogram
-        f, t, Sxx = signal.spectrogram(audio_data, fs=sample_rate, nperseg=resolution)
+        # Piramida tile spektrogram (dari cache/file); hanya tile dan pita
+        # frekuensi yang tampil yang digambar
+        pyramid = self._spectrogram_tiles(audio_data, sample_rate, resolution)
         
         # Plot spektrogram
-        pcm = ax.pcolormesh(t, f, 10 * np.log10(Sxx + 1e-10), shading='gouraud', cmap=colormap)
+        pcm = self._plot_tiles(ax, pyramid, colormap, freq_range)
         ax.set_ylabel('Frekuensi (Hz)')
         ax.set_xlabel('Waktu (detik)')
         ax.set_title('Spektrogram Audio')
@@ -79,19 +749,17 @@ class AudioVisualizer:
         """
         Menggambar analisis frekuensi (FFT)
         """
+        freq_range = tuple(sorted(freq_range))
+        
         figure.clear()
         ax = figure.add_subplot(111)
         
-        # Hitung FFT
-        n = len(audio_data)
-        fft_data = np.abs(np.fft.rfft(audio_data))
-        freqs = np.fft.rfftfreq(n, d=1/sample_rate)
-        
-        # Normalisasi
-        fft_data = fft_data / np.max(fft_data)
+        # Hitung FFT (dari cache); hanya rentang yang tampil digambar
+        freqs, fft_data, peaks = self._spectrum(audio_data, sample_rate)
+        band = self._band(freqs, freq_range)
         
         # Plot FFT
-        ax.plot(freqs, fft_data, color='#2ecc71')
+        ax.plot(freqs[band], fft_data[band], color='#2ecc71')
         ax.set_xlabel('Frekuensi (Hz)')
         ax.set_ylabel('Magnitude (normalisasi)')
         ax.set_title('Analisis Frekuensi')
@@ -100,14 +768,9 @@ class AudioVisualizer:
         # Batasi tampilan frekuensi
         ax.set_xlim(freq_range)
         
-        # Cari frekuensi dominan
-        dominant_freqs = []
-        for i in range(5):  # Cari 5 frekuensi dominan
-            if len(fft_data) > 0:
-                idx = np.argmax(fft_data)
-                if freqs[idx] >= freq_range[0] and freqs[idx] <= freq_range[1]:
-                    dominant_freqs.append((freqs[idx], fft_data[idx]))
-                fft_data[max(0, idx-5):min(len(fft_data), idx+5)] = 0  # Hapus area sekitar puncak
+        # Frekuensi dominan: 5 puncak terbesar yang berada di rentang tampilan
+        dominant_freqs = [(freq, mag) for freq, mag in peaks
+                          if freq >= freq_range[0] and freq <= freq_range[1]]
         
         # Tampilkan frekuensi dominan
         if dominant_freqs:
@@ -127,19 +790,18 @@ class AudioVisualizer:
         """
         Menggambar spektrogram 3D
         """
+        freq_range = tuple(sorted(freq_range))
+        
         figure.clear()
         ax = figure.add_subplot(111, projection='3d')
         
-        # Buat spektrogram
-        f, t, Sxx = signal.spectrogram(audio_data, fs=sample_rate, nperseg=resolution)
+        # Buat spektrogram (dari cache, sudah dalam dB)
+        f, t, Sxx_db, _, _ = self._spectrogram(audio_data, sample_rate, resolution)
         
         # Filter frekuensi
         freq_mask = (f >= freq_range[0]) & (f <= freq_range[1])
         f_filtered = f[freq_mask]
-        Sxx_filtered = Sxx[freq_mask, :]
-        
-        # Konversi ke dB
-        Sxx_db = 10 * np.log10(Sxx_filtered + 1e-10)
+        Sxx_db = Sxx_db[freq_mask, :]
         
         # Buat mesh grid untuk plot 3D
         T, F = np.meshgrid(t, f_filtered)
@@ -164,6 +826,8 @@ class AudioVisualizer:
         """
         Menggambar analisis gabungan (waveform dan spektrogram)
         """
+        freq_range = tuple(sorted(freq_range))
+        
         figure.clear()
         
         # Bagi plot menjadi 2 bagian
@@ -171,8 +835,7 @@ class AudioVisualizer:
         
         # Subplot untuk waveform
         ax1 = figure.add_subplot(gs[0])
-        time = np.arange(0, len(audio_data)) / sample_rate
-        ax1.plot(time, audio_data, color='#3498db')
+        self._plot_envelope(ax1, audio_data, sample_rate, '#3498db')
         ax1.set_ylabel('Amplitudo')
         ax1.set_title('Bentuk Gelombang Audio')
         ax1.grid(True, linestyle='--', alpha=0.7)
@@ -180,8 +843,8 @@ class AudioVisualizer:
         
         # Subplot untuk spektrogram
         ax2 = figure.add_subplot(gs[1])
-        f, t, Sxx = signal.spectrogram(audio_data, fs=sample_rate, nperseg=1024)
-        pcm = ax2.pcolormesh(t, f, 10 * np.log10(Sxx + 1e-10), shading='gouraud', cmap=colormap)
+        pyramid = self._spectrogram_tiles(audio_data, sample_rate, COMBINED_RESOLUTION)
+        pcm = self._plot_tiles(ax2, pyramid, colormap, freq_range)
         ax2.set_ylabel('Frekuensi (Hz)')
         ax2.set_xlabel('Waktu (detik)')
         ax2.set_ylim(freq_range)
@@ -190,8 +853,8 @@ class AudioVisualizer:
         figure.colorbar(pcm, ax=ax2, label='Intensitas (dB)')
         
         # Sinkronkan sumbu x
-        ax1.set_xlim(0, time[-1])
-        ax2.set_xlim(0, t[-1])
+        ax1.set_xlim(0, (len(audio_data) - 1) / sample_rate)
+        ax2.set_xlim(0, pyramid.end_time)
         
         # Tambahkan info
         duration = len(audio_data) / sample_rate